@@ -1,5 +1,6 @@
 from .sqlite_handler import SQLiteCacheHandler
 import hashlib
+import json
 import os
 import functools
 import configparser
@@ -37,26 +38,49 @@ class CacheManager:
             cls._instance = cls()
         return cls._instance
     
-    def generate_key(self, file_path: str, prefix: str = "fp_") -> str:
-        """Génère une clé unique basée sur les méta-données du fichier"""
+    def generate_key(self, file_path: str, prefix: str = "fp_", variant: str = "") -> str:
+        """Génère une clé unique basée sur les méta-données du fichier
+        
+        `variant` distingue les résultats calculés avec des paramètres différents
+        (ex: durée analysée par fpcalc) pour un même fichier.
+        """
         stats = os.stat(file_path)
-        unique_id = f"{file_path}-{stats.st_size}-{stats.st_mtime}"
+        unique_id = f"{os.path.abspath(file_path)}-{stats.st_size}-{stats.st_mtime_ns}"
+        if variant:
+            unique_id += f"-{variant}"
         return prefix + hashlib.sha256(unique_id.encode()).hexdigest()
     
-    def get_file_cache(self, file_path: str):
+    def get_file_cache(self, file_path: str, prefix: str = "fp_", variant: str = ""):
         """Récupère les données de cache pour un fichier"""
         if not self.enabled:
             return None
-        key = self.generate_key(file_path)
+        key = self.generate_key(file_path, prefix, variant)
         return self.handler.get(key)
     
-    def set_file_cache(self, file_path: str, fingerprint_data: dict):
+    def set_file_cache(self, file_path: str, fingerprint_data: dict, prefix: str = "fp_", variant: str = ""):
         """Stocke les données de fingerprint"""
         if not self.enabled:
             return
-        key = self.generate_key(file_path)
+        key = self.generate_key(file_path, prefix, variant)
         self.handler.set(key, fingerprint_data, expiration=3600 * 24 * 7)  # 1 semaine
     
+    def generate_query_key(self, endpoint: str, params: dict, prefix: str = "q_") -> str:
+        """Génère une clé unique pour une requête d'API (endpoint + paramètres)"""
+        payload = json.dumps([endpoint, params], sort_keys=True, default=str)
+        return prefix + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    
+    def get_query_cache(self, endpoint: str, params: dict):
+        """Récupère la réponse mise en cache pour une requête d'API"""
+        if not self.enabled:
+            return None
+        return self.handler.get(self.generate_query_key(endpoint, params))
+    
+    def set_query_cache(self, endpoint: str, params: dict, response, expiration: float):
+        """Stocke la réponse d'une requête d'API pour `expiration` secondes"""
+        if not self.enabled:
+            return
+        self.handler.set(self.generate_query_key(endpoint, params), response, expiration=expiration)
+    
     def caching(self, func):
         """Décorator pour ajouter du caching automatique à une fonction"""
         @functools.wraps(func)
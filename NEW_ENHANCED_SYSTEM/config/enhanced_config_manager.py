@@ -6,7 +6,7 @@ Gestionnaire de configuration moderne pour Enhanced Music Manager
 import configparser
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 class EnhancedConfigManager:
     """Gestionnaire de configuration moderne avec support JSON et INI"""
@@ -164,6 +164,14 @@ class EnhancedConfigManager:
         self.ini_config.set(section, key, str(value))
         self._save_ini_config()
     
+    def set_many(self, values: Dict[Tuple[str, str], Any]):
+        """Définit plusieurs valeurs INI ({(section, clé): valeur}) avec une seule écriture disque"""
+        for (section, key), value in values.items():
+            if not self.ini_config.has_section(section):
+                self.ini_config.add_section(section)
+            self.ini_config.set(section, key, str(value))
+        self._save_ini_config()
+    
     # Méthodes pour configuration JSON
     def get_json(self, *keys, fallback=None):
         """Récupère une valeur de configuration JSON"""
@@ -6,18 +6,32 @@ Compatible avec l'interface existante de MusicFolderManager avec toutes les fonc
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import contextlib
 import threading
 import time
 import os
 import json
-from typing import Dict, List, Any, Callable, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, List, Any, Callable, Optional, Tuple
 from pathlib import Path
 
-from core.unified_audio_processor import UnifiedAudioProcessor, AnalysisResult, AnalysisStatus, AnalysisMethod
-from utils.file_utils import is_audio_file
+from core.unified_audio_processor import UnifiedAudioProcessor, AnalysisResult, AnalysisStatus, AnalysisMethod, CONFIG_SAVE_ERRORS
+from utils.file_utils import list_audio_files
 from cache.cache_manager import CacheManager
 from backup.backup_handler import BackupHandler
 
+# Scan parallèle : un job par sous-dossier de premier niveau. Le parcours et
+# le filtrage des noms (CPU, Python pur) tournent dans des processus, hors du
+# GIL ; la détection des fichiers corrompus (I/O) dans des threads.
+# Résultats remontés par lots
+SCAN_PROCESSES = os.cpu_count() or 1
+SCAN_WORKERS = min(8, os.cpu_count() or 4)
+SCAN_BATCH_SIZE = 256
+# En dessous de ce nombre de sous-dossiers, le démarrage des processus (spawn
+# sous Windows/macOS) coûte plus que le parcours : les threads s'en chargent
+SCAN_PROCESS_MIN_SUBDIRS = 8
+
 class EnhancedUnifiedProcessorAdapter:
     """
     Adaptateur complet pour intégrer le processeur unifié avec l'interface existante
@@ -138,8 +152,15 @@ class EnhancedUnifiedProcessorAdapter:
                 self.logger.info(message)
     
     def _setup_processor_logging(self):
-        """Configure le logging du processeur pour rediriger vers l'interface"""
+        """Configure le logging du processeur pour rediriger vers l'interface
+        
+        Le processeur ne fait qu'empiler ses records dans une file ; un
+        QueueListener les formate et les envoie à l'interface depuis son
+        propre thread, hors de la boucle de traitement.
+        """
         import logging
+        import logging.handlers
+        import queue
         
         # Créer un handler personnalisé qui redirige vers l'interface
         class InterfaceLogHandler(logging.Handler):
@@ -170,12 +191,38 @@ class EnhancedUnifiedProcessorAdapter:
                 # Envoyer vers l'interface
                 self.adapter._log(message, level)
         
-        # Ajouter le handler au logger du processeur
+        # File interne au processus : le record est empilé tel quel, sans le
+        # formatage que QueueHandler.prepare ferait sur le thread émetteur
+        # (InterfaceLogHandler le formate côté listener)
+        class InProcessQueueHandler(logging.handlers.QueueHandler):
+            def prepare(self, record):
+                return record
+        
+        # Le handler d'interface est servi par un listener en arrière-plan
         handler = InterfaceLogHandler(self)
         handler.setLevel(logging.INFO)
-        self.processor.logger.addHandler(handler)
+        log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        
+        # Ajouter le handler de file au logger du processeur
+        self._log_queue_handler = InProcessQueueHandler(log_queue)
+        self.processor.logger.addHandler(self._log_queue_handler)
         self.processor.logger.setLevel(logging.INFO)
     
+    def close(self):
+        """Arrête le listener de logs après avoir transmis les records encore en file
+        
+        À appeler à la fermeture de l'interface ; sans effet au second appel.
+        """
+        if self._log_listener is None:
+            return
+        self.processor.logger.removeHandler(self._log_queue_handler)
+        self._log_listener.stop()  # Vide la file avant d'arrêter le thread
+        self._log_listener = None
+    
     def configure_api_key(self, api_key: str):
         """Configure la clé API AcoustID"""
         self.processor.configure_api_key(api_key)
@@ -187,17 +234,9 @@ class EnhancedUnifiedProcessorAdapter:
     
     def configure_thresholds(self, **kwargs):
         """Configure les seuils de confiance avec mapping correct"""
-        # Mapping pour la compatibilité avec l'interface
-        threshold_mapping = {
-            'acousticid_threshold': 'acousticid_min_confidence',
-            'spectral_threshold': 'spectral_similarity_threshold', 
-            'musicbrainz_threshold': 'musicbrainz_min_confidence'
-        }
-        
-        mapped_kwargs = {}
-        for key, value in kwargs.items():
-            mapped_key = threshold_mapping.get(key, key)
-            mapped_kwargs[mapped_key] = value
+        # Mapping partagé avec le processeur pour la compatibilité avec l'interface
+        threshold_mapping = UnifiedAudioProcessor._THRESHOLD_MAPPING
+        mapped_kwargs = {threshold_mapping.get(key, key): value for key, value in kwargs.items()}
         
         if mapped_kwargs:
             self.processor.configure_thresholds(**mapped_kwargs)
@@ -218,23 +257,31 @@ class EnhancedUnifiedProcessorAdapter:
         
         # Sauvegarder dans la config
         if self.config:
-            try:
+            with contextlib.suppress(*CONFIG_SAVE_ERRORS):
                 self.config.set('PROCESSING', 'skip_corrupted_files', str(self.skip_corrupted_files))
                 self.config.set('PROCESSING', 'enable_manual_selection', str(self.enable_manual_selection))
                 self.config.set('CACHE', 'enable_deep_cache', str(self.enable_deep_cache))
-            except Exception as e:
-                if self.logger:
-                    self.logger.debug(f"Erreur sauvegarde config: {e}")
     
-    def scan_directory(self, directory: str) -> List[str]:
+    def scan_directory(self, directory: str,
+                       on_batch: Optional[Callable[[List[Tuple[str, int]]], None]] = None) -> List[Tuple[str, int]]:
         """
         Scanne un répertoire pour trouver les fichiers audio avec détection de corruption
         
+        Les sous-dossiers de premier niveau sont parcourus en parallèle par
+        SCAN_PROCESSES processus, plus un job pour les fichiers à la racine ;
+        chaque sous-arbre est ensuite vérifié par SCAN_WORKERS threads. Avec
+        moins de SCAN_PROCESS_MIN_SUBDIRS sous-dossiers, ou si les processus
+        sont indisponibles, les threads font aussi le parcours.
+        
         Args:
             directory: Chemin du répertoire à scanner
+            on_batch: Appelé (depuis les threads de scan) avec chaque lot d'au
+                plus SCAN_BATCH_SIZE fichiers retenus, sous-arbre par sous-arbre
             
         Returns:
-            List[str]: Liste des fichiers audio trouvés (sans les corrompus si activé)
+            List[Tuple[str, int]]: (chemin, taille en octets) des fichiers audio
+            trouvés (sans les corrompus si activé) ; la taille vient du stat du
+            scan et n'a pas à être relue
         """
         audio_files = []
         corrupted_files = []
@@ -243,22 +290,56 @@ class EnhancedUnifiedProcessorAdapter:
         if self.status_callback:
             self.status_callback(f"🔍 Scan du répertoire: {directory}", "INFO")
         
+        def check_files(files):
+            """Écarte les fichiers corrompus d'un sous-arbre parcouru et renvoie les autres"""
+            found = []
+            for file_path, file_size in files:
+                # Vérifier si le fichier est corrompu
+                if self.skip_corrupted_files and self._is_file_corrupted(file_path, file_size):
+                    corrupted_files.append(file_path)
+                    if self.logger:
+                        self.logger.warning(f"Fichier corrompu ignoré: {Path(file_path).name}")
+                    self._log(f"⚠️ Fichier corrompu ignoré: {Path(file_path).name}", "WARNING")
+                else:
+                    found.append((file_path, file_size))
+                    # Log détaillé pour chaque fichier trouvé
+                    self._log(f"✅ Fichier détecté: {Path(file_path).name}", "SUCCESS")
+            if on_batch:
+                for start in range(0, len(found), SCAN_BATCH_SIZE):
+                    on_batch(found[start:start + SCAN_BATCH_SIZE])
+            return found
+        
+        def walk_and_check(root, recursive):
+            """Parcours dans le thread lui-même (repli sans processus)"""
+            return check_files(list_audio_files(root, recursive))
+        
         try:
-            # Utiliser os.walk comme dans l'ancienne interface (méthode éprouvée)
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if is_audio_file(file_path):
-                        # Vérifier si le fichier est corrompu
-                        if self.skip_corrupted_files and self._is_file_corrupted(file_path):
-                            corrupted_files.append(file_path)
-                            if self.logger:
-                                self.logger.warning(f"Fichier corrompu ignoré: {Path(file_path).name}")
-                            self._log(f"⚠️ Fichier corrompu ignoré: {Path(file_path).name}", "WARNING")
-                        else:
-                            audio_files.append(file_path)
-                            # Log détaillé pour chaque fichier trouvé
-                            self._log(f"✅ Fichier détecté: {Path(file_path).name}", "SUCCESS")
+            with os.scandir(directory) as entries:
+                subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+            roots = [(directory, False)] + [(subdir, True) for subdir in subdirs]
+            
+            checks = [None] * len(roots)
+            with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as checkers:
+                # Parcours os.scandir dans les processus (un stat par fichier audio,
+                # taille réutilisée) ; chaque sous-arbre terminé part en vérification
+                if len(subdirs) >= SCAN_PROCESS_MIN_SUBDIRS and SCAN_PROCESSES > 1:
+                    try:
+                        with ProcessPoolExecutor(max_workers=min(SCAN_PROCESSES, len(roots))) as walkers:
+                            walks = {walkers.submit(list_audio_files, root, recursive): index
+                                     for index, (root, recursive) in enumerate(roots)}
+                            for walk in as_completed(walks):
+                                checks[walks[walk]] = checkers.submit(check_files, walk.result())
+                    except (OSError, BrokenProcessPool) as e:
+                        if self.logger:
+                            self.logger.warning(f"Processus de scan indisponibles, parcours en threads: {e}")
+                
+                for index, (root, recursive) in enumerate(roots):
+                    if checks[index] is None:
+                        checks[index] = checkers.submit(walk_and_check, root, recursive)
+                
+                # Résultat final dans l'ordre des jobs (racine puis sous-dossiers)
+                for check in checks:
+                    audio_files.extend(check.result())
         
         except Exception as e:
             if self.logger:
@@ -275,24 +356,27 @@ class EnhancedUnifiedProcessorAdapter:
         
         return audio_files
     
-    def _is_file_corrupted(self, file_path: str) -> bool:
+    def _is_file_corrupted(self, file_path: str, file_size: Optional[int] = None) -> bool:
         """
         Vérifie si un fichier audio est corrompu
         
         Args:
             file_path: Chemin du fichier à vérifier
+            file_size: Taille déjà connue (stat du scan), relue sinon
             
         Returns:
             bool: True si le fichier est corrompu
         """
         try:
-            # Vérifications de base
-            if not os.path.exists(file_path):
-                if self.logger:
-                    self.logger.debug(f"Fichier inexistant: {file_path}")
-                return True
+            # Vérifications de base (un seul stat si la taille n'est pas fournie)
+            if file_size is None:
+                try:
+                    file_size = os.stat(file_path).st_size
+                except OSError:
+                    if self.logger:
+                        self.logger.debug(f"Fichier inexistant: {file_path}")
+                    return True
             
-            file_size = os.path.getsize(file_path)
             if file_size < 1024:  # Fichier trop petit (moins de 1KB)
                 if self.logger:
                     self.logger.debug(f"Fichier trop petit ({file_size} bytes): {Path(file_path).name}")
@@ -351,6 +435,19 @@ class EnhancedUnifiedProcessorAdapter:
         else:
             self.selected_files.discard(file_path)
     
+    def set_file_selections(self, file_paths: Iterable[str], selected: bool):
+        """
+        Définit l'état de sélection de plusieurs fichiers en un seul appel
+        
+        Args:
+            file_paths: Chemins des fichiers
+            selected: État de sélection
+        """
+        if selected:
+            self.selected_files.update(file_paths)
+        else:
+            self.selected_files.difference_update(file_paths)
+    
     def get_selected_files(self) -> List[str]:
         """Retourne la liste des fichiers sélectionnés"""
         return list(self.selected_files)
@@ -661,7 +758,7 @@ class EnhancedUnifiedProcessorAdapter:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Retourne les statistiques détaillées"""
-        base_stats = self.processor.get_statistics()
+        base_stats = self.processor.get_statistics().to_dict()
         
         # Ajouter les statistiques avancées
         base_stats.update({
@@ -700,15 +797,25 @@ class EnhancedUnifiedProcessorAdapter:
                 self.status_callback(f"❌ Erreur export: {e}")
     
     def _export_json(self, file_path: str):
-        """Exporte en JSON"""
-        export_data = {
-            'results': [result.to_dict() for result in self.current_results],
-            'statistics': self.get_statistics(),
-            'detailed_stats': self.detailed_stats
-        }
+        """Exporte en JSON
+        
+        Le document est écrit résultat par résultat (identique à un json.dump
+        avec indent=2), sans construire la liste de tous les dictionnaires.
+        """
+        def dumps(value, depth):
+            """Valeur JSON indentée pour sa profondeur dans le document"""
+            return json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n' + '  ' * depth)
         
+        results = self.current_results
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            f.write('{\n  "results": [')
+            for index, result in enumerate(results):
+                f.write(',\n    ' if index else '\n    ')
+                f.write(dumps(result.to_dict(), 2))
+            f.write('\n  ]' if results else ']')
+            f.write(',\n  "statistics": ' + dumps(self.get_statistics(), 1))
+            f.write(',\n  "detailed_stats": ' + dumps(self.detailed_stats, 1))
+            f.write('\n}')
     
     def _export_csv(self, file_path: str):
         """Exporte en CSV"""
@@ -7,10 +7,33 @@ import subprocess
 import tempfile
 from pathlib import Path
 
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Caractéristiques numériques comparées entre deux fichiers
+FEATURE_KEYS = ('energy', 'zero_crossings', 'spectral_centroid',
+                'spectral_rolloff', 'spectral_bandwidth', 'rms_energy',
+                'spectral_flux', 'sample_rate', 'duration', 'analysis_length',
+                'peak_frequency', 'low_energy', 'mid_energy', 'high_energy')
+
+# Recherche des références candidates dans l'index (HNSW si faiss est installé)
+ANN_CANDIDATES = 5
+HNSW_NEIGHBORS = 32
+
 class SpectralMatcher:
     def __init__(self, threshold=0.7):
         self.threshold = threshold
         
+        # Index des références : caractéristiques extraites une seule fois par
+        # référence au lieu d'être recalculées à chaque fichier inconnu ;
+        # reconstruit par build_index à chaque chargement de la base
+        self._index = None
+        self._index_ids = []
+        self._index_features = []
+        
     def _extract_features(self, file_path):
         """Extraction de caractéristiques audio avec support multi-format complet"""
         try:
@@ -239,6 +262,25 @@ class SpectralMatcher:
             print(f"Erreur extraction features fallback: {e}")
             return None
     
+    @staticmethod
+    def _feature_similarity(features1, features2):
+        """Similarité (0.0 - 1.0) entre deux jeux de caractéristiques"""
+        # Similarité basée sur les caractéristiques numériques
+        similarities = []
+        for key in FEATURE_KEYS:
+            if key in features1 and key in features2:
+                try:
+                    val1, val2 = float(features1[key]), float(features2[key])
+                    if val1 != 0 and val2 != 0:
+                        sim = 1 - abs(val1 - val2) / max(abs(val1), abs(val2))
+                        similarities.append(max(0, float(sim)))
+                except (ValueError, TypeError):
+                    # Ignorer les valeurs non numériques
+                    continue
+        
+        # Convertir en float pour éviter les erreurs numpy
+        return float(np.mean(similarities)) if similarities else 0.0
+    
     def compare(self, file1, file2):
         """Calcule la similarité spectrale entre 2 fichiers"""
         try:
@@ -248,41 +290,81 @@ class SpectralMatcher:
             if not features1 or not features2:
                 return 0.0
             
-            # Clés numériques pour la comparaison (exclure les chaînes)
-            numeric_keys = ['energy', 'zero_crossings', 'spectral_centroid', 
-                          'spectral_rolloff', 'spectral_bandwidth', 'rms_energy',
-                          'spectral_flux', 'sample_rate', 'duration', 'analysis_length',
-                          'peak_frequency', 'low_energy', 'mid_energy', 'high_energy']
-            
-            # Similarité basée sur les caractéristiques numériques
-            similarities = []
-            for key in numeric_keys:
-                if key in features1 and key in features2:
-                    try:
-                        val1, val2 = float(features1[key]), float(features2[key])
-                        if val1 != 0 and val2 != 0:
-                            sim = 1 - abs(val1 - val2) / max(abs(val1), abs(val2))
-                            similarities.append(max(0, float(sim)))
-                    except (ValueError, TypeError):
-                        # Ignorer les valeurs non numériques
-                        continue
-            
-            # Convertir en float pour éviter les erreurs numpy
-            result = float(np.mean(similarities)) if similarities else 0.0
-            return result
+            return self._feature_similarity(features1, features2)
             
         except Exception as e:
             print(f"Erreur comparaison spectrale: {e}")
             return 0.0
 
+    @staticmethod
+    def _feature_vector(features):
+        """Vecteur d'indexation : log des valeurs absolues, pour que la distance L2
+        reflète des écarts relatifs comme _feature_similarity"""
+        values = []
+        for key in FEATURE_KEYS:
+            try:
+                values.append(abs(float(features.get(key, 0.0))))
+            except (ValueError, TypeError):
+                values.append(0.0)
+        return np.log1p(np.asarray(values, dtype=np.float32))
+    
+    def build_index(self, reference_db):
+        """Extrait les caractéristiques de chaque référence et construit l'index de recherche
+        
+        Args:
+            reference_db: {chemin de référence: identifiant}
+        """
+        ids, features_list, vectors = [], [], []
+        for ref_path, ref_id in reference_db.items():
+            features = self._extract_features(ref_path)
+            if features:
+                ids.append(ref_id)
+                features_list.append(features)
+                vectors.append(self._feature_vector(features))
+        
+        matrix = np.vstack(vectors) if vectors else np.empty((0, len(FEATURE_KEYS)), dtype=np.float32)
+        if FAISS_AVAILABLE and vectors:
+            index = faiss.IndexHNSWFlat(matrix.shape[1], HNSW_NEIGHBORS)
+            index.add(matrix)
+        else:
+            index = matrix
+        
+        self._index = index
+        self._index_ids = ids
+        self._index_features = features_list
+    
+    def _nearest(self, vector, k):
+        """Indices des k références les plus proches du vecteur"""
+        if FAISS_AVAILABLE:
+            _, indices = self._index.search(vector[None, :], k)
+            return [i for i in indices[0] if i >= 0]
+        distances = np.square(self._index - vector).sum(axis=1)
+        return np.argsort(distances)[:k]
+
     def is_match(self, reference_db, unknown_file):
-        """Vérification contre une base de références"""
+        """Vérification contre une base de références
+        
+        Les ANN_CANDIDATES références les plus proches dans l'index sont
+        rescorées avec la similarité exacte ; la meilleure au-dessus du seuil
+        est retenue. L'index est celui du dernier build_index, à rappeler
+        quand la base change ; il n'est construit ici que s'il ne l'a jamais été.
+        """
         try:
-            for ref_path, ref_id in reference_db.items():
-                similarity = self.compare(ref_path, unknown_file)
-                if similarity > self.threshold:
-                    return ref_id, similarity
-            return None, 0
+            if self._index is None:
+                self.build_index(reference_db)
+            if not self._index_ids:
+                return None, 0
+            
+            features = self._extract_features(unknown_file)
+            if not features:
+                return None, 0
+            
+            best_id, best_similarity = None, 0
+            for i in self._nearest(self._feature_vector(features), ANN_CANDIDATES):
+                similarity = self._feature_similarity(self._index_features[i], features)
+                if similarity > self.threshold and similarity > best_similarity:
+                    best_id, best_similarity = self._index_ids[i], similarity
+            return best_id, best_similarity
         except Exception as e:
             print(f"Erreur matching: {e}")
             return None, 0
@@ -5,13 +5,17 @@ Combine AcoustID, MusicBrainz, Analyse Spectrale et Extraction de Métadonnées
 """
 
 import os
+import configparser
+import contextlib
 import logging
 import time
 import hashlib
+import threading
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 import json
 
 # Imports pour l'analyse audio
@@ -116,6 +120,44 @@ class AnalysisResult:
             manual_review_reason=data.get('manual_review_reason')
         )
 
+# Erreurs possibles lors d'une sauvegarde de configuration (ignorées)
+CONFIG_SAVE_ERRORS = (configparser.Error, OSError, AttributeError)
+
+# Compteurs de session à zéro (copiés à l'initialisation et à chaque remise à zéro)
+_DEFAULT_STATS = MappingProxyType({
+    'total_processed': 0,
+    'cache_hits': 0,
+    'acousticid_successes': 0,
+    'spectral_successes': 0,
+    'musicbrainz_successes': 0,
+    'success_total': 0,
+    'manual_reviews': 0,
+    'errors': 0,
+    'processing_time': 0.0
+})
+
+@dataclass(slots=True, frozen=True)
+class StatsSnapshot:
+    """Instantané des statistiques de session, réutilisé tant qu'elles ne changent pas"""
+    total_processed: int = 0
+    cache_hits: int = 0
+    cache_hit_rate: float = 0.0
+    acousticid_successes: int = 0
+    spectral_successes: int = 0
+    musicbrainz_successes: int = 0
+    manual_reviews: int = 0
+    errors: int = 0
+    total_processing_time: float = 0.0
+    average_processing_time: float = 0.0
+    success_rate: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Conversion en dictionnaire pour sérialisation"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+# Instantané renvoyé tant qu'aucun fichier n'a été traité
+_EMPTY_STATS_SNAPSHOT = StatsSnapshot()
+
 class UnifiedAudioProcessor:
     """
     Processeur Audio Unifié
@@ -127,6 +169,24 @@ class UnifiedAudioProcessor:
     - Extraction de métadonnées
     """
     
+    # Mapping des noms d'arguments vers les clés de configuration des seuils
+    _THRESHOLD_MAPPING = {
+        'acousticid_threshold': 'acousticid_min_confidence',
+        'spectral_threshold': 'spectral_similarity_threshold',
+        'musicbrainz_threshold': 'musicbrainz_min_confidence'
+    }
+    _THRESHOLD_KEYS = frozenset(_THRESHOLD_MAPPING.values())
+    
+    # Délai (s) avant écriture des réglages modifiés dans le fichier de configuration
+    CONFIG_FLUSH_DELAY = 0.5
+    
+    # Compteur de succès par méthode (comptabilisées dans le taux de succès)
+    _SUCCESS_COUNTERS = {
+        AnalysisMethod.ACOUSTICID: 'acousticid_successes',
+        AnalysisMethod.SPECTRAL: 'spectral_successes',
+        AnalysisMethod.MUSICBRAINZ: 'musicbrainz_successes'
+    }
+    
     def __init__(self, api_key: str = None, config_path: str = None):
         """
         Initialise le processeur unifié
@@ -155,16 +215,14 @@ class UnifiedAudioProcessor:
         }
         
         # Statistiques de session
-        self.stats = {
-            'total_processed': 0,
-            'cache_hits': 0,
-            'acousticid_successes': 0,
-            'spectral_successes': 0,
-            'musicbrainz_successes': 0,
-            'manual_reviews': 0,
-            'errors': 0,
-            'processing_time': 0.0
-        }
+        self.stats = dict(_DEFAULT_STATS)
+        self._stats_snapshot = None
+        self._stats_snapshot_key = None
+        
+        # Écritures de configuration différées, regroupées par _flush_config
+        self._pending_config = {}
+        self._config_lock = threading.Lock()
+        self._flush_timer = None
         
         # Initialiser les composants spécialisés
         self._init_components()
@@ -381,13 +439,11 @@ class UnifiedAudioProcessor:
                             best_confidence = method_result.confidence
                             best_metadata = method_result.metadata
                         
-                        # Stats par méthode
-                        if method == AnalysisMethod.ACOUSTICID:
-                            self.stats['acousticid_successes'] += 1
-                        elif method == AnalysisMethod.SPECTRAL:
-                            self.stats['spectral_successes'] += 1
-                        elif method == AnalysisMethod.MUSICBRAINZ:
-                            self.stats['musicbrainz_successes'] += 1
+                        # Stats par méthode (+ total tenu à jour pour le taux de succès)
+                        success_counter = self._SUCCESS_COUNTERS.get(method)
+                        if success_counter:
+                            self.stats[success_counter] += 1
+                            self.stats['success_total'] += 1
                         
                         self.logger.info(f"✅ {method.value} succès (confiance: {method_result.confidence:.2f})")
                         
@@ -759,7 +815,11 @@ class UnifiedAudioProcessor:
         except Exception as e:
             self.logger.debug(f"Audio properties extraction failed: {e}")
         
-        return {'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0}
+        # Un seul stat : un fichier absent lève OSError, inutile de tester exists() avant
+        try:
+            return {'file_size': os.stat(file_path).st_size}
+        except OSError:
+            return {'file_size': 0}
     
     def _extract_existing_metadata(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Extrait les métadonnées existantes du fichier avec mutagen"""
@@ -910,35 +970,45 @@ class UnifiedAudioProcessor:
         self.logger.info(f"✅ Batch terminé: {len(results)} fichiers traités")
         return results
     
-    def get_statistics(self) -> Dict[str, Any]:
-        """Retourne les statistiques de la session"""
-        total = self.stats['total_processed']
-        return {
-            'total_processed': total,
-            'cache_hits': self.stats['cache_hits'],
-            'cache_hit_rate': self.stats['cache_hits'] / total if total > 0 else 0,
-            'acousticid_successes': self.stats['acousticid_successes'],
-            'spectral_successes': self.stats['spectral_successes'],
-            'musicbrainz_successes': self.stats['musicbrainz_successes'],
-            'manual_reviews': self.stats['manual_reviews'],
-            'errors': self.stats['errors'],
-            'total_processing_time': self.stats['processing_time'],
-            'average_processing_time': self.stats['processing_time'] / total if total > 0 else 0,
-            'success_rate': (self.stats['acousticid_successes'] + self.stats['spectral_successes'] + self.stats['musicbrainz_successes']) / total if total > 0 else 0
-        }
+    def get_statistics(self) -> StatsSnapshot:
+        """Retourne les statistiques de la session
+        
+        L'instantané est mis en cache et n'est reconstruit que si un compteur
+        a changé depuis le dernier appel (interrogation fréquente par l'interface).
+        """
+        stats = self.stats
+        key = tuple(stats.values())
+        if key == self._stats_snapshot_key:
+            return self._stats_snapshot
+        
+        total = stats['total_processed']
+        if total == 0:
+            # Aucun fichier traité : tous les compteurs sont à zéro
+            return _EMPTY_STATS_SNAPSHOT
+        
+        processing_time = stats['processing_time']
+        inv = 1.0 / total
+        
+        snapshot = StatsSnapshot(
+            total_processed=total,
+            cache_hits=stats['cache_hits'],
+            cache_hit_rate=stats['cache_hits'] * inv,
+            acousticid_successes=stats['acousticid_successes'],
+            spectral_successes=stats['spectral_successes'],
+            musicbrainz_successes=stats['musicbrainz_successes'],
+            manual_reviews=stats['manual_reviews'],
+            errors=stats['errors'],
+            total_processing_time=processing_time,
+            average_processing_time=processing_time * inv,
+            success_rate=stats['success_total'] * inv
+        )
+        self._stats_snapshot = snapshot
+        self._stats_snapshot_key = key
+        return snapshot
     
     def reset_statistics(self):
         """Remet à zéro les statistiques"""
-        self.stats = {
-            'total_processed': 0,
-            'cache_hits': 0,
-            'acousticid_successes': 0,
-            'spectral_successes': 0,
-            'musicbrainz_successes': 0,
-            'manual_reviews': 0,
-            'errors': 0,
-            'processing_time': 0.0
-        }
+        self.stats = dict(_DEFAULT_STATS)
         self.logger.info("📊 Statistiques remises à zéro")
     
     def configure_thresholds(self, **kwargs):
@@ -950,35 +1020,48 @@ class UnifiedAudioProcessor:
             spectral_threshold: Seuil pour l'analyse spectrale (0.0-1.0)
             musicbrainz_threshold: Seuil pour MusicBrainz (0.0-1.0)
         """
-        # Mapping des noms d'arguments vers les clés de configuration
-        threshold_mapping = {
-            'acousticid_threshold': 'acousticid_min_confidence',
-            'spectral_threshold': 'spectral_similarity_threshold',
-            'musicbrainz_threshold': 'musicbrainz_min_confidence'
-        }
-        
         for key, value in kwargs.items():
-            config_key = threshold_mapping.get(key, key)
-            if config_key in self.thresholds:
+            config_key = self._THRESHOLD_MAPPING.get(key, key)
+            if config_key in self._THRESHOLD_KEYS:
                 self.thresholds[config_key] = float(value)
                 self.logger.info(f"🔧 Seuil {key} configuré à {value}")
                 
-                # Mettre à jour la configuration si possible
-                try:
-                    self.config.set('FINGERPRINT', config_key, str(value))
-                except Exception as e:
-                    self.logger.debug(f"Impossible de sauvegarder la config: {e}")
+                # Mettre à jour la configuration (écriture différée)
+                self._queue_config('FINGERPRINT', config_key, str(value))
 
     def configure_api_key(self, api_key: str):
         """Configure la clé API AcoustID"""
         self.api_key = api_key
         self.logger.info("🔑 Clé API AcoustID configurée")
         
-        # Mettre à jour la configuration si possible
-        try:
-            self.config.set('APIS', 'acoustid_api_key', api_key)
-        except Exception as e:
-            self.logger.debug(f"Impossible de sauvegarder la config: {e}")
+        # Mettre à jour la configuration (écriture différée)
+        self._queue_config('APIS', 'acoustid_api_key', api_key)
+    
+    def _queue_config(self, section: str, key: str, value: str):
+        """Met une valeur de configuration en attente et relance le délai d'écriture
+        
+        Les réglages successifs (ex: glissement d'un curseur) sont regroupés
+        en une seule écriture du fichier INI après CONFIG_FLUSH_DELAY secondes
+        sans nouvelle modification.
+        """
+        with self._config_lock:
+            self._pending_config[(section, key)] = value
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(self.CONFIG_FLUSH_DELAY, self._flush_config)
+            self._flush_timer.start()
+    
+    def _flush_config(self):
+        """Écrit en une fois les valeurs de configuration en attente"""
+        with self._config_lock:
+            pending, self._pending_config = self._pending_config, {}
+            self._flush_timer = None
+        if not pending:
+            return
+        
+        # Sauvegarde best-effort : un échec d'écriture ne doit pas interrompre l'analyse
+        with contextlib.suppress(*CONFIG_SAVE_ERRORS):
+            self.config.set_many(pending)
     
     def clear_cache(self):
         """Vide le cache d'analyse"""
@@ -989,38 +1072,64 @@ class UnifiedAudioProcessor:
             self.logger.error(f"Erreur lors du vidage du cache: {e}")
 
 
+# Processeur partagé par analyze_audio_file (créé au premier appel)
+_default_processor = None
+_default_lock = threading.Lock()
+
+
+def _get_default_processor(api_key: str = None) -> UnifiedAudioProcessor:
+    """Retourne le processeur partagé, recréé seulement si la clé API change"""
+    global _default_processor
+    processor = _default_processor
+    if processor is None or (api_key and processor.api_key != api_key):
+        with _default_lock:
+            processor = _default_processor
+            if processor is None or (api_key and processor.api_key != api_key):
+                processor = UnifiedAudioProcessor(api_key=api_key)
+                _default_processor = processor
+    return processor
+
+
 # Fonction de convenance pour utilisation simple
-def analyze_audio_file(file_path: str, api_key: str = None) -> AnalysisResult:
+def analyze_audio_file(file_path: str, api_key: str = None,
+                       processor: UnifiedAudioProcessor = None) -> AnalysisResult:
     """
     Fonction de convenance pour analyser un seul fichier
     
     Args:
         file_path: Chemin vers le fichier audio
         api_key: Clé API AcoustID (optionnelle)
+        processor: Processeur à utiliser (None = processeur partagé du module)
         
     Returns:
         AnalysisResult: Résultat de l'analyse
     """
-    processor = UnifiedAudioProcessor(api_key=api_key)
+    if processor is None:
+        processor = _get_default_processor(api_key)
     return processor.process_file(file_path)
 
 
 if __name__ == "__main__":
     # Test simple
-    import sys
+    import argparse
     
-    if len(sys.argv) > 1:
-        test_file = sys.argv[1]
-        print(f"🎵 Test du processeur unifié sur: {test_file}")
-        
-        processor = UnifiedAudioProcessor()
-        result = processor.process_file(test_file)
-        
-        print(f"📊 Résultat: {result.status.value}")
-        print(f"🎯 Méthode: {result.method_used.value if result.method_used else 'Aucune'}")
-        print(f"📈 Confiance: {result.confidence:.2f}")
-        print(f"⏱️ Temps: {result.processing_time:.2f}s")
-        
+    parser = argparse.ArgumentParser(description="Test du processeur unifié sur un fichier audio")
+    parser.add_argument('file', help="Fichier audio à analyser")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="Afficher métadonnées, erreurs et statistiques complètes")
+    args = parser.parse_args()
+    
+    print(f"🎵 Test du processeur unifié sur: {args.file}")
+    
+    processor = UnifiedAudioProcessor()
+    result = processor.process_file(args.file)
+    
+    print(f"📊 Résultat: {result.status.value}")
+    print(f"🎯 Méthode: {result.method_used.value if result.method_used else 'Aucune'}")
+    print(f"📈 Confiance: {result.confidence:.2f}")
+    print(f"⏱️ Temps: {result.processing_time:.2f}s")
+    
+    if args.verbose:
         if result.metadata:
             print("🎵 Métadonnées trouvées:")
             for key, value in result.metadata.items():
@@ -1034,5 +1143,3 @@ if __name__ == "__main__":
         # Statistiques
         stats = processor.get_statistics()
         print(f"\n📊 Statistiques: {stats}")
-    else:
-        print("Usage: python unified_audio_processor.py <fichier_audio>")
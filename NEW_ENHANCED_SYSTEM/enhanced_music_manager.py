@@ -4,45 +4,43 @@
 Système de gestion musicale moderne avec analyse AcoustID, spectrale et MusicBrainz
 """
 
+import importlib
 import sys
-import os
-from pathlib import Path
 
-# Ajouter le dossier du nouveau système au path
-sys.path.insert(0, str(Path(__file__).parent))
+# Lancé en script, le dossier de ce fichier est déjà sys.path[0] : les
+# paquets gui/, core/, config/... s'importent directement sans modifier le path.
+
+# Interfaces candidates, essayées dans l'ordre : (module, classe, libellé)
+GUI_CANDIDATES = (
+    ("gui.gui", "CompleteMusicManagerGUI", "interface complète"),
+    ("gui.complete_music_gui_simple", "CompleteMusicManagerGUI", "interface simple"),
+)
 
 def main():
     """Point d'entrée principal"""
-    try:
-        # Import de l'interface complète depuis gui.py
-        from gui.gui import CompleteMusicManagerGUI
-        
-        print("🎵 Lancement de Enhanced Music Manager...")
-        print("📁 Système enhanced avec interface complète")
-        print("🎵 Initialisation de l'interface Enhanced Music Manager...")
-        print("🚀 Démarrage de l'interface complète...")
-        
-        # Créer et lancer l'interface
-        app = CompleteMusicManagerGUI()
-        app.run()
-        
-    except Exception as e:
-        print(f"❌ Erreur interface complète: {e}")
-        print("⚠️ Tentative avec interface de fallback...")
+    last_error = None
+    
+    for module_name, class_name, label in GUI_CANDIDATES:
+        if last_error is not None:
+            print("⚠️ Tentative avec interface de fallback...")
         
         try:
-            from gui.complete_music_gui_simple import CompleteMusicManagerGUI
+            gui_class = getattr(importlib.import_module(module_name), class_name)
+            
             print("🎵 Lancement de Enhanced Music Manager...")
-            print("📁 Système enhanced avec interface simple")
+            print(f"📁 Système enhanced avec {label}")
             
             # Créer et lancer l'interface
-            app = CompleteMusicManagerGUI()
+            app = gui_class()
             app.run()
+            return
             
-        except Exception as e2:
-            print(f"❌ Erreur fallback: {e2}")
-            print("💡 Vérifiez que tous les modules sont correctement installés")
-            sys.exit(1)
+        except Exception as e:
+            print(f"❌ Erreur {label}: {e}")
+            last_error = e
+    
+    print("💡 Vérifiez que tous les modules sont correctement installés")
+    sys.exit(1)
 
 if __name__ == "__main__":
     main()
@@ -5,7 +5,15 @@ Respecte les principes de la POO pour une architecture maintenable
 
 from .error_manager import ErrorManager, ErrorType, MessageLevel, get_error_manager
 from .error_codes import ErrorCodes
-from .exceptions import *
+from .exceptions import (
+    AudioProcessingError,
+    ConfigurationError,
+    FileAccessError,
+    MetadataError,
+    NetworkError,
+    OrganizationError,
+    MusicFolderManagerError
+)
 
 __all__ = [
     'ErrorManager',
@@ -5,6 +5,9 @@ Exceptions personnalisées pour MusicFolderManager
 Hiérarchie d'exceptions spécialisées selon les domaines fonctionnels
 """
 
+import sys
+from functools import cached_property
+
 class MusicFolderManagerError(Exception):
     """Exception de base pour toutes les erreurs du MusicFolderManager
     
@@ -12,6 +15,9 @@ class MusicFolderManagerError(Exception):
     Permet l'encapsulation des détails d'erreur et facilite l'héritage.
     """
     
+    # Attributs de la sous-classe recopiés dans `details` à la demande
+    _DETAIL_FIELDS = ()
+    
     def __init__(self, message: str, error_code: str = None, details: dict = None):
         """
         Args:
@@ -21,8 +27,17 @@ class MusicFolderManagerError(Exception):
         """
         super().__init__(message)
         self.message = message
-        self.error_code = error_code or "GENERAL_ERROR"
-        self.details = details or {}
+        # Codes internés : les comparaisons entre codes se font par identité
+        self.error_code = sys.intern(error_code) if error_code else "GENERAL_ERROR"
+        self._details = details
+    
+    @cached_property
+    def details(self) -> dict:
+        """Détails de débogage, construits au premier accès seulement"""
+        details = dict(self._details) if self._details else {}
+        for name in self._DETAIL_FIELDS:
+            details[name] = getattr(self, name)
+        return details
     
     def __str__(self):
         return f"[{self.error_code}] {self.message}"
@@ -47,25 +62,25 @@ class AudioProcessingError(MusicFolderManagerError):
     Encapsule les détails techniques du traitement audio.
     """
     
+    _DETAIL_FIELDS = ('file_path', 'fpcalc_status')
+    
+    # Code de sortie fpcalc -> message utilisateur
+    _STATUS_TEMPLATES = {
+        1: "Format audio non supporté ou invalide: {p}",
+        2: "Fichier audio corrompu ou endommagé: {p}",
+    }
+    
     def __init__(self, message: str, file_path: str = None, fpcalc_status: int = None, **kwargs):
         super().__init__(message, **kwargs)
         self.file_path = file_path
         self.fpcalc_status = fpcalc_status
-        
-        # Enrichir les détails avec les informations audio
-        self.details.update({
-            'file_path': file_path,
-            'fpcalc_status': fpcalc_status
-        })
     
     def get_user_message(self) -> str:
         """Message adapté pour les erreurs audio"""
-        if self.fpcalc_status == 1:
-            return f"Format audio non supporté ou invalide: {self.file_path}"
-        elif self.fpcalc_status == 2:
-            return f"Fichier audio corrompu ou endommagé: {self.file_path}"
-        else:
-            return f"Erreur de traitement audio: {self.message}"
+        template = self._STATUS_TEMPLATES.get(self.fpcalc_status)
+        if template:
+            return template.format(p=self.file_path)
+        return f"Erreur de traitement audio: {self.message}"
 
 
 class ConfigurationError(MusicFolderManagerError):
@@ -74,15 +89,12 @@ class ConfigurationError(MusicFolderManagerError):
     Gère les erreurs liées à la configuration, sections manquantes, etc.
     """
     
+    _DETAIL_FIELDS = ('config_section', 'config_key')
+    
     def __init__(self, message: str, config_section: str = None, config_key: str = None, **kwargs):
         super().__init__(message, **kwargs)
         self.config_section = config_section
         self.config_key = config_key
-        
-        self.details.update({
-            'config_section': config_section,
-            'config_key': config_key
-        })
     
     def get_user_message(self) -> str:
         """Message adapté pour les erreurs de configuration"""
@@ -97,15 +109,12 @@ class FileAccessError(MusicFolderManagerError):
     Encapsule les problèmes d'accès, permissions, fichiers manquants, etc.
     """
     
+    _DETAIL_FIELDS = ('file_path', 'permission_issue')
+    
     def __init__(self, message: str, file_path: str = None, permission_issue: bool = False, **kwargs):
         super().__init__(message, **kwargs)
         self.file_path = file_path
         self.permission_issue = permission_issue
-        
-        self.details.update({
-            'file_path': file_path,
-            'permission_issue': permission_issue
-        })
     
     def get_user_message(self) -> str:
         """Message adapté pour les erreurs de fichiers"""
@@ -122,15 +131,12 @@ class MetadataError(MusicFolderManagerError):
     Gère les problèmes liés aux métadonnées audio, API externes, etc.
     """
     
+    _DETAIL_FIELDS = ('metadata_source', 'confidence')
+    
     def __init__(self, message: str, metadata_source: str = None, confidence: float = None, **kwargs):
         super().__init__(message, **kwargs)
         self.metadata_source = metadata_source
         self.confidence = confidence
-        
-        self.details.update({
-            'metadata_source': metadata_source,
-            'confidence': confidence
-        })
     
     def get_user_message(self) -> str:
         """Message adapté pour les erreurs de métadonnées"""
@@ -147,22 +153,24 @@ class NetworkError(MusicFolderManagerError):
     Gère les timeouts, erreurs d'API, problèmes de connectivité
     """
     
+    _DETAIL_FIELDS = ('api_endpoint', 'status_code')
+    
+    # Code HTTP -> message utilisateur
+    _STATUS_MESSAGES = {
+        429: "Limite de requêtes API atteinte. Veuillez patienter avant de réessayer.",
+        401: "Clé API invalide ou expirée. Vérifiez votre configuration.",
+    }
+    
     def __init__(self, message: str, api_endpoint: str = None, status_code: int = None, **kwargs):
         super().__init__(message, **kwargs)
         self.api_endpoint = api_endpoint
         self.status_code = status_code
-        
-        self.details.update({
-            'api_endpoint': api_endpoint,
-            'status_code': status_code
-        })
     
     def get_user_message(self) -> str:
         """Message adapté pour les erreurs réseau"""
-        if self.status_code == 429:
-            return "Limite de requêtes API atteinte. Veuillez patienter avant de réessayer."
-        elif self.status_code == 401:
-            return "Clé API invalide ou expirée. Vérifiez votre configuration."
+        message = self._STATUS_MESSAGES.get(self.status_code)
+        if message:
+            return message
         return f"Erreur de connexion: {self.message}"
 
 
@@ -172,15 +180,12 @@ class OrganizationError(MusicFolderManagerError):
     Gère les problèmes de déplacement, copie, création de dossiers
     """
     
+    _DETAIL_FIELDS = ('source_path', 'destination_path')
+    
     def __init__(self, message: str, source_path: str = None, destination_path: str = None, **kwargs):
         super().__init__(message, **kwargs)
         self.source_path = source_path
         self.destination_path = destination_path
-        
-        self.details.update({
-            'source_path': source_path,
-            'destination_path': destination_path
-        })
     
     def get_user_message(self) -> str:
         """Message adapté pour les erreurs d'organisation"""
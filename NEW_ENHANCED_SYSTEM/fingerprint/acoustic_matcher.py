@@ -4,15 +4,106 @@ Module pour la génération et comparaison de fingerprints acoustiques
 Utilise fpcalc pour générer les fingerprints AcoustID
 """
 
+import base64
+import binascii
 import subprocess
 import os
 import logging
-import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+from cache.cache_manager import CacheManager
+
+# Paramètres d'invocation de fpcalc
+# Secondes d'audio décodées par fichier : le début du morceau suffit à
+# l'identification AcoustID, et le temps de décodage croît avec cette durée
+FPCALC_LENGTH = 60
+FPCALC_TIMEOUT = 30       # secondes par fichier
+FPCALC_BATCH_SIZE = 16    # fichiers par invocation en mode lot
+
+# Préfixe des empreintes du matcher dans CacheManager (distinct de "fp_",
+# utilisé par CacheManager.caching avec un autre format de données)
+CACHE_PREFIX = "afp_"
+
+# En dessous de ce rapport de longueurs, deux fingerprints (donc deux durées)
+# sont jugés trop différents pour être comparés
+MIN_FINGERPRINT_LENGTH_RATIO = 0.8
+
+# Recherche par alignement glissant sur les empreintes brutes (fpcalc -raw) :
+# décalage maximal testé, en sous-empreintes (~0,124 s chacune), et
+# recouvrement minimal pour qu'un taux d'erreur binaire soit significatif
+MAX_ALIGNMENT_SHIFT = 20
+MIN_ALIGNMENT_OVERLAP = 32
+
+# Popcount vectorisé : np.bitwise_count (NumPy >= 2.0), sinon table 16 bits
+if hasattr(np, 'bitwise_count'):
+    _popcount = np.bitwise_count
+else:
+    _POPCOUNT16 = np.unpackbits(np.arange(1 << 16, dtype='>u2').view(np.uint8)).reshape(-1, 16).sum(axis=1).astype(np.uint8)
+    
+    def _popcount(values):
+        return _POPCOUNT16[values & 0xFFFF] + _POPCOUNT16[values >> 16]
+
+
+def sliding_bit_error_rates(query, references, lengths, max_shift=MAX_ALIGNMENT_SHIFT):
+    """Taux d'erreur binaire (BER) minimal de la requête contre chaque référence
+    
+    Pour chaque décalage s de -max_shift à +max_shift, la sous-empreinte i de
+    la requête est comparée à la sous-empreinte i + s de chaque référence :
+    XOR puis popcount sur toute la base à la fois.
+    
+    Args:
+        query: Empreinte brute, np.uint32[L]
+        references: Empreintes de référence complétées par des zéros, np.uint32[N, Lmax]
+        lengths: Longueur réelle de chaque référence, np.int64[N]
+        max_shift: Décalage maximal testé (en sous-empreintes)
+    
+    Returns:
+        tuple: (BER minimal par référence (inf si recouvrement insuffisant),
+                décalage correspondant)
+    """
+    n_refs, max_len = references.shape
+    best_ber = np.full(n_refs, np.inf)
+    best_shift = np.zeros(n_refs, dtype=np.int64)
+    rows = np.arange(n_refs)
+    
+    for shift in range(-max_shift, max_shift + 1):
+        q_start = max(0, -shift)
+        r_start = max(0, shift)
+        n = min(len(query) - q_start, max_len - r_start)
+        if n < MIN_ALIGNMENT_OVERLAP:
+            continue
+        
+        # Erreurs cumulées le long de l'alignement : le recouvrement propre à
+        # chaque référence (longueurs différentes) se lit en un seul indexage
+        diff = _popcount(references[:, r_start:r_start + n] ^ query[q_start:q_start + n])
+        errors = np.cumsum(diff, axis=1, dtype=np.int64)
+        overlap = np.clip(lengths - r_start, 0, n)
+        valid = overlap >= MIN_ALIGNMENT_OVERLAP
+        
+        ber = np.full(n_refs, np.inf)
+        ber[valid] = errors[rows[valid], overlap[valid] - 1] / (32.0 * overlap[valid])
+        
+        improved = ber < best_ber
+        best_ber[improved] = ber[improved]
+        best_shift[improved] = shift
+    
+    return best_ber, best_shift
+
+
+# Octets ASCII hors de l'alphabet Base64 (padding compris), supprimés via bytes.translate ;
+# fpcalc produit du base64 URL ('-' et '_'), conservé tel quel
+_BASE64_ALPHABET = frozenset((string.ascii_letters + string.digits + '+/-_=').encode('ascii'))
+_NON_BASE64_BYTES = bytes(b for b in range(256) if b not in _BASE64_ALPHABET)
+
 class AcousticMatcher:
-    def __init__(self, fpcalc_path=None):
+    def __init__(self, fpcalc_path=None, fpcalc_length=FPCALC_LENGTH):
         self.logger = logging.getLogger(__name__)
+        # Empreintes déjà calculées, indexées par (chemin, mtime, taille, durée analysée)
+        self.cache = CacheManager.get_instance()
         
         # Trouver fpcalc
         if fpcalc_path:
@@ -25,84 +116,145 @@ class AcousticMatcher:
         if not os.path.exists(self.fpcalc_path):
             self.logger.warning(f"fpcalc non trouvé à {self.fpcalc_path}")
             self.fpcalc_path = None
+        
+        self.fpcalc_length = fpcalc_length
+        
+        # Index des empreintes brutes de référence (voir build_reference_index)
+        self._reference_ids = []
+        self._reference_matrix = np.zeros((0, 0), dtype=np.uint32)
+        self._reference_lengths = np.zeros(0, dtype=np.int64)
     
     def clean_fingerprint(self, fingerprint):
         """Nettoie un fingerprint pour AcoustID avec correction du padding Base64"""
         if not fingerprint:
             return fingerprint
         
-        # Supprimer les espaces et retours à la ligne
-        cleaned = fingerprint.strip()
-        
-        # Supprimer les caractères invisibles (garder seulement ASCII imprimables)
-        cleaned = re.sub(r'[^\x20-\x7E]', '', cleaned)
-        
-        # Garder seulement les caractères Base64 valides
-        base64_pattern = r'[A-Za-z0-9+/=]'
-        cleaned = ''.join(re.findall(base64_pattern, cleaned))
+        # Garder seulement les caractères Base64 valides : l'encodage ASCII écarte
+        # les caractères non ASCII, translate supprime espaces, retours à la ligne
+        # et caractères invisibles en une seule passe C
+        cleaned = fingerprint.encode('ascii', 'ignore').translate(None, _NON_BASE64_BYTES)
         
         # CORRECTION CRITIQUE: Fixer le padding Base64
         # Supprimer tout padding existant
-        cleaned = cleaned.rstrip('=')
+        cleaned = cleaned.rstrip(b'=').decode('ascii')
         
         # Ajouter le bon padding Base64
-        padding_needed = (4 - len(cleaned) % 4) % 4
+        padding_needed = (-len(cleaned)) & 3  # équivaut à (4 - len % 4) % 4
         cleaned += '=' * padding_needed
         
-        # Vérifier que le Base64 est maintenant valide
-        try:
-            import base64
-            base64.b64decode(cleaned)
-            self.logger.debug(f"✅ Fingerprint Base64 valide après correction")
-        except Exception as e:
-            self.logger.warning(f"⚠️ Fingerprint toujours invalide après correction: {e}")
+        # Vérifier que le Base64 est maintenant valide (diagnostic seulement,
+        # décodage complet évité hors mode debug)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            try:
+                binascii.a2b_base64(cleaned)
+                self.logger.debug(f"✅ Fingerprint Base64 valide après correction")
+            except binascii.Error as e:
+                self.logger.warning(f"⚠️ Fingerprint toujours invalide après correction: {e}")
         
         if len(cleaned) != len(fingerprint):
             self.logger.warning(f"Fingerprint nettoyé: {len(fingerprint)} -> {len(cleaned)} caractères")
         
         return cleaned
     
+    def _fpcalc_command(self, file_paths):
+        """Construit la ligne de commande fpcalc pour un ou plusieurs fichiers"""
+        return [str(self.fpcalc_path), "-length", str(self.fpcalc_length), *map(str, file_paths)]
+    
+    def _parse_fpcalc_output(self, lines):
+        """Parse la sortie texte de fpcalc
+        
+        fpcalc émet un bloc FILE=/DURATION=/FINGERPRINT= par fichier analysé.
+        
+        Returns:
+            list: Paires (chemin ou None si pas de ligne FILE=, fingerprint_data)
+        """
+        blocks = []
+        current_file = None
+        fingerprint_data = {}
+        
+        # L'original n'est conservé qu'en mode debug (évite de garder deux copies
+        # de chaque empreinte en mémoire lors des gros scans)
+        keep_raw = self.logger.isEnabledFor(logging.DEBUG)
+        
+        for line in lines:
+            line = line.strip()  # Nettoyer les espaces et retours à la ligne
+            if '=' not in line:
+                continue
+            key, value = line.split('=', 1)
+            key = key.strip()
+            value = value.strip()
+            if key == 'FILE':
+                if fingerprint_data:
+                    blocks.append((current_file, fingerprint_data))
+                current_file = value
+                fingerprint_data = {}
+            elif key == 'DURATION':
+                fingerprint_data['duration'] = float(value)
+            elif key == 'FINGERPRINT':
+                # Nettoyer le fingerprint avant de le stocker
+                raw_fingerprint = value
+                cleaned_fingerprint = self.clean_fingerprint(raw_fingerprint)
+                fingerprint_data['fingerprint'] = cleaned_fingerprint
+                if keep_raw:
+                    fingerprint_data['raw_fingerprint'] = raw_fingerprint  # Garder l'original pour debug
+        
+        if fingerprint_data:
+            blocks.append((current_file, fingerprint_data))
+        return blocks
+    
+    def _cache_variant(self):
+        """Paramètres fpcalc dont dépend l'empreinte, inclus dans la clé de cache"""
+        return f"length={self.fpcalc_length}"
+    
+    def _get_cached_fingerprint(self, file_path):
+        """Retourne le fingerprint en cache si le fichier n'a pas changé depuis"""
+        try:
+            return self.cache.get_file_cache(file_path, prefix=CACHE_PREFIX, variant=self._cache_variant())
+        except OSError:
+            return None
+    
+    def _cache_fingerprint(self, file_path, fingerprint_data):
+        """Met en cache la durée et le fingerprint nettoyé d'un fichier"""
+        try:
+            self.cache.set_file_cache(file_path, {
+                'duration': fingerprint_data.get('duration'),
+                'fingerprint': fingerprint_data['fingerprint']
+            }, prefix=CACHE_PREFIX, variant=self._cache_variant())
+        except OSError:
+            pass
+    
     def generate_fingerprint(self, file_path):
         """Génère un fingerprint acoustique pour un fichier audio"""
+        # Un fichier inchangé (même mtime et taille) n'est pas repassé à fpcalc
+        if cached := self._get_cached_fingerprint(file_path):
+            self.logger.debug(f"Fingerprint en cache pour {file_path}")
+            return cached
+        
         if not self.fpcalc_path:
             self.logger.error("fpcalc non disponible")
             return None
         
         try:
             # Commande fpcalc
-            cmd = [str(self.fpcalc_path), "-length", "120", file_path]
+            cmd = self._fpcalc_command([file_path])
             
             self.logger.debug(f"Exécution de fpcalc: {' '.join(cmd)}")
             
+            # stdout et stderr lus ensemble (communicate) : pas de blocage si
+            # fpcalc remplit le tube d'erreur ; processus tué au timeout
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=30
+                timeout=FPCALC_TIMEOUT
             )
             
             if result.returncode != 0:
                 self.logger.error(f"Erreur fpcalc: {result.stderr}")
                 return None
             
-            # Parser la sortie
-            lines = result.stdout.strip().split('\n')
-            fingerprint_data = {}
-            
-            for line in lines:
-                line = line.strip()  # Nettoyer les espaces et retours à la ligne
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if key == 'DURATION':
-                        fingerprint_data['duration'] = float(value)
-                    elif key == 'FINGERPRINT':
-                        # Nettoyer le fingerprint avant de le stocker
-                        raw_fingerprint = value
-                        cleaned_fingerprint = self.clean_fingerprint(raw_fingerprint)
-                        fingerprint_data['fingerprint'] = cleaned_fingerprint
-                        fingerprint_data['raw_fingerprint'] = raw_fingerprint  # Garder l'original pour debug
+            blocks = self._parse_fpcalc_output(result.stdout.splitlines())
+            fingerprint_data = blocks[0][1] if blocks else {}
             
             if 'fingerprint' not in fingerprint_data:
                 self.logger.error("Pas de fingerprint dans la sortie fpcalc")
@@ -112,6 +264,7 @@ class AcousticMatcher:
             if 'raw_fingerprint' in fingerprint_data:
                 self.logger.debug(f"Fingerprint brut: {len(fingerprint_data['raw_fingerprint'])} caractères")
             
+            self._cache_fingerprint(file_path, fingerprint_data)
             return fingerprint_data
             
         except subprocess.TimeoutExpired:
@@ -121,17 +274,174 @@ class AcousticMatcher:
             self.logger.error(f"Erreur lors de la génération du fingerprint: {e}")
             return None
     
+    def _generate_fingerprint_chunk(self, file_paths):
+        """Génère les fingerprints d'un groupe de fichiers avec un seul processus fpcalc"""
+        results = dict.fromkeys(file_paths)
+        cmd = self._fpcalc_command(file_paths)
+        
+        try:
+            # fpcalc poursuit après un fichier illisible (erreur sur stderr) :
+            # le code de retour ne concerne pas tout le lot, on parse donc stdout
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=FPCALC_TIMEOUT * len(file_paths)
+            )
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"Timeout fpcalc sur un lot de {len(file_paths)} fichiers")
+            return results
+        except OSError as e:
+            self.logger.error(f"Erreur lors de l'exécution de fpcalc: {e}")
+            return results
+        
+        if result.returncode != 0 and result.stderr:
+            self.logger.warning(f"Erreurs fpcalc sur le lot: {result.stderr.strip()}")
+        
+        by_name = {str(path): path for path in file_paths}
+        if len(file_paths) == 1:
+            # fpcalc n'émet de ligne FILE= qu'avec plusieurs fichiers : le bloc
+            # unique (nom None) est celui de file_paths[0]
+            by_name[None] = file_paths[0]
+        for file_name, fingerprint_data in self._parse_fpcalc_output(result.stdout.splitlines()):
+            path = by_name.get(file_name)
+            if path is not None and 'fingerprint' in fingerprint_data:
+                results[path] = fingerprint_data
+                self._cache_fingerprint(path, fingerprint_data)
+        return results
+    
+    def generate_fingerprints_batch(self, file_paths, workers=None, chunk_size=FPCALC_BATCH_SIZE):
+        """Génère les fingerprints de plusieurs fichiers
+        
+        Les fichiers sont regroupés par lots passés à une seule invocation de
+        fpcalc (un démarrage de processus par lot au lieu d'un par fichier), et
+        les lots sont répartis sur un pool de threads.
+        
+        Args:
+            file_paths: Chemins des fichiers audio
+            workers: Nombre de processus fpcalc simultanés (défaut: nombre de CPU)
+            chunk_size: Nombre de fichiers par invocation de fpcalc
+            
+        Returns:
+            dict: {chemin: fingerprint_data ou None en cas d'échec}
+        """
+        file_paths = list(file_paths)
+        
+        # Seuls les fichiers absents du cache (ou modifiés) passent par fpcalc
+        results = {}
+        pending = []
+        for path in file_paths:
+            if cached := self._get_cached_fingerprint(path):
+                results[path] = cached
+            else:
+                pending.append(path)
+        
+        if pending and not self.fpcalc_path:
+            self.logger.error("fpcalc non disponible")
+            results.update(dict.fromkeys(pending))
+            return results
+        
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            for chunk_results in executor.map(self._generate_fingerprint_chunk, chunks):
+                results.update(chunk_results)
+        
+        found = sum(1 for data in results.values() if data)
+        self.logger.debug(f"Fingerprints générés en lot: {found}/{len(file_paths)} "
+                          f"({len(file_paths) - len(pending)} depuis le cache)")
+        return {path: results[path] for path in file_paths}
+    
+    @staticmethod
+    def _decode_fingerprint(fingerprint):
+        """Décode un fingerprint Base64 (standard ou URL-safe, padding optionnel) en octets"""
+        data = fingerprint.encode('ascii') if isinstance(fingerprint, str) else fingerprint
+        data = data.rstrip(b'=')
+        data += b'=' * (-len(data) % 4)
+        return np.frombuffer(base64.b64decode(data, altchars=b'-_'), dtype=np.uint8)
+    
     def compare_fingerprints(self, fp1, fp2):
-        """Compare deux fingerprints (implémentation basique)"""
+        """Compare deux fingerprints par distance de Hamming sur les octets décodés
+        
+        Retourne la proportion de bits identiques sur la partie commune,
+        rapportée à la longueur du plus long fingerprint. Des fingerprints de
+        longueurs trop éloignées sont rejetés sans décodage (score 0.0).
+        """
         if not fp1 or not fp2:
             return 0.0
         
-        # Comparaison simple (à améliorer)
         if fp1 == fp2:
             return 1.0
         
-        # Calcul de similitude basique
-        common_chars = sum(1 for a, b in zip(fp1, fp2) if a == b)
-        max_len = max(len(fp1), len(fp2))
+        n1, n2 = len(fp1), len(fp2)
+        if min(n1, n2) < MIN_FINGERPRINT_LENGTH_RATIO * max(n1, n2):
+            return 0.0
+        
+        try:
+            a = self._decode_fingerprint(fp1)
+            b = self._decode_fingerprint(fp2)
+        except (binascii.Error, ValueError, UnicodeEncodeError) as e:
+            self.logger.debug(f"Fingerprint non décodable: {e}")
+            return 0.0
+        
+        n = min(len(a), len(b))
+        max_len = max(len(a), len(b))
+        if max_len == 0:
+            return 0.0
         
-        return common_chars / max_len if max_len > 0 else 0.0
\ No newline at end of file
+        # Bits différents sur la partie commune (XOR + popcount vectorisés)
+        hamming = int(np.unpackbits(np.bitwise_xor(a[:n], b[:n])).sum())
+        return (8 * n - hamming) / (8 * max_len)
+    
+    def generate_raw_fingerprint(self, file_path):
+        """Empreinte brute d'un fichier (fpcalc -raw) : np.uint32[L] ou None"""
+        if not self.fpcalc_path:
+            return None
+        
+        cmd = [str(self.fpcalc_path), "-raw", "-length", str(self.fpcalc_length), str(file_path)]
+        try:
+            output = subprocess.run(cmd, capture_output=True, text=True, timeout=FPCALC_TIMEOUT)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            self.logger.warning(f"fpcalc -raw échoué pour {file_path}: {e}")
+            return None
+        
+        for line in output.stdout.splitlines():
+            key, sep, value = line.partition('=')
+            if sep and key == 'FINGERPRINT' and value:
+                return np.array(value.split(','), dtype=np.int64).astype(np.uint32)
+        return None
+    
+    def build_reference_index(self, references):
+        """Construit l'index des empreintes brutes de référence
+        
+        Args:
+            references: dict {identifiant: empreinte brute (séquence d'entiers 32 bits)}
+        """
+        fingerprints = [np.asarray(fp, dtype=np.int64).astype(np.uint32) for fp in references.values()]
+        lengths = np.array([len(fp) for fp in fingerprints], dtype=np.int64)
+        
+        matrix = np.zeros((len(fingerprints), int(lengths.max(initial=0))), dtype=np.uint32)
+        for row, fp in zip(matrix, fingerprints):
+            row[:len(fp)] = fp
+        
+        self._reference_ids = list(references)
+        self._reference_matrix = matrix
+        self._reference_lengths = lengths
+        self.logger.debug(f"Index d'empreintes brutes: {len(fingerprints)} références")
+    
+    def find_best_match(self, raw_fingerprint, max_shift=MAX_ALIGNMENT_SHIFT):
+        """Référence la plus proche d'une empreinte brute par alignement glissant
+        
+        Returns:
+            tuple: (identifiant, similarité = 1 - BER, décalage) ou None
+        """
+        if raw_fingerprint is None or not self._reference_ids:
+            return None
+        
+        query = np.asarray(raw_fingerprint, dtype=np.int64).astype(np.uint32)
+        ber, shifts = sliding_bit_error_rates(
+            query, self._reference_matrix, self._reference_lengths, max_shift
+        )
+        best = int(np.argmin(ber))
+        if not np.isfinite(ber[best]):
+            return None
+        return self._reference_ids[best], 1.0 - float(ber[best]), int(shifts[best])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Client HTTP AcoustID à session partagée
+pyacoustid ouvre une session requests (donc une connexion TCP + TLS) à chaque
+appel ; ici une seule session, partagée par tous les threads, garde les
+connexions ouvertes d'une requête à l'autre.
+"""
+
+import gzip
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from acoustid import WebServiceError
+
+from utils.rate_limiter import RateLimiter
+
+LOOKUP_URL = 'https://api.acoustid.org/v2/lookup'
+REQUEST_TIMEOUT = 10    # secondes
+
+# Pool de connexions : au moins autant que de threads de résolution en parallèle
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+
+# Politique AcoustID : au plus trois requêtes par seconde (comme pyacoustid)
+ACOUSTID_MIN_INTERVAL = 1.0 / 3
+
+_acoustid_rate_limiter = RateLimiter(ACOUSTID_MIN_INTERVAL)
+
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE))
+_session.headers.update({'Accept-Encoding': 'gzip'})
+
+
+def lookup(apikey, fingerprint, duration, meta='recordings', timeout=REQUEST_TIMEOUT):
+    """Équivalent de acoustid.lookup sur la session partagée
+
+    Le corps (dominé par l'empreinte) est compressé en gzip, comme le fait
+    pyacoustid.
+
+    Returns:
+        dict: Réponse JSON de l'API (champ 'status' à vérifier par l'appelant)
+
+    Raises:
+        WebServiceError: Échec de la requête ou réponse non JSON
+    """
+    if isinstance(fingerprint, bytes):
+        fingerprint = fingerprint.decode('ascii')
+    if not isinstance(meta, str):
+        meta = ' '.join(meta)
+
+    body = gzip.compress(urlencode({
+        'format': 'json',
+        'client': apikey,
+        'duration': int(duration),
+        'fingerprint': fingerprint,
+        'meta': meta,
+    }).encode('ascii'))
+
+    _acoustid_rate_limiter.wait()
+    try:
+        response = _session.post(
+            LOOKUP_URL,
+            data=body,
+            headers={
+                'Content-Encoding': 'gzip',
+                'Content-Type': 'application/x-www-form-urlencoded',
+            },
+            timeout=timeout,
+        )
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        raise WebServiceError(f"Requête HTTP échouée: {e}")
+    except ValueError:
+        raise WebServiceError("Réponse AcoustID non JSON")
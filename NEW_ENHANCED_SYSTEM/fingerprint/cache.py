@@ -1,6 +1,28 @@
 import sqlite3
 import os
 import hashlib
+import base64
+import binascii
+
+# Version du schéma (PRAGMA user_version) : 1 = empreintes stockées en BLOB brut
+SCHEMA_VERSION = 1
+
+
+def pack_fingerprint(fingerprint):
+    """Empreinte Chromaprint (base64 URL sans padding, str ou bytes) → octets bruts
+
+    Le base64 ajoute un tiers à la taille : la colonne stocke l'empreinte
+    compressée telle que produite par Chromaprint.
+    """
+    if isinstance(fingerprint, str):
+        fingerprint = fingerprint.encode('ascii')
+    return base64.b64decode(fingerprint + b'=' * (-len(fingerprint) & 3), altchars=b'-_', validate=True)
+
+
+def unpack_fingerprint(blob):
+    """Octets bruts → empreinte base64 URL sans padding (bytes, comme pyacoustid)"""
+    return base64.urlsafe_b64encode(blob).rstrip(b'=')
+
 
 class AcoustIDCache:
     def __init__(self, db_path='acoustid_cache.db'):
@@ -17,14 +39,33 @@ class AcoustIDCache:
                 timestamp REAL,
                 track_id TEXT
             )''')
+            if conn.execute('PRAGMA user_version').fetchone()[0] < SCHEMA_VERSION:
+                self._migrate_fingerprints(conn)
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _migrate_fingerprints(self, conn):
+        """Convertit les empreintes base64 des anciennes bases en BLOB brut"""
+        rows = conn.execute('SELECT file_hash, fingerprint FROM fingerprints').fetchall()
+        for file_hash, fingerprint in rows:
+            try:
+                packed = pack_fingerprint(fingerprint)
+            except (binascii.Error, ValueError, TypeError):
+                # Entrée illisible : elle sera régénérée
+                conn.execute('DELETE FROM fingerprints WHERE file_hash = ?', (file_hash,))
+                continue
+            conn.execute(
+                'UPDATE fingerprints SET fingerprint = ? WHERE file_hash = ?',
+                (packed, file_hash)
+            )
     
     def generate_file_hash(self, file_path):
-        """Hash du fichier pour identifiant unique"""
-        # Vérifier que le fichier existe avant d'accéder à sa date de modification
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Fichier non trouvé: {file_path}")
+        """Hash du fichier pour identifiant unique (chemin absolu, mtime en ns, taille)
         
-        return hashlib.sha256(file_path.encode() + str(os.path.getmtime(file_path)).encode()).hexdigest()
+        Un seul os.stat ; lève FileNotFoundError si le fichier n'existe pas.
+        """
+        stats = os.stat(file_path)
+        key = f"{os.path.abspath(file_path)}|{stats.st_mtime_ns}|{stats.st_size}"
+        return hashlib.sha256(key.encode()).hexdigest()
 
     def get(self, file_path):
         file_hash = self.generate_file_hash(file_path)
@@ -33,9 +74,13 @@ class AcoustIDCache:
                 'SELECT audio_length, fingerprint, track_id FROM fingerprints WHERE file_hash = ?',
                 (file_hash,)
             )
-            return cursor.fetchone()
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        audio_length, fingerprint, track_id = row
+        return audio_length, unpack_fingerprint(fingerprint), track_id
 
-    def set(self, file_path, audio_length, fingerprint, track_id):
+    def set(self, file_path, audio_length, fingerprint, track_id=None):
         file_hash = self.generate_file_hash(file_path)
         timestamp = os.path.getmtime(file_path)
         with sqlite3.connect(self.db_path) as conn:
@@ -43,5 +88,5 @@ class AcoustIDCache:
                 '''INSERT OR REPLACE INTO fingerprints 
                 (file_hash, audio_length, fingerprint, timestamp, track_id) 
                 VALUES (?, ?, ?, ?, ?)''',
-                (file_hash, audio_length, fingerprint, timestamp, track_id)
+                (file_hash, audio_length, pack_fingerprint(fingerprint), timestamp, track_id)
             )
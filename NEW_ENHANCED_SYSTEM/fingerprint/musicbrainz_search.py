@@ -4,14 +4,123 @@ Module de recherche textuelle MusicBrainz
 Fallback intelligent quand AcoustID échoue
 """
 
+import functools
+import logging
 import musicbrainzngs
 import re
 import os
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+
+from cache.cache_manager import CacheManager
+from utils.rate_limiter import RateLimiter
+
+try:
+    from rapidfuzz import fuzz
+    from rapidfuzz.process import cdist
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Durée de validité des réponses MusicBrainz en cache (secondes)
+LOOKUP_CACHE_TTL = 3600 * 24 * 30   # recherche par ID : 30 jours
+SEARCH_CACHE_TTL = 3600 * 24 * 7    # recherche textuelle : 7 jours
+
+# Politique MusicBrainz : au plus une requête par seconde et par IP
+MB_MIN_INTERVAL = 1.0
+MB_MAX_RETRIES = 3      # tentatives sur erreur réseau / 503 (backoff exponentiel)
+CATNO_FETCH_WORKERS = 5 # requêtes get_release_by_id simultanées (recherche par catalogue)
+ALBUM_CACHE_SIZE = 1024 # tracklists d'albums gardées en mémoire (search_by_metadata)
+
+
+_mb_rate_limiter = RateLimiter(MB_MIN_INTERVAL)
+
+
+def _rate_limited(func):
+    """Décorateur appliquant le limiteur MusicBrainz global à un appel d'API"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _mb_rate_limiter.wait()
+        return func(*args, **kwargs)
+    return wrapper
+
+
+# Ponctuation ignorée lors des comparaisons de chaînes
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(text):
+    """Forme normalisée d'une chaîne pour comparaison : (mots, chaîne sans ponctuation)
+    
+    Mise en cache : les mêmes titres/artistes MusicBrainz sont comparés à
+    chaque candidat et à chaque stratégie de recherche.
+    """
+    normalized = _PUNCT_RE.sub('', text.lower()).strip()
+    return frozenset(normalized.split()), normalized
+
+
+def _fold(text):
+    """Clé d'album insensible à la casse et aux accents ("Beyoncé " → "beyonce")"""
+    return unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode('ascii').lower().strip()
+
+
+# Nettoyage des noms de fichiers et du texte de recherche
+_PAREN_RE = re.compile(r'\(.*?\)')
+_BRACKET_RE = re.compile(r'\[.*?\]')
+_SPECIAL_RE = re.compile(r'[_\[\](){}]')
+_WS_RE = re.compile(r'\s+')
+
+# Patterns d'extraction artiste/titre depuis le nom de fichier (ordre d'importance)
+_FILENAME_PATTERNS = (
+    # "02. Artiste - Titre"
+    re.compile(r'^\d+\.?\s*(.+?)\s*-\s*(.+)$'),
+    # "Artiste - Titre"
+    re.compile(r'^(.+?)\s*-\s*(.+)$'),
+    # "Artiste_Titre"
+    re.compile(r'^(.+?)_(.+)$'),
+)
+
 class MusicBrainzSearcher:
+    # Stratégies de recherche progressive de search_by_metadata, de la plus
+    # précise à la plus large : (condition, type, paramètres, description, repli).
+    # Le planning est fixe ; seules les valeurs des champs changent d'un appel à l'autre.
+    _SEARCH_STRATEGIES = (
+        # 1. Recherche avec catalog number (très précise) - requête spéciale
+        (lambda f: bool(f['catalognumber']), 'catno',
+         lambda f: (f['catalognumber'], f['artist'], f['title']),
+         lambda f: f"avec numéro de catalogue: {f['catalognumber']}",
+         False),
+        # 2. Titre cherché dans la tracklist de l'album, récupérée une seule fois
+        # par (artiste, album) pour toutes les pistes du même album
+        (lambda f: bool(f['album'] and f['title'] and (f['albumartist'] or f['artist'])), 'album',
+         lambda f: (f['albumartist'] or f['artist'], f['album'], f['artist'], f['title']),
+         lambda f: f"tracklist de l'album: {f['albumartist'] or f['artist']} [{f['album']}]",
+         False),
+        # 3. Recherche avec album artist + album + titre (très précise)
+        (lambda f: bool(f['albumartist'] and f['album']), None,
+         lambda f: {'artist': f['albumartist'], 'title': f['title'], 'album': f['album']},
+         lambda f: f"albumartist + album: {f['albumartist']} - {f['title']} [{f['album']}]",
+         False),
+        # 4. Recherche avec track artist + album + titre (précise)
+        (lambda f: bool(f['album']), None,
+         lambda f: {'artist': f['artist'], 'title': f['title'], 'album': f['album']},
+         lambda f: f"artist + album: {f['artist']} - {f['title']} [{f['album']}]",
+         False),
+        # 5. Recherche track artist + titre seulement (moins précise) ; inutile
+        # si une stratégie précédente a déjà une correspondance correcte
+        (lambda f: True, None,
+         lambda f: {'artist': f['artist'], 'title': f['title']},
+         lambda f: f"artist + titre: {f['artist']} - {f['title']}",
+         True),
+    )
+    
     def __init__(self, logger=None):
-        self.logger = logger
+        self.logger = logger or logging.getLogger(__name__)
         
         # Configuration de l'API MusicBrainz
         musicbrainzngs.set_useragent(
@@ -19,9 +128,49 @@ class MusicBrainzSearcher:
             "1.0", 
             "https://github.com/user/musicfoldermanager"
         )
+        musicbrainzngs.set_rate_limit(limit_or_interval=MB_MIN_INTERVAL, new_requests=1)
         
         # Limite de résultats pour éviter la surcharge
         self.max_results = 5
+        
+        # Cache persistant des réponses de l'API
+        self.cache = CacheManager.get_instance()
+        
+        # Tracklists d'albums en mémoire, par (artiste, album) normalisés. Le
+        # verrou évite que les pistes d'un même album, résolues en parallèle,
+        # lancent chacune la même requête (l'API est de toute façon limitée à
+        # une requête par seconde).
+        self._album_tracklist = functools.lru_cache(maxsize=ALBUM_CACHE_SIZE)(self._fetch_album_tracklist)
+        self._album_lock = threading.Lock()
+    
+    def _cached_call(self, endpoint, ttl, **params):
+        """Appelle musicbrainzngs.<endpoint>(**params) en passant par le cache SQLite
+        
+        Les requêtes identiques (même endpoint, mêmes paramètres) sont servies
+        depuis le cache pendant `ttl` secondes au lieu d'interroger l'API.
+        """
+        cached = self.cache.get_query_cache(endpoint, params)
+        if cached is not None:
+            self.logger.debug(f"💾 Réponse MusicBrainz en cache: {endpoint}")
+            return cached
+        
+        api_call = _rate_limited(getattr(musicbrainzngs, endpoint))
+        for attempt in range(MB_MAX_RETRIES):
+            try:
+                response = api_call(**params)
+                break
+            except (musicbrainzngs.NetworkError, musicbrainzngs.ResponseError) as e:
+                # Seules les erreurs réseau et le 503 (surcharge) justifient un retry
+                if isinstance(e, musicbrainzngs.ResponseError) and getattr(e.cause, 'code', None) != 503:
+                    raise
+                if attempt == MB_MAX_RETRIES - 1:
+                    raise
+                wait_time = 2 ** attempt
+                self.logger.info(f"⏳ MusicBrainz indisponible, retry dans {wait_time}s...")
+                time.sleep(wait_time)
+        
+        self.cache.set_query_cache(endpoint, params, response, expiration=ttl)
+        return response
     
     def search_by_filename(self, file_path):
         """Recherche basée sur le nom de fichier"""
@@ -41,12 +190,37 @@ class MusicBrainzSearcher:
                 album=extracted.get('album')
             )
             
-        except Exception as e:
+        except (musicbrainzngs.MusicBrainzError, TypeError) as e:
             self.logger.warning(f"Erreur recherche MusicBrainz: {e}")
             return None
     
+    def search_by_id(self, musicbrainz_trackid):
+        """Recherche directe d'un recording par son MusicBrainz ID (réponse mise en cache)"""
+        self.logger.info(f"🆔 Recherche directe MusicBrainz ID: {musicbrainz_trackid}")
+        try:
+            result = self._cached_call(
+                'get_recording_by_id', LOOKUP_CACHE_TTL,
+                id=musicbrainz_trackid,
+                includes=['artists', 'releases', 'artist-credits']
+            )
+        except musicbrainzngs.MusicBrainzError:
+            return None
+        
+        if result and 'recording' in result:
+            # Transformer en format de recherche
+            return {
+                'best_match': {
+                    'recording': result['recording'],
+                    'confidence': 1.0,  # Confiance maximale pour un ID exact
+                    'source': 'musicbrainz_id'
+                }
+            }
+        return None
+    
     def search_by_metadata(self, metadata):
         """Recherche enrichie basée sur des métadonnées existantes"""
+        if not metadata:
+            return None
         try:
             artist = metadata.get('artist', '')
             title = metadata.get('title', '')
@@ -57,78 +231,59 @@ class MusicBrainzSearcher:
             
             # Si on a un MusicBrainz ID, recherche directe
             if musicbrainz_trackid:
-                self.logger.info(f"🆔 Recherche directe MusicBrainz ID: {musicbrainz_trackid}")
-                try:
-                    result = musicbrainzngs.get_recording_by_id(
-                        musicbrainz_trackid,
-                        includes=['artists', 'releases', 'artist-credits']
-                    )
-                    if result and 'recording' in result:
-                        # Transformer en format de recherche
-                        return {
-                            'best_match': {
-                                'recording': result['recording'],
-                                'confidence': 1.0  # Confiance maximale pour un ID exact
-                            }
-                        }
-                except:
-                    self.logger.info("ID MusicBrainz invalide ou introuvable, recherche par métadonnées")
+                result = self.search_by_id(musicbrainz_trackid)
+                if result:
+                    return result
+                self.logger.info("ID MusicBrainz invalide ou introuvable, recherche par métadonnées")
             
             if not artist and not title:
                 return None
             
-            # Stratégie de recherche progressive
-            search_strategies = [
-                # 1. Recherche avec catalog number (très précise) - on l'intègre dans une requête spéciale
-                {
-                    'params': {'artist': artist, 'title': title, 'album': album} if not catalognumber else None,
-                    'desc': f"avec numéro de catalogue: {catalognumber}",
-                    'condition': bool(catalognumber),
-                    'special': 'catno'  # Marqueur spécial
-                },
-                # 2. Recherche avec album artist + album + titre (très précise)
-                {
-                    'params': {'artist': albumartist, 'title': title, 'album': album},
-                    'desc': f"albumartist + album: {albumartist} - {title} [{album}]",
-                    'condition': bool(albumartist and album)
-                },
-                # 3. Recherche avec track artist + album + titre (précise)
-                {
-                    'params': {'artist': artist, 'title': title, 'album': album},
-                    'desc': f"artist + album: {artist} - {title} [{album}]",
-                    'condition': bool(album)
-                },
-                # 4. Recherche track artist + titre seulement (moins précise)
-                {
-                    'params': {'artist': artist, 'title': title},
-                    'desc': f"artist + titre: {artist} - {title}",
-                    'condition': True
-                }
-            ]
-            
-            # Essayer chaque stratégie
-            for strategy in search_strategies:
-                if not strategy['condition']:
+            # Essayer chaque stratégie, sans répéter une requête identique
+            # (ex: albumartist == artist rend les stratégies 2 et 3 équivalentes)
+            fields = {
+                'artist': artist, 'title': title, 'album': album,
+                'albumartist': albumartist, 'catalognumber': catalognumber
+            }
+            log_strategies = self.logger.isEnabledFor(logging.INFO)
+            seen_queries = set()
+            best_result = None
+            for condition, kind, build_params, describe, fallback in self._SEARCH_STRATEGIES:
+                if not condition(fields):
                     continue
-                    
-                self.logger.info(f"🔍 Stratégie MusicBrainz: {strategy['desc']}")
                 
-                # Cas spécial : recherche par numéro de catalogue
-                if strategy.get('special') == 'catno':
-                    result = self._search_by_catalog_number(catalognumber, artist, title)
+                params = build_params(fields)
+                query_key = (kind, params if kind else tuple(sorted(params.items())))
+                if query_key in seen_queries:
+                    continue
+                seen_queries.add(query_key)
+                
+                if fallback and best_result and best_result['best_match']['confidence'] > 0.5:
+                    break
+                
+                if log_strategies:
+                    self.logger.info(f"🔍 Stratégie MusicBrainz: {describe(fields)}")
+                
+                # Cas spéciaux : numéro de catalogue, tracklist de l'album
+                if kind == 'catno':
+                    result = self._search_by_catalog_number(*params)
+                elif kind == 'album':
+                    result = self._search_in_album(*params)
                 else:
-                    result = self._search_musicbrainz(**strategy['params'])
+                    result = self._search_musicbrainz(**params)
                 
                 if result and result.get('best_match', {}).get('confidence', 0) > 0.7:
                     self.logger.info(f"✅ Correspondance trouvée avec confiance {result['best_match']['confidence']:.1%}")
                     return result
                 elif result:
                     self.logger.info(f"⚠️ Correspondance faible: {result['best_match']['confidence']:.1%}")
+                    if best_result is None or result['best_match']['confidence'] > best_result['best_match']['confidence']:
+                        best_result = result
             
-            # Si aucune stratégie n'a donné de bon résultat, retourner le meilleur
-            return self._search_musicbrainz(artist=artist, title=title, album=album)
+            # Si aucune stratégie n'a donné de bon résultat, retourner le meilleur obtenu
+            return best_result
             
-        except Exception as e:
+        except (musicbrainzngs.MusicBrainzError, KeyError, TypeError) as e:
             self.logger.warning(f"Erreur recherche MusicBrainz métadonnées: {e}")
             return None
 
@@ -136,98 +291,178 @@ class MusicBrainzSearcher:
         """Recherche spécialisée par numéro de catalogue"""
         try:
             # Recherche par catno dans les releases
-            releases = musicbrainzngs.search_releases(catno=catno, limit=5)
+            releases = self._cached_call('search_releases', SEARCH_CACHE_TTL, catno=catno, limit=5)
             
             if not releases.get('release-list'):
                 return None
             
-            # Pour chaque release trouvé, chercher les recordings qui matchent
-            best_match = None
-            best_confidence = 0
-            
-            for release in releases['release-list']:
+            # Récupérer les détails des releases en parallèle (le limiteur global
+            # espace toujours les requêtes, mais les latences serveur se recouvrent)
+            def fetch_release(release):
                 try:
-                    # Obtenir les détails du release avec les recordings
-                    release_detail = musicbrainzngs.get_release_by_id(
-                        release['id'], 
+                    return self._cached_call(
+                        'get_release_by_id', LOOKUP_CACHE_TTL,
+                        id=release['id'],
                         includes=['recordings', 'artist-credits']
                     )
-                    
-                    if 'medium-list' in release_detail['release']:
-                        for medium in release_detail['release']['medium-list']:
-                            if 'track-list' in medium:
-                                for track in medium['track-list']:
-                                    recording = track.get('recording', {})
-                                    
-                                    # Calculer la correspondance avec artist/title
-                                    confidence = self._calculate_match_confidence(
-                                        recording, artist, title
-                                    )
-                                    
-                                    if confidence > best_confidence:
-                                        best_confidence = confidence
-                                        best_match = {
-                                            'recording': recording,
-                                            'confidence': confidence
-                                        }
-                                        
-                except Exception as e:
-                    continue
+                except musicbrainzngs.MusicBrainzError:
+                    return None
+            
+            release_list = releases['release-list']
+            with ThreadPoolExecutor(max_workers=min(CATNO_FETCH_WORKERS, len(release_list))) as executor:
+                release_details = list(executor.map(fetch_release, release_list))
+            
+            # Rassembler les recordings de tous les releases trouvés
+            recordings = [
+                track.get('recording', {})
+                for release_detail in release_details if release_detail
+                for medium in release_detail['release'].get('medium-list', [])
+                for track in medium.get('track-list', [])
+            ]
+            
+            if not recordings:
+                return None
             
-            if best_match and best_confidence > 0.3:  # Seuil minimal
-                return {'best_match': best_match}
+            # Calculer la correspondance avec artist/title pour tous les recordings d'un coup
+            confidences = self._calculate_match_confidences(recordings, artist, title)
+            best_index = int(np.argmax(confidences))
+            best_confidence = float(confidences[best_index])
+            
+            if best_confidence > 0.3:  # Seuil minimal
+                return {
+                    'best_match': {
+                        'recording': recordings[best_index],
+                        'confidence': best_confidence
+                    }
+                }
             
             return None
             
-        except Exception as e:
+        except (musicbrainzngs.MusicBrainzError, KeyError, TypeError) as e:
             self.logger.warning(f"Erreur recherche par catalogue: {e}")
             return None
 
-    def _calculate_match_confidence(self, recording, target_artist, target_title):
-        """Calcule la confiance de correspondance entre un recording et les critères"""
+    def _fetch_album_tracklist(self, album_artist, album):
+        """Recordings de la release la mieux classée pour (artiste, album)
+
+        Chaque recording porte la release dans 'release-list', comme les
+        résultats de search_recordings. Les erreurs API sont propagées pour ne
+        pas être mises en cache par _album_tracklist.
+        """
+        releases = self._cached_call(
+            'search_releases', SEARCH_CACHE_TTL,
+            artist=album_artist, release=album, limit=1
+        ).get('release-list')
+        if not releases:
+            return ()
+        
+        release = self._cached_call(
+            'get_release_by_id', LOOKUP_CACHE_TTL,
+            id=releases[0]['id'],
+            includes=['recordings', 'artist-credits']
+        )['release']
+        release_info = {key: release[key] for key in ('id', 'title', 'date') if key in release}
+        return tuple(
+            {**track['recording'], 'release-list': [release_info]}
+            for medium in release.get('medium-list', [])
+            for track in medium.get('track-list', [])
+            if 'recording' in track
+        )
+
+    def _search_in_album(self, album_artist, album, artist='', title=''):
+        """Cherche le titre dans la tracklist de l'album, sans requête par piste"""
         try:
-            confidence = 0.0
-            
-            # Comparaison du titre
-            recording_title = recording.get('title', '').lower() if recording.get('title') else ''
-            if target_title and recording_title:
-                title_similarity = self._string_similarity(recording_title, target_title.lower())
-                confidence += title_similarity * 0.6  # 60% du poids
-            
-            # Comparaison de l'artiste
-            recording_artist = ''
-            if 'artist-credit' in recording:
-                artists = []
-                for credit in recording['artist-credit']:
-                    if isinstance(credit, dict) and 'artist' in credit:
-                        artists.append(credit['artist'].get('name', ''))
-                recording_artist = ', '.join(artists).lower()
-            
-            if target_artist and recording_artist:
-                artist_similarity = self._string_similarity(recording_artist, target_artist.lower())
-                confidence += artist_similarity * 0.4  # 40% du poids
-            
-            return min(confidence, 1.0)  # Plafonner à 1.0
-            
-        except Exception:
-            return 0.0
+            with self._album_lock:
+                recordings = self._album_tracklist(_fold(album_artist), _fold(album))
+        except (musicbrainzngs.MusicBrainzError, KeyError, TypeError) as e:
+            self.logger.warning(f"Erreur récupération de la tracklist: {e}")
+            return None
+        
+        if not recordings:
+            return None
+        
+        confidences = self._calculate_match_confidences(recordings, artist, title)
+        best_index = int(np.argmax(confidences))
+        best_confidence = float(confidences[best_index])
+        
+        if best_confidence > 0.3:  # Seuil minimal
+            return {
+                'best_match': {
+                    'recording': recordings[best_index],
+                    'confidence': best_confidence,
+                    'source': 'musicbrainz_album_tracklist'
+                }
+            }
+        return None
+
+    @staticmethod
+    def _extract_artist(recording, sep=', '):
+        """Noms des artistes crédités d'un recording, joints par `sep`"""
+        return sep.join(
+            credit['artist'].get('name', '')
+            for credit in recording.get('artist-credit') or ()
+            if isinstance(credit, dict) and isinstance(credit.get('artist'), dict)
+        )
+
+    def _calculate_match_confidences(self, recordings, target_artist, target_title):
+        """Calcule la confiance de correspondance de chaque recording avec les critères
+        
+        Returns:
+            np.ndarray: Une confiance (0.0 - 1.0) par recording, dans l'ordre reçu
+        """
+        confidence = np.zeros(len(recordings))
+        
+        # Comparaison du titre (60% du poids)
+        if target_title:
+            titles = [recording.get('title') or '' for recording in recordings]
+            confidence += self._similarity_batch(target_title, titles) * 0.6
+        
+        # Comparaison de l'artiste (40% du poids)
+        if target_artist:
+            recording_artists = [self._extract_artist(recording) for recording in recordings]
+            confidence += self._similarity_batch(target_artist, recording_artists) * 0.4
+        
+        return np.minimum(confidence, 1.0)  # Plafonner à 1.0
+
+    def _similarity_batch(self, target, candidates):
+        """Similarité (0.0 - 1.0) entre une chaîne et chaque candidat
+        
+        Équivaut à appeler _string_similarity pour chaque candidat, mais avec
+        rapidfuzz toutes les comparaisons passent par un seul appel cdist.
+        """
+        if not target or not candidates:
+            return np.zeros(len(candidates))
+        
+        if RAPIDFUZZ_AVAILABLE:
+            normalized = [_normalize(candidate)[1] for candidate in candidates]
+            scores = cdist([_normalize(target)[1]], normalized, scorer=fuzz.token_set_ratio)
+            return scores[0] / 100.0
+        
+        return np.fromiter(
+            (self._string_similarity(target, candidate) for candidate in candidates),
+            dtype=float, count=len(candidates)
+        )
 
     def _string_similarity(self, s1, s2):
-        """Calcule la similarité entre deux chaînes (simple)"""
+        """Calcule la similarité entre deux chaînes (0.0 - 1.0)
+        
+        Utilise rapidfuzz (token_set_ratio : tolère fautes de frappe, casse et
+        ordre des mots) si disponible, sinon un Jaccard sur les mots.
+        """
         if not s1 or not s2:
             return 0.0
         
         # Normaliser
-        s1 = re.sub(r'[^\w\s]', '', s1.lower()).strip()
-        s2 = re.sub(r'[^\w\s]', '', s2.lower()).strip()
+        words1, s1 = _normalize(s1)
+        words2, s2 = _normalize(s2)
         
         if s1 == s2:
             return 1.0
         
-        # Similarité basique basée sur les mots communs
-        words1 = set(s1.split())
-        words2 = set(s2.split())
+        if RAPIDFUZZ_AVAILABLE:
+            return fuzz.token_set_ratio(s1, s2) / 100.0
         
+        # Similarité basique basée sur les mots communs
         if not words1 or not words2:
             return 0.0
         
@@ -242,21 +477,12 @@ class MusicBrainzSearcher:
         name = os.path.splitext(filename)[0]
         
         # Nettoyer les patterns courants
-        name = re.sub(r'\(.*?\)', '', name)  # Supprimer (Original Mix), etc.
-        name = re.sub(r'\[.*?\]', '', name)  # Supprimer [Label], etc.
-        
-        # Patterns d'extraction (ordre d'importance)
-        patterns = [
-            # "02. Artiste - Titre"
-            r'^\d+\.?\s*(.+?)\s*-\s*(.+)$',
-            # "Artiste - Titre"
-            r'^(.+?)\s*-\s*(.+)$',
-            # "Artiste_Titre"
-            r'^(.+?)_(.+)$',
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, name.strip())
+        name = _PAREN_RE.sub('', name)  # Supprimer (Original Mix), etc.
+        name = _BRACKET_RE.sub('', name)  # Supprimer [Label], etc.
+        
+        stripped = name.strip()
+        for pattern in _FILENAME_PATTERNS:
+            match = pattern.match(stripped)
             if match:
                 groups = match.groups()
                 if len(groups) >= 2:
@@ -291,56 +517,36 @@ class MusicBrainzSearcher:
             return ''
         
         # Supprimer les caractères spéciaux problématiques
-        text = re.sub(r'[_\[\](){}]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)  # Multiples espaces → un seul
+        text = _SPECIAL_RE.sub(' ', text)
+        text = _WS_RE.sub(' ', text)  # Multiples espaces → un seul
         return text.strip()
     
     def _search_musicbrainz(self, artist='', title='', album=None):
         """Effectue la recherche sur MusicBrainz"""
         try:
-            # Construction de la requête
-            query_parts = []
-            
-            if artist:
-                query_parts.append(f'artist:"{artist}"')
-            if title:
-                query_parts.append(f'recording:"{title}"')
-            if album:
-                query_parts.append(f'release:"{album}"')
+            # Champs passés en kwargs : musicbrainzngs les échappe lui-même,
+            # ce qui évite la concaténation Lucene et la recherche de repli
+            fields = {
+                key: value
+                for key, value in (('artist', artist), ('recording', title), ('release', album))
+                if value
+            }
             
-            if not query_parts:
+            if not fields:
                 return None
             
-            query = ' AND '.join(query_parts)
-            self.logger.debug(f"Requête MusicBrainz: {query}")
+            self.logger.debug(f"Requête MusicBrainz: {fields}")
             
             # Recherche
-            result = musicbrainzngs.search_recordings(
-                query=query,
+            result = self._cached_call(
+                'search_recordings', SEARCH_CACHE_TTL,
                 limit=self.max_results,
-                strict=False
+                strict=False,
+                **fields
             )
             
             recordings = result.get('recording-list', [])
             
-            if not recordings:
-                # Recherche plus permissive sans guillemets
-                query_parts = []
-                if artist:
-                    query_parts.append(f'artist:{artist}')
-                if title:
-                    query_parts.append(f'recording:{title}')
-                
-                query = ' AND '.join(query_parts)
-                self.logger.debug(f"Requête MusicBrainz permissive: {query}")
-                
-                result = musicbrainzngs.search_recordings(
-                    query=query,
-                    limit=self.max_results,
-                    strict=False
-                )
-                recordings = result.get('recording-list', [])
-            
             if recordings:
                 # Retourner TOUS les résultats avec leurs confidences
                 all_matches = []
@@ -366,52 +572,28 @@ class MusicBrainzSearcher:
             
             return None
             
-        except Exception as e:
+        except musicbrainzngs.MusicBrainzError as e:
             self.logger.warning(f"Erreur API MusicBrainz: {e}")
             return None
     
     def _calculate_confidence(self, recording, target_artist, target_title):
         """Calcule la confiance du résultat MusicBrainz"""
-        try:
-            # Récupérer les informations du résultat
-            result_title = recording.get('title', '').lower() if recording.get('title') else ''
-            result_artist = ''
-            
-            if 'artist-credit' in recording:
-                artists = []
-                for credit in recording['artist-credit']:
-                    if isinstance(credit, dict) and 'artist' in credit:
-                        artists.append(credit['artist'].get('name', ''))
-                result_artist = ' '.join(artists).lower()
-            
-            # Comparaison simple (peut être améliorée avec des algorithmes de distance)
-            title_match = self._similarity(target_title.lower(), result_title)
-            artist_match = self._similarity(target_artist.lower(), result_artist)
-            
-            # Score combiné
-            confidence = (title_match + artist_match) / 2
-            
-            return min(confidence, 0.95)  # Cap à 95% pour les recherches textuelles
-            
-        except Exception:
-            return 0.5  # Confiance moyenne par défaut
-    
-    def _similarity(self, text1, text2):
-        """Calcule la similarité entre deux textes (simple)"""
-        if not text1 or not text2:
-            return 0.0
+        # Récupérer les informations du résultat (champs absents ou None → '')
+        result_title = (recording.get('title') or '').lower()
+        result_artist = self._extract_artist(recording, sep=' ').lower()
         
-        # Jaccard similarity basique
-        words1 = set(text1.split())
-        words2 = set(text2.split())
+        # Comparaison simple (peut être améliorée avec des algorithmes de distance)
+        title_match = self._similarity((target_title or '').lower(), result_title)
+        artist_match = self._similarity((target_artist or '').lower(), result_artist)
         
-        if not words1 and not words2:
-            return 1.0
+        # Score combiné
+        confidence = (title_match + artist_match) / 2
         
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        return intersection / union if union > 0 else 0.0
+        return min(confidence, 0.95)  # Cap à 95% pour les recherches textuelles
+    
+    def _similarity(self, text1, text2):
+        """Calcule la similarité entre deux textes (même algorithme que _string_similarity)"""
+        return self._string_similarity(text1, text2)
     
     def format_result(self, mb_data):
         """Formate le résultat MusicBrainz pour compatibilité"""
@@ -423,6 +605,9 @@ class MusicBrainzSearcher:
             if not mb_data:
                 self.logger.warning("format_result: mb_data est None ou vide")
                 return None
+            if not isinstance(mb_data, dict):
+                self.logger.warning(f"format_result: dictionnaire attendu, reçu {type(mb_data)}")
+                return None
             
             # Vérifier si 'recording' existe
             if 'recording' not in mb_data:
@@ -432,29 +617,20 @@ class MusicBrainzSearcher:
             recording = mb_data['recording']
             
             # Vérifier si recording est valide
-            if not recording:
-                self.logger.warning("format_result: recording est None ou vide")
+            if not recording or not isinstance(recording, dict):
+                self.logger.warning("format_result: recording est None, vide ou invalide")
                 return None
             
             # Extraire l'artiste
-            artist = 'Artiste Inconnu'
-            if 'artist-credit' in recording:
-                artists = []
-                for credit in recording['artist-credit']:
-                    if isinstance(credit, dict) and 'artist' in credit:
-                        artists.append(credit['artist'].get('name', ''))
-                if artists:
-                    artist = ', '.join(artists)
-            
-            # Extraire l'album
-            album = 'Album Inconnu'
-            if 'release-list' in recording and recording['release-list']:
-                album = recording['release-list'][0].get('title', 'Album Inconnu')
+            artist = self._extract_artist(recording) or 'Artiste Inconnu'
             
-            # Extraire l'année
+            # Extraire l'album et l'année de la première sortie
+            album = 'Album Inconnu'
             year = ''
-            if 'release-list' in recording and recording['release-list']:
-                release = recording['release-list'][0]
+            releases = recording.get('release-list')
+            if releases and isinstance(releases[0], dict):
+                release = releases[0]
+                album = release.get('title', 'Album Inconnu')
                 if 'date' in release:
                     year = release['date'][:4] if len(release['date']) >= 4 else ''
             
@@ -471,7 +647,7 @@ class MusicBrainzSearcher:
             self.logger.debug(f"format_result formaté avec succès: {formatted_result['artist']} - {formatted_result['title']}")
             return formatted_result
             
-        except Exception as e:
+        except (KeyError, TypeError, IndexError) as e:
             self.logger.warning(f"Erreur formatage MusicBrainz: {e}")
             self.logger.warning(f"Type de mb_data: {type(mb_data)}")
             if isinstance(mb_data, dict):
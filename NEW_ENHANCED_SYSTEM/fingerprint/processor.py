@@ -1,12 +1,21 @@
 import os
+import re
+import configparser
+import sqlite3
 import logging
 import time
 import functools
+import operator
 import numpy as np
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from acoustid import fingerprint_file, lookup, parse_lookup_result
+from acoustid import fingerprint_file, parse_lookup_result
+from .acoustid_client import lookup
+from .acoustic_matcher import AcousticMatcher, FPCALC_BATCH_SIZE, FPCALC_LENGTH
 from .cache import AcoustIDCache
 from .musicbrainz_search import MusicBrainzSearcher
+from .spectral_features import extract_spectral_features
 from cache.cache_manager import CacheManager
 from config.config_manager import ConfigManager
 
@@ -20,6 +29,12 @@ from spectral_analyzer import SpectralMatcher
 
 from errors import ErrorManager, get_error_manager, AudioProcessingError, ConfigurationError
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
 # Configuration du chemin vers fpcalc.exe
 CURRENT_DIR = Path(__file__).parent.parent
 FPCALC_PATH = CURRENT_DIR / "audio_tools" / "fpcalc.exe"
@@ -31,13 +46,166 @@ if FPCALC_PATH.exists():
 else:
     print(f"⚠️ fpcalc non trouvé: {FPCALC_PATH}")
 
+# Pipeline de resolve_metadata_batch
+FINGERPRINT_WORKERS = os.cpu_count() or 4   # lots fpcalc simultanés (étape CPU)
+LOOKUP_WORKERS = 16                         # fichiers résolus simultanément (étape réseau)
+
+# Secondes d'audio décodées pour l'analyse spectrale de repli
+SPECTRAL_ANALYSIS_SECONDS = 30
+
+# Similarité minimale (1 - taux d'erreur binaire) d'une empreinte brute avec une
+# référence locale ; deux morceaux sans rapport se situent autour de 0.5
+RAW_MATCH_MIN_SIMILARITY = 0.7
+
+# Durée de validité des réponses AcoustID en cache (secondes)
+ACOUSTID_CACHE_TTL = 3600 * 24 * 7
+
+# Erreurs du cache d'empreintes (fichier disparu, base verrouillée, empreinte
+# non décodable) : le cache est optionnel, elles ne font pas échouer l'analyse
+_ACOUSTID_CACHE_ERRORS = (OSError, sqlite3.Error, ValueError)
+
+# Clé de tri des résultats AcoustID (itemgetter : pas d'appel Python par résultat)
+_SCORE_KEY = operator.itemgetter('score')
+
+# MusicBrainz ID (UUID) bien formé, tel qu'écrit par Picard et les autres taggers
+_MBID_RE = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+
+def _tagged_mbid(existing_metadata):
+    """MBID de piste valide présent dans les tags existants, sinon None"""
+    musicbrainz_trackid = existing_metadata.get('musicbrainz_trackid') if existing_metadata else None
+    if musicbrainz_trackid and _MBID_RE.match(musicbrainz_trackid):
+        return musicbrainz_trackid
+    return None
+
+
+# Valeurs par défaut partagées des lectures de métadonnées AcoustID (jamais modifiées)
+_EMPTY_LIST = ()
+_EMPTY_DICT = {}
+
+
+def _first_artist_name(metadata, default=''):
+    """Nom du premier artiste d'un recording AcoustID, ou `default`"""
+    artists = metadata.get('artists') or _EMPTY_LIST
+    return artists[0].get('name', default) if artists else default
+
+
+def _result_confidence(result):
+    """Confiance d'un résultat de resolve_metadata (similarité pour le spectral, 0.0 si échec)"""
+    if result.get('status') == 'spectral_success':
+        return result.get('similarity') or 0.0
+    return result.get('confidence') or 0.0
+
+
+class BatchResults(Mapping):
+    """Résultats de resolve_metadata_batch
+    
+    Se lit comme le dict {chemin: résultat} d'origine, et expose en plus des
+    tableaux parallèles (un élément par fichier, dans l'ordre reçu) pour
+    filtrer ou trier sans parcourir les dicts en Python :
+    paths, statuses, track_ids (object) et confidences (float32).
+    """
+    
+    def __init__(self, paths, results):
+        self._results = results
+        self.paths = np.array(paths, dtype=object)
+        raw = [results[path] for path in paths]
+        self.statuses = np.array([r.get('status') for r in raw], dtype=object)
+        self.track_ids = np.array(
+            [r.get('track_id') or r.get('musicbrainz_id') for r in raw], dtype=object
+        )
+        self.confidences = np.fromiter(
+            (_result_confidence(r) for r in raw), dtype=np.float32, count=len(raw)
+        )
+    
+    def __getitem__(self, path):
+        return self._results[path]
+    
+    def __iter__(self):
+        return iter(self.paths)
+    
+    def __len__(self):
+        return len(self.paths)
+    
+    def above(self, threshold):
+        """Fichiers dont la confiance dépasse `threshold`
+        
+        Returns:
+            tuple: (masque booléen, indices correspondants)
+        """
+        mask = self.confidences > threshold
+        return mask, np.flatnonzero(mask)
+
+@functools.lru_cache(maxsize=None)
+def _mutagen_readers():
+    """Classe mutagen à utiliser pour chaque extension prise en charge
+    
+    Ouvrir directement le bon format évite la détection de format de
+    mutagen.File (qui sonde chaque type connu). Import différé : mutagen est
+    optionnel, une ImportError signifie qu'il n'est pas installé.
+    """
+    from mutagen.mp3 import MP3
+    from mutagen.mp4 import MP4
+    from mutagen.flac import FLAC
+    from mutagen.oggvorbis import OggVorbis
+    return {'.mp3': MP3, '.m4a': MP4, '.mp4': MP4, '.flac': FLAC, '.ogg': OggVorbis}
+
+# Tags lus pour chaque format : (champ, méthode de lecture, tag)
+_VORBIS_TAGS = (
+    ('title', '_get_tag_value', 'TITLE'),
+    ('artist', '_get_tag_value', 'ARTIST'),
+    ('album', '_get_tag_value', 'ALBUM'),
+    ('albumartist', '_get_tag_value', 'ALBUMARTIST'),
+    ('date', '_get_tag_value', 'DATE'),
+    ('tracknumber', '_get_tag_value', 'TRACKNUMBER'),
+    ('musicbrainz_trackid', '_get_tag_value', 'MUSICBRAINZ_TRACKID'),
+)
+_MP4_TAGS = (
+    ('title', '_get_tag_value', '\xa9nam'),
+    ('artist', '_get_tag_value', '\xa9ART'),
+    ('album', '_get_tag_value', '\xa9alb'),
+    ('albumartist', '_get_tag_value', 'aART'),
+    ('date', '_get_tag_value', '\xa9day'),
+    ('track', '_get_tag_value', 'trkn'),
+)
+_METADATA_TAGS = {
+    # MP3 avec ID3
+    '.mp3': (
+        ('title', '_get_tag_value', 'TIT2'),
+        ('artist', '_get_tag_value', 'TPE1'),
+        ('album', '_get_tag_value', 'TALB'),
+        ('albumartist', '_get_tag_value', 'TPE2'),
+        ('date', '_get_tag_value', 'TDRC'),
+        ('track', '_get_tag_value', 'TRCK'),
+        ('label', '_get_tag_value', 'TPUB'),
+        ('catalognumber', '_get_custom_tag_value', 'CATALOGNUMBER'),
+        ('musicbrainz_trackid', '_get_ufid_value', 'http://musicbrainz.org'),
+        ('musicbrainz_albumid', '_get_custom_tag_value', 'MusicBrainz Album Id'),
+    ),
+    '.m4a': _MP4_TAGS,
+    '.mp4': _MP4_TAGS,
+    '.flac': _VORBIS_TAGS + (
+        ('label', '_get_tag_value', 'LABEL'),
+        ('catalognumber', '_get_tag_value', 'CATALOGNUMBER'),
+    ),
+    # OGG Vorbis
+    '.ogg': _VORBIS_TAGS,
+}
+
 def timer(func):
-    """Décorateur pour mesurer le temps d'exécution"""
+    """Décorateur pour mesurer le temps d'exécution
+    
+    Actif seulement si la variable d'environnement MFM_TIMING est définie au
+    chargement du module ; sinon la fonction est renvoyée telle quelle.
+    """
+    if not os.environ.get('MFM_TIMING'):
+        return func
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_time) / 1e9
         print(f"{func.__name__} exécuté en {execution_time:.2f}s")
         return result
     return wrapper
@@ -57,80 +225,75 @@ class AudioFingerprinter:
         # Nouveau système de recherche MusicBrainz
         self.musicbrainz_searcher = MusicBrainzSearcher(logger=self.logger)
         
+        # Seuils de confiance lus une seule fois (voir refresh_config)
+        self.refresh_config()
+        
+        # Génération des empreintes en lot (fpcalc multi-fichiers + cache)
+        self.acoustic_matcher = AcousticMatcher(
+            fpcalc_path=os.environ.get('FPCALC', str(FPCALC_PATH)),
+            fpcalc_length=self._analysis_length
+        )
+        
         # Initialiser l'analyseur spectral
-        try:
-            spectral_threshold = self.config.getfloat('FINGERPRINT', 'spectral_similarity_threshold')
-        except:
-            spectral_threshold = 0.7  # Valeur par défaut
-        self.spectral_matcher = SpectralMatcher(threshold=spectral_threshold)
+        self.spectral_matcher = SpectralMatcher(threshold=self._spectral_threshold)
         
-        # Base de données de référence spectrale (pour l'instant vide, à implémenter)
+        # Base de référence locale {chemin: identifiant} (voir load_spectral_references)
         self.spectral_reference_db = {}
         
+        # Empreintes précalculées en lot par resolve_metadata_batch : {chemin: (durée, empreinte)}
+        self._prefetched_fingerprints = {}
+        
         # Enregistrer un gestionnaire personnalisé pour les erreurs audio
         self.error_manager.register_handler('audio_processor', self._handle_audio_error)
         
+    def refresh_config(self):
+        """Relit les seuils de la section FINGERPRINT (après une modification de la configuration)"""
+        self._min_confidence = self.config.getfloat('FINGERPRINT', 'acoustid_min_confidence')
+        self._mb_threshold = self.config.getfloat('FINGERPRINT', 'musicbrainz_min_confidence')
+        try:
+            self._spectral_threshold = self.config.getfloat('FINGERPRINT', 'spectral_similarity_threshold')
+        except:
+            self._spectral_threshold = 0.7  # Valeur par défaut
+        # Durée analysée par fpcalc : 60 s suffisent à AcoustID (pyacoustid en décode 120)
+        try:
+            self._analysis_length = self.config.getint('FINGERPRINT', 'analysis_length')
+        except (configparser.Error, ValueError):
+            self._analysis_length = FPCALC_LENGTH
+        if hasattr(self, 'spectral_matcher'):
+            self.spectral_matcher.threshold = self._spectral_threshold
+        if hasattr(self, 'acoustic_matcher'):
+            self.acoustic_matcher.fpcalc_length = self._analysis_length
+    
     def _handle_audio_error(self, error_entry):
         """Gestionnaire spécialisé pour les erreurs audio"""
         if error_entry['error_code'].startswith('AUDIO_'):
-            self.logger.warning(f"Erreur audio traitée: {error_entry['message']}")
+            self.logger.warning("Erreur audio traitée: %s", error_entry['message'])
 
     def _extract_existing_metadata(self, file_path):
         """Extrait les métadonnées existantes d'un fichier audio de manière enrichie"""
         try:
             try:
-                from mutagen import File
+                readers = _mutagen_readers()
             except ImportError:
                 return None
             
-            audio_file = File(file_path)
+            # Format déterminé par l'extension : seuls les formats dont on lit les tags sont ouverts
+            ext = os.path.splitext(file_path)[1].lower()
+            reader = readers.get(ext)
+            if reader is None:
+                return None
+            
+            audio_file = reader(file_path)
             if not audio_file:
                 return None
             
+            # Extraction selon le format ; les tags vides ne sont jamais ajoutés
+            # (les lecteurs renvoient déjà des chaînes nettoyées ou None)
             metadata = {}
-            
-            # Extraction selon le format
-            if file_path.lower().endswith('.mp3'):
-                # MP3 avec ID3
-                metadata['title'] = self._get_tag_value(audio_file, 'TIT2')
-                metadata['artist'] = self._get_tag_value(audio_file, 'TPE1')
-                metadata['album'] = self._get_tag_value(audio_file, 'TALB')
-                metadata['albumartist'] = self._get_tag_value(audio_file, 'TPE2')
-                metadata['date'] = self._get_tag_value(audio_file, 'TDRC')
-                metadata['track'] = self._get_tag_value(audio_file, 'TRCK')
-                metadata['label'] = self._get_tag_value(audio_file, 'TPUB')
-                metadata['catalognumber'] = self._get_custom_tag_value(audio_file, 'CATALOGNUMBER')
-                metadata['musicbrainz_trackid'] = self._get_ufid_value(audio_file, 'http://musicbrainz.org')
-                metadata['musicbrainz_albumid'] = self._get_custom_tag_value(audio_file, 'MusicBrainz Album Id')
-            elif file_path.lower().endswith(('.m4a', '.mp4')):
-                # MP4/M4A
-                metadata['title'] = self._get_tag_value(audio_file, '\xa9nam')
-                metadata['artist'] = self._get_tag_value(audio_file, '\xa9ART')
-                metadata['album'] = self._get_tag_value(audio_file, '\xa9alb')
-                metadata['albumartist'] = self._get_tag_value(audio_file, 'aART')
-                metadata['date'] = self._get_tag_value(audio_file, '\xa9day')
-                metadata['track'] = self._get_tag_value(audio_file, 'trkn')
-            elif file_path.lower().endswith('.flac'):
-                # FLAC
-                metadata['title'] = self._get_tag_value(audio_file, 'TITLE')
-                metadata['artist'] = self._get_tag_value(audio_file, 'ARTIST')
-                metadata['album'] = self._get_tag_value(audio_file, 'ALBUM')
-                metadata['albumartist'] = self._get_tag_value(audio_file, 'ALBUMARTIST')
-                metadata['date'] = self._get_tag_value(audio_file, 'DATE')
-                metadata['tracknumber'] = self._get_tag_value(audio_file, 'TRACKNUMBER')
-                metadata['label'] = self._get_tag_value(audio_file, 'LABEL')
-                metadata['catalognumber'] = self._get_tag_value(audio_file, 'CATALOGNUMBER')
-            elif file_path.lower().endswith('.ogg'):
-                # OGG Vorbis
-                metadata['title'] = self._get_tag_value(audio_file, 'TITLE')
-                metadata['artist'] = self._get_tag_value(audio_file, 'ARTIST')
-                metadata['album'] = self._get_tag_value(audio_file, 'ALBUM')
-                metadata['albumartist'] = self._get_tag_value(audio_file, 'ALBUMARTIST')
-                metadata['date'] = self._get_tag_value(audio_file, 'DATE')
-                metadata['tracknumber'] = self._get_tag_value(audio_file, 'TRACKNUMBER')
-            
-            # Filtrer les valeurs vides
-            metadata = {k: v for k, v in metadata.items() if v and str(v).strip()}
+            for field, getter, tag in _METADATA_TAGS[ext]:
+                value = getattr(self, getter)(audio_file, tag)
+                if value:
+                    metadata[field] = value
             
             # Retourner seulement si on a au moins titre + artiste
             if metadata.get('title') and metadata.get('artist'):
@@ -139,7 +302,7 @@ class AudioFingerprinter:
             return None
             
         except Exception as e:
-            self.logger.debug(f"Erreur lors de l'extraction des métadonnées: {e}")
+            self.logger.debug("Erreur lors de l'extraction des métadonnées: %s", e)
             return None
     
     def _get_tag_value(self, audio_file, tag_name):
@@ -152,12 +315,16 @@ class AudioFingerprinter:
         return None
 
     def _get_custom_tag_value(self, audio_file, desc):
-        """Extrait la valeur d'un tag TXXX personnalisé pour MP3"""
+        """Extrait la valeur d'un tag TXXX personnalisé pour MP3
+        
+        Mutagen indexe les frames TXXX par 'TXXX:<description>' : accès direct
+        sans parcourir toutes les frames.
+        """
         try:
             if hasattr(audio_file, 'tags') and audio_file.tags:
-                for tag in audio_file.tags.values():
-                    if hasattr(tag, 'desc') and tag.desc == desc:
-                        return str(tag.text[0]).strip() if tag.text else None
+                frame = audio_file.tags.get(f'TXXX:{desc}')
+                if frame and frame.text:
+                    return str(frame.text[0]).strip()
         except:
             pass
         return None
@@ -173,17 +340,92 @@ class AudioFingerprinter:
             pass
         return None
     
-    def resolve_metadata(self, file_path):
-        """Workflow complet de résolution des métadonnées"""
+    def resolve_metadata(self, file_path, existing_metadata=None):
+        """Workflow complet de résolution des métadonnées
+        
+        Accepte aussi un itérable de chemins : délègue alors à resolve_metadata_batch.
+        
+        Args:
+            existing_metadata: Tags déjà lus du fichier (sinon lus ici)
+        """
+        if not isinstance(file_path, (str, os.PathLike)):
+            return self.resolve_metadata_batch(file_path)
+        
         try:
-            return self._resolve_metadata_core(file_path)
+            return self._resolve_metadata_core(file_path, existing_metadata)
         except Exception as e:
-            self.logger.error(f"Échec du traitement: {str(e)}")
+            self.logger.error("Échec du traitement: %s", e)
             return {'status': 'failed', 'error': str(e)}
     
-    def _resolve_metadata_core(self, file_path):
-        # Configuration des seuils
-        min_confidence = self.config.getfloat('FINGERPRINT', 'acoustid_min_confidence')
+    def resolve_metadata_batch(self, file_paths):
+        """Résout les métadonnées de plusieurs fichiers
+        
+        Pipeline en deux étages : les empreintes sont générées par lots de
+        fpcalc (un processus pour FPCALC_BATCH_SIZE fichiers), plusieurs lots à
+        la fois ; dès qu'un lot est prêt, ses fichiers passent au workflow
+        habituel (requêtes AcoustID/MusicBrainz) sur un second pool, pendant
+        que les lots suivants sont encore en cours.
+        
+        Returns:
+            BatchResults: {chemin: résultat de resolve_metadata}, dans l'ordre
+            reçu, avec les confiances et identifiants en tableaux NumPy
+        """
+        file_paths = list(file_paths)
+        
+        # fpcalc tourne dans ses propres processus : des threads suffisent à
+        # paralléliser l'étage CPU
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=FINGERPRINT_WORKERS) as fingerprint_pool, \
+                 ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as lookup_pool:
+                # Tags lus une seule fois : un fichier déjà identifié (MBID) est
+                # résolu par ID, et un fichier dont l'empreinte est en cache n'a
+                # pas non plus besoin de fpcalc
+                existing = dict(zip(file_paths, lookup_pool.map(self._extract_existing_metadata, file_paths)))
+                missing = [
+                    path for path in file_paths
+                    if not _tagged_mbid(existing[path]) and not self._cached_fingerprint(path)
+                ]
+                missing_set = set(missing)
+                chunks = [missing[i:i + FPCALC_BATCH_SIZE] for i in range(0, len(missing), FPCALC_BATCH_SIZE)]
+                
+                lookups = {
+                    lookup_pool.submit(self.resolve_metadata, path, existing[path]): path
+                    for path in file_paths if path not in missing_set
+                }
+                
+                batches = {
+                    fingerprint_pool.submit(self._generate_fingerprints_batch, chunk): chunk
+                    for chunk in chunks
+                }
+                for batch in as_completed(batches):
+                    self._prefetched_fingerprints.update(batch.result())
+                    for path in batches[batch]:
+                        lookups[lookup_pool.submit(self.resolve_metadata, path, existing[path])] = path
+                
+                for lookup in as_completed(lookups):
+                    results[lookups[lookup]] = lookup.result()
+            
+            return BatchResults(file_paths, results)
+        finally:
+            for path in file_paths:
+                self._prefetched_fingerprints.pop(path, None)
+    
+    def _resolve_metadata_core(self, file_path, existing_metadata=None):
+        # Seuils de confiance (lus dans __init__ / refresh_config)
+        min_confidence = self._min_confidence
+        
+        # Fichier déjà identifié par un tagger : une seule requête MusicBrainz
+        # par ID, sans fpcalc ni AcoustID
+        if existing_metadata is None:
+            existing_metadata = self._extract_existing_metadata(file_path)
+        musicbrainz_trackid = _tagged_mbid(existing_metadata)
+        if musicbrainz_trackid:
+            musicbrainz_data = self.musicbrainz_searcher.search_by_id(musicbrainz_trackid)
+            if musicbrainz_data:
+                return self._handle_musicbrainz_match(file_path, musicbrainz_data)
+            # ID introuvable : ne pas le réessayer dans search_by_metadata
+            del existing_metadata['musicbrainz_trackid']
         
         # Essayer d'abord avec AcoustID
         try:
@@ -191,29 +433,26 @@ class AudioFingerprinter:
             
             # Détails pour le diagnostic
             acoustid_confidence = acoustid_data.get('confidence', 0) if acoustid_data else 0
-            self.logger.info(f"AcoustID confiance: {acoustid_confidence:.3f} (seuil: {min_confidence})")
+            self.logger.info("AcoustID confiance: %.3f (seuil: %s)", acoustid_confidence, min_confidence)
             
             if acoustid_data and acoustid_confidence > min_confidence:
                 return self._handle_acoustid_match(file_path, acoustid_data)
         except Exception as e:
-            self.logger.warning(f"AcoustID échec: {e}")
+            self.logger.warning("AcoustID échec: %s", e)
             acoustid_data = None
             acoustid_confidence = 0
         
         # Fallback spectral
         spectral_data = self._spectral_fallback(file_path)
-        spectral_threshold = self.config.getfloat('FINGERPRINT', 'spectral_similarity_threshold')
-        
-        if spectral_data.get('similarity', 0) > spectral_threshold:
+        if spectral_data.get('similarity', 0) > self._spectral_threshold:
             return self._handle_spectral_match(file_path, spectral_data)
         
         # NOUVEAU: Fallback MusicBrainz - essayer d'abord avec les métadonnées existantes
         self.logger.info("🔍 Tentative de recherche MusicBrainz par métadonnées existantes...")
-        existing_metadata = self._extract_existing_metadata(file_path)
         musicbrainz_data = None
         
         if existing_metadata:
-            self.logger.info(f"📊 Métadonnées trouvées: {existing_metadata}")
+            self.logger.info("📊 Métadonnées trouvées: %s", existing_metadata)
             musicbrainz_data = self.musicbrainz_searcher.search_by_metadata(existing_metadata)
             if musicbrainz_data:
                 self.logger.info("✨ Correspondance trouvée via métadonnées existantes")
@@ -227,8 +466,6 @@ class AudioFingerprinter:
             self.logger.info("🔍 Tentative de recherche MusicBrainz par nom de fichier...")
             musicbrainz_data = self.musicbrainz_searcher.search_by_filename(file_path)
         
-        musicbrainz_threshold = self.config.getfloat('FINGERPRINT', 'musicbrainz_min_confidence')
-        
         # Vérifier la confiance (nouveau format avec suggestions ou ancien format)
         best_confidence = 0
         if musicbrainz_data:
@@ -237,7 +474,7 @@ class AudioFingerprinter:
             else:
                 best_confidence = musicbrainz_data.get('confidence', 0)
         
-        if musicbrainz_data and best_confidence > musicbrainz_threshold:
+        if musicbrainz_data and best_confidence > self._mb_threshold:
             return self._handle_musicbrainz_match(file_path, musicbrainz_data)
         
         # Analyser pourquoi la révision manuelle est nécessaire
@@ -276,7 +513,7 @@ class AudioFingerprinter:
             
             metadata = acoustid_data.get('metadata', {})
             suggested_title = metadata.get('title', 'Inconnu')
-            suggested_artist = metadata.get('artists', [{}])[0].get('name', 'Inconnu') if metadata.get('artists') else 'Inconnu'
+            suggested_artist = _first_artist_name(metadata, 'Inconnu')
             
             return {
                 'reason': f'Confiance insuffisante ({confidence_percent:.1f}% < {threshold_percent:.1f}%)',
@@ -295,25 +532,81 @@ class AudioFingerprinter:
             'actions': ['Contacter le support technique']
         }
     
+    def _cached_fingerprint(self, file_path):
+        """(durée, empreinte, track_id) en cache pour un fichier inchangé, sinon None"""
+        try:
+            return self.acoustid_cache.get(file_path)
+        except _ACOUSTID_CACHE_ERRORS:
+            return None
+    
+    def _store_fingerprint(self, file_path, audio_length, fingerprint, track_id):
+        """Met l'empreinte en cache ; un échec du cache est journalisé sans interrompre l'analyse"""
+        try:
+            self.acoustid_cache.set(file_path, audio_length, fingerprint, track_id)
+        except _ACOUSTID_CACHE_ERRORS as e:
+            self.logger.warning("Empreinte non mise en cache pour %s: %s", os.path.basename(file_path), e)
+    
+    def _get_duration_fast(self, file_path):
+        """Durée du fichier lue dans l'en-tête (soundfile.info, sans décodage), ou None"""
+        if not SOUNDFILE_AVAILABLE:
+            return None
+        try:
+            return sf.info(file_path).duration
+        except (RuntimeError, OSError):
+            # Format non géré par libsndfile (ex: MP3 selon la version)
+            return None
+    
     def _get_acoustid_data(self, file_path):
-        cached_data = self.acoustid_cache.get(file_path)
+        cached_data = self._cached_fingerprint(file_path)
         if cached_data:
-            return self._query_acoustid_api(cached_data)
+            audio_length, fingerprint, track_id = cached_data
+            # Empreinte en cache sans durée : la lire dans l'en-tête plutôt que
+            # de relancer fpcalc sur tout le fichier
+            if not audio_length:
+                audio_length = self._get_duration_fast(file_path)
+            if audio_length:
+                return self._query_acoustid_api((audio_length, fingerprint, track_id))
         
         return self._generate_and_query(file_path)
     
     def _generate_and_query(self, file_path):
         audio_length, fingerprint = self._generate_fingerprint(file_path)
-        result = self._query_acoustid_api((audio_length, fingerprint, None))
-        
-        # Mettre en cache l'empreinte pour éviter la regénération
-        if result and result.get('track_id'):
-            self.acoustid_cache.set(file_path, audio_length, fingerprint, result['track_id'])
-            
+        # Mettre en cache l'empreinte pour éviter la regénération, y compris
+        # sans correspondance AcoustID ou si l'API a échoué
+        try:
+            result = self._query_acoustid_api((audio_length, fingerprint, None))
+        except Exception:
+            self._store_fingerprint(file_path, audio_length, fingerprint, None)
+            raise
+        self._store_fingerprint(file_path, audio_length, fingerprint, result.get('track_id') if result else None)
         return result
     
+    def _generate_fingerprints_batch(self, file_paths):
+        """Génère les empreintes d'un lot de fichiers via AcousticMatcher
+        
+        Un seul processus fpcalc pour le lot ; les fichiers inchangés depuis
+        leur dernière analyse sont servis par le cache du matcher.
+        
+        Returns:
+            dict: {chemin: (durée, empreinte)} pour les fichiers traités avec succès
+        """
+        batch = self.acoustic_matcher.generate_fingerprints_batch(file_paths, workers=1)
+        # Empreintes au format de pyacoustid (base64 URL sans padding)
+        results = {
+            path: (data['duration'], data['fingerprint'].rstrip('='))
+            for path, data in batch.items()
+            if data and data.get('duration') is not None
+        }
+        self.logger.debug("Empreintes générées en lot: %d/%d", len(results), len(file_paths))
+        return results
+    
     def _generate_fingerprint(self, file_path):
         """Génère l'empreinte acoustique avec Chromaprint"""
+        # Empreinte déjà calculée par un lot fpcalc
+        prefetched = self._prefetched_fingerprints.pop(file_path, None)
+        if prefetched:
+            return prefetched
+        
         try:
             # Vérifier que fpcalc est disponible
             if 'FPCALC' not in os.environ:
@@ -326,8 +619,10 @@ class AudioFingerprinter:
                     )
                     raise error
             
-            # Vérifier que le fichier existe et est lisible
-            if not os.path.exists(file_path):
+            # Vérifier que le fichier existe et est lisible (un seul stat)
+            try:
+                file_size = os.stat(file_path).st_size
+            except OSError:
                 error = self.error_manager.create_audio_error(
                     f"Fichier non trouvé: {file_path}",
                     file_path=file_path
@@ -343,7 +638,6 @@ class AudioFingerprinter:
                 raise error
             
             # Vérifier la taille du fichier
-            file_size = os.path.getsize(file_path)
             if file_size == 0:
                 error = self.error_manager.create_audio_error(
                     f"Fichier vide: {file_path}",
@@ -351,9 +645,9 @@ class AudioFingerprinter:
                 )
                 raise error
             
-            self.logger.info(f"Analyse de {os.path.basename(file_path)} ({file_size} bytes)")
+            self.logger.info("Analyse de %s (%d bytes)", os.path.basename(file_path), file_size)
             
-            audio_length, fingerprint = fingerprint_file(file_path)
+            audio_length, fingerprint = fingerprint_file(file_path, maxlength=self._analysis_length)
             return audio_length, fingerprint
             
         except AudioProcessingError:
@@ -393,25 +687,39 @@ class AudioFingerprinter:
                 self.error_manager.handle_error(error, {'file_path': file_path, 'operation': 'fingerprint'})
                 raise error
     
+    def _cached_lookup(self, fingerprint, audio_length):
+        """Appel lookup AcoustID servi depuis le cache SQLite quand c'est possible
+        
+        La clé est l'empreinte complète et la durée arrondie : une même empreinte
+        (fichier dupliqué, rescan) ne repasse pas par le réseau pendant
+        ACOUSTID_CACHE_TTL secondes.
+        """
+        params = {'fingerprint': fingerprint, 'duration': round(audio_length)}
+        cached = self.cache.get_query_cache('acoustid_lookup', params)
+        if cached is not None:
+            self.logger.debug("💾 Réponse AcoustID en cache")
+            return cached
+        
+        results = lookup(self.api_key, fingerprint, audio_length)
+        if results.get('status') == 'ok':
+            self.cache.set_query_cache('acoustid_lookup', params, results, expiration=ACOUSTID_CACHE_TTL)
+        return results
+    
     def _query_acoustid_api(self, data):
         audio_length, fingerprint, track_id = data
         for attempt in range(self.max_retries):
             try:
-                results = lookup(
-                    self.api_key, 
-                    fingerprint, 
-                    audio_length
-                )
+                results = self._cached_lookup(fingerprint, audio_length)
                 
                 # Traitement des résultats
                 if results.get('results'):
-                    best_match = max(results['results'], key=lambda x: x['score'])
+                    best_match = max(results['results'], key=_SCORE_KEY)
                     track_id = best_match['id']
                     
                     # Vérification sécurisée des recordings
                     recordings = best_match.get('recordings', [])
                     if not recordings:
-                        self.logger.warning(f"Aucun recording trouvé pour track_id: {track_id}")
+                        self.logger.warning("Aucun recording trouvé pour track_id: %s", track_id)
                         return {
                             'track_id': track_id,
                             'confidence': best_match['score'],
@@ -429,21 +737,65 @@ class AudioFingerprinter:
                     
             except Exception as e:
                 if attempt < self.max_retries - 1:
-                    self.logger.warning(f"Tentative {attempt + 1} échouée, retry...")
+                    self.logger.warning("Tentative %d échouée, retry...", attempt + 1)
                     continue
                 raise RuntimeError(f"Erreur API AcoustID: {str(e)}")
         return None
     
+    def load_spectral_references(self, reference_db):
+        """Charge la base de référence locale et construit ses index
+        
+        Les caractéristiques spectrales et les empreintes brutes de chaque
+        référence sont calculées ici, une fois par chargement ; rappeler cette
+        méthode après toute modification de la base.
+        
+        Args:
+            reference_db: {chemin d'un fichier de référence: identifiant}
+        """
+        self.spectral_reference_db = dict(reference_db)
+        self.spectral_matcher.build_index(self.spectral_reference_db)
+        paths = list(self.spectral_reference_db)
+        
+        # fpcalc -raw tourne dans ses propres processus : des threads suffisent
+        with ThreadPoolExecutor(max_workers=FINGERPRINT_WORKERS) as pool:
+            raw_fingerprints = list(pool.map(self.acoustic_matcher.generate_raw_fingerprint, paths))
+        self.acoustic_matcher.build_reference_index({
+            self.spectral_reference_db[path]: raw
+            for path, raw in zip(paths, raw_fingerprints) if raw is not None
+        })
+    
+    def _raw_fingerprint_match(self, file_path):
+        """Référence locale dont l'empreinte brute s'aligne sur celle du fichier, ou None"""
+        raw_fingerprint = self.acoustic_matcher.generate_raw_fingerprint(file_path)
+        match = self.acoustic_matcher.find_best_match(raw_fingerprint)
+        if not match or match[1] <= RAW_MATCH_MIN_SIMILARITY:
+            return None
+        
+        match_id, similarity, shift = match
+        self.logger.info("✅ Empreinte brute alignée sur une référence: %.2f%% (décalage %d)",
+                         similarity * 100, shift)
+        return {
+            'track_id': match_id,
+            'similarity': similarity,
+            'metadata': self._get_spectral_metadata(match_id),
+            'note': "Correspondance d'empreinte brute (alignement glissant)"
+        }
+    
     def _spectral_fallback(self, file_path):
         """Méthode de fallback spectral - maintenant réellement implémentée !"""
         try:
-            self.logger.info(f"🔍 Analyse spectrale de {os.path.basename(file_path)}...")
+            self.logger.info("🔍 Analyse spectrale de %s...", os.path.basename(file_path))
             
             # Pour l'instant, comme nous n'avons pas de base de données de référence spectrale,
             # nous simulons un processus d'analyse spectrale basique
             
             # Si nous avons une base de données de référence spectrale
             if self.spectral_reference_db:
+                # Empreintes brutes d'abord : alignement robuste aux décalages de début
+                raw_match = self._raw_fingerprint_match(file_path)
+                if raw_match:
+                    return raw_match
+                
                 match_id, similarity = self.spectral_matcher.is_match(
                     self.spectral_reference_db, 
                     file_path
@@ -452,7 +804,7 @@ class AudioFingerprinter:
                 if match_id and similarity > self.spectral_matcher.threshold:
                     # Convertir en float pour éviter les erreurs de format numpy
                     similarity_float = float(similarity)
-                    self.logger.info(f"✅ Correspondance spectrale trouvée: {similarity_float:.2%}")
+                    self.logger.info("✅ Correspondance spectrale trouvée: %.2f%%", similarity_float * 100)
                     return {
                         'track_id': match_id,
                         'similarity': similarity_float,
@@ -462,17 +814,11 @@ class AudioFingerprinter:
             
             # Analyse spectrale basique sans référence (extraction de caractéristiques)
             try:
-                import librosa
-                y, sr = librosa.load(file_path, duration=30)  # Analyser les 30 premières secondes
-                
-                # Extraire des caractéristiques spectrales
-                mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-                spectral_centroid = librosa.feature.spectral_centroid(y=y, sr=sr)
-                tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
+                y, sr = self._load_audio_head(file_path)  # Analyser les 30 premières secondes
                 
-                # Caractéristiques moyennes
-                avg_mfcc = np.mean(mfcc, axis=1)
-                avg_spectral_centroid = np.mean(spectral_centroid)
+                # Extraire les caractéristiques spectrales moyennes (MFCC, centroïde,
+                # tempo) en un seul passage sur le spectrogramme
+                avg_mfcc, avg_spectral_centroid, tempo = extract_spectral_features(y, sr)
                 
                 # Pour l'instant, nous ne pouvons pas faire de matching sans base de référence
                 # Mais nous collectons les données pour un futur usage
@@ -480,10 +826,10 @@ class AudioFingerprinter:
                     'mfcc_mean': avg_mfcc.tolist(),
                     'spectral_centroid_mean': float(avg_spectral_centroid),
                     'tempo': float(tempo),
-                    'duration_analyzed': 30
+                    'duration_analyzed': SPECTRAL_ANALYSIS_SECONDS
                 }
                 
-                self.logger.info(f"📊 Caractéristiques spectrales extraites (tempo: {float(tempo):.1f} BPM)")
+                self.logger.info("📊 Caractéristiques spectrales extraites (tempo: %.1f BPM)", tempo)
                 
                 # Pour l'instant, retourner une similarité faible car pas de référence
                 return {
@@ -495,16 +841,16 @@ class AudioFingerprinter:
                 }
                 
             except ImportError:
-                self.logger.warning("📊 Librosa non disponible pour l'analyse spectrale")
+                self.logger.warning("📊 soundfile/librosa non disponibles pour l'analyse spectrale")
                 return {
                     'track_id': None,
                     'similarity': 0.0,
                     'metadata': None,
-                    'note': 'Librosa requis pour l\'analyse spectrale'
+                    'note': 'soundfile ou librosa requis pour l\'analyse spectrale'
                 }
                 
         except Exception as e:
-            self.logger.error(f"❌ Erreur lors de l'analyse spectrale: {e}")
+            self.logger.error("❌ Erreur lors de l'analyse spectrale: %s", e)
             return {
                 'track_id': None,
                 'similarity': 0.0,
@@ -512,6 +858,33 @@ class AudioFingerprinter:
                 'note': f'Erreur: {str(e)}'
             }
     
+    def _load_audio_head(self, file_path, seconds=SPECTRAL_ANALYSIS_SECONDS):
+        """Décode les `seconds` premières secondes d'un fichier en mono float32
+        
+        soundfile lit directement ces trames en float32, sans rééchantillonnage
+        ni conversion float64 ; librosa sert de repli pour les formats que
+        libsndfile ne gère pas.
+        
+        Returns:
+            tuple: (signal mono float32, fréquence d'échantillonnage)
+            
+        Raises:
+            ImportError: Si ni soundfile ni librosa ne sont disponibles
+        """
+        if SOUNDFILE_AVAILABLE:
+            try:
+                with sf.SoundFile(file_path) as audio:
+                    sr = audio.samplerate
+                    y = audio.read(frames=min(seconds * sr, audio.frames), dtype='float32')
+                if y.ndim > 1:
+                    y = y.mean(axis=1, dtype=np.float32)
+                return y, sr
+            except (RuntimeError, OSError) as e:
+                self.logger.debug("soundfile ne peut pas lire %s: %s", file_path, e)
+        
+        import librosa
+        return librosa.load(file_path, duration=seconds)
+    
     def _get_spectral_metadata(self, track_id):
         """Récupère les métadonnées pour un ID de track spectral"""
         # Placeholder pour récupérer les métadonnées depuis la base spectrale
@@ -547,27 +920,32 @@ class AudioFingerprinter:
     
     def _handle_musicbrainz_match(self, file_path, data):
         """Gère les correspondances trouvées via recherche MusicBrainz"""
-        # Debug logging
-        self.logger.debug(f"_handle_musicbrainz_match reçu: {type(data)} - clés: {list(data.keys()) if isinstance(data, dict) else 'N/A'}")
+        # Debug logging (listes de clés construites seulement si DEBUG est actif)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug("_handle_musicbrainz_match reçu: %s - clés: %s", type(data), list(data.keys()) if isinstance(data, dict) else 'N/A')
         
         best_match = None
         
         # Gérer le nouveau format avec plusieurs suggestions
         if 'suggestions' in data and data['suggestions']:
             best_match = data['best_match']
-            self.logger.debug(f"Nouveau format - best_match: {type(best_match)} - clés: {list(best_match.keys()) if isinstance(best_match, dict) else 'N/A'}")
+            if debug:
+                self.logger.debug("Nouveau format - best_match: %s - clés: %s", type(best_match), list(best_match.keys()) if isinstance(best_match, dict) else 'N/A')
         elif 'best_match' in data:
             # Format avec best_match mais sans suggestions
             best_match = data['best_match']
-            self.logger.debug(f"Format best_match - best_match: {type(best_match)} - clés: {list(best_match.keys()) if isinstance(best_match, dict) else 'N/A'}")
+            if debug:
+                self.logger.debug("Format best_match - best_match: %s - clés: %s", type(best_match), list(best_match.keys()) if isinstance(best_match, dict) else 'N/A')
         else:
             # Format ancien (rétrocompatibilité) - vérifier la structure
-            self.logger.debug(f"Format ancien - data: {list(data.keys()) if isinstance(data, dict) else 'N/A'}")
+            if debug:
+                self.logger.debug("Format ancien - data: %s", list(data.keys()) if isinstance(data, dict) else 'N/A')
             if 'recording' in data:
                 # data contient directement un recording - wrapper dans best_match format
                 best_match = {'recording': data['recording'], 'confidence': data.get('confidence', 0)}
             else:
-                self.logger.warning(f"Format de données MusicBrainz non reconnu: {list(data.keys()) if isinstance(data, dict) else type(data)}")
+                self.logger.warning("Format de données MusicBrainz non reconnu: %s", list(data.keys()) if isinstance(data, dict) else type(data))
                 return {'status': 'failed', 'error': 'Format de données MusicBrainz non reconnu'}
         
         # Vérifier que best_match est valide
@@ -584,7 +962,7 @@ class AudioFingerprinter:
         if 'best_match' in data and data['best_match']:
             confidence = data['best_match'].get('confidence', 0)
         
-        self.logger.info(f"✅ MusicBrainz: {formatted_metadata['artist']} - {formatted_metadata['title']}")
+        self.logger.info("✅ MusicBrainz: %s - %s", formatted_metadata['artist'], formatted_metadata['title'])
         
         return {
             'status': 'musicbrainz_success',
@@ -592,15 +970,15 @@ class AudioFingerprinter:
             'musicbrainz_id': formatted_metadata.get('musicbrainz_id', ''),
             'confidence': confidence,
             'updates': formatted_metadata,
-            'source': 'musicbrainz_text_search'
+            'source': best_match.get('source', 'musicbrainz_text_search')
         }
     
     def _format_updates(self, metadata):
         """Format les métadonnées pour mise à jour"""
         return {
             'title': metadata.get('title', ''),
-            'artist': metadata.get('artists', [{}])[0].get('name', ''),
-            'album': metadata.get('release', {}).get('title', '')
+            'artist': _first_artist_name(metadata),
+            'album': (metadata.get('release') or _EMPTY_DICT).get('title', '')
         }
     
     @timer
@@ -611,7 +989,7 @@ class AudioFingerprinter:
     def _get_fingerprint_core(self, file_path):
         """Logique core du fingerprint (sans cache)"""
         # Méthode directe avec pyacoustid
-        duration, fingerprint = fingerprint_file(file_path)
+        duration, fingerprint = fingerprint_file(file_path, maxlength=self._analysis_length)
         
         return {
             'duration': duration,
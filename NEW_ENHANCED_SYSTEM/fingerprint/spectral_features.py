@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Extraction rapide des caractéristiques spectrales (MFCC, centroïde, tempo)
+Remplace librosa.feature.* dans le fallback spectral par un noyau fusionné
+spectre de puissance → mel → log → DCT, compilé par Numba si disponible
+"""
+
+import functools
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Paramètres d'analyse (valeurs par défaut de librosa)
+N_FFT = 2048
+HOP_LENGTH = 512
+N_MELS = 128
+N_MFCC = 13
+TOP_DB = 80.0
+
+# Plage de tempo recherchée (BPM) et tempo a priori (départage les multiples
+# de la période, comme le prior log-normal de librosa.beat)
+MIN_TEMPO = 60.0
+MAX_TEMPO = 200.0
+START_BPM = 120.0
+
+
+def _hz_to_mel(freqs):
+    """Conversion Hz → mel (échelle de Slaney, comme librosa par défaut)"""
+    freqs = np.asarray(freqs, dtype=np.float64)
+    f_sp = 200.0 / 3
+    min_log_hz = 1000.0
+    min_log_mel = min_log_hz / f_sp
+    logstep = np.log(6.4) / 27.0
+    return np.where(
+        freqs >= min_log_hz,
+        min_log_mel + np.log(np.maximum(freqs, min_log_hz) / min_log_hz) / logstep,
+        freqs / f_sp
+    )
+
+
+def _mel_to_hz(mels):
+    """Conversion mel → Hz (inverse de _hz_to_mel)"""
+    mels = np.asarray(mels, dtype=np.float64)
+    f_sp = 200.0 / 3
+    min_log_hz = 1000.0
+    min_log_mel = min_log_hz / f_sp
+    logstep = np.log(6.4) / 27.0
+    return np.where(
+        mels >= min_log_mel,
+        min_log_hz * np.exp(logstep * (mels - min_log_mel)),
+        f_sp * mels
+    )
+
+
+def _frozen(array):
+    """Marque un tableau en lecture seule (partagé entre appels via le cache)"""
+    array.flags.writeable = False
+    return array
+
+
+@functools.lru_cache(maxsize=8)
+def mel_filterbank(sr, n_fft, n_mels):
+    """Banc de filtres mel triangulaires normalisés (norm='slaney'), forme (n_mels, n_fft // 2 + 1)
+
+    Mis en cache par (sr, n_fft, n_mels) : les fichiers d'une même bibliothèque
+    partagent quelques fréquences d'échantillonnage.
+    """
+    fft_freqs = np.fft.rfftfreq(n_fft, 1.0 / sr)
+    mel_freqs = _mel_to_hz(np.linspace(_hz_to_mel(0.0), _hz_to_mel(sr / 2.0), n_mels + 2))
+
+    fdiff = np.diff(mel_freqs)
+    ramps = mel_freqs[:, None] - fft_freqs[None, :]
+    lower = -ramps[:-2] / fdiff[:-1, None]
+    upper = ramps[2:] / fdiff[1:, None]
+    weights = np.maximum(0.0, np.minimum(lower, upper))
+
+    # Normalisation de Slaney : énergie constante par bande
+    weights *= (2.0 / (mel_freqs[2:n_mels + 2] - mel_freqs[:n_mels]))[:, None]
+    return _frozen(weights.astype(np.float32))
+
+
+@functools.lru_cache(maxsize=4)
+def dct_matrix(n_mfcc, n_mels):
+    """Matrice de DCT-II orthonormée, forme (n_mfcc, n_mels), mise en cache"""
+    n = np.arange(n_mels)
+    k = np.arange(n_mfcc)[:, None]
+    basis = np.cos(np.pi / n_mels * (n + 0.5) * k) * np.sqrt(2.0 / n_mels)
+    basis[0] /= np.sqrt(2.0)
+    return _frozen(basis.astype(np.float32))
+
+
+@functools.lru_cache(maxsize=4)
+def _hann_window(n_fft):
+    """Fenêtre de Hann float32, mise en cache"""
+    return _frozen(np.hanning(n_fft).astype(np.float32))
+
+
+@functools.lru_cache(maxsize=8)
+def _fft_frequencies(sr, n_fft):
+    """Fréquences centrales des bins de la FFT réelle, mises en cache"""
+    return _frozen(np.fft.rfftfreq(n_fft, 1.0 / sr).astype(np.float32))
+
+
+def _power_spectrogram(y, n_fft, hop_length):
+    """Spectre de puissance des trames fenêtrées (Hann), forme (n_trames, n_fft // 2 + 1)
+
+    Une seule FFT NumPy sur toutes les trames à la fois.
+    """
+    if len(y) < n_fft:
+        y = np.pad(y, (0, n_fft - len(y)))
+    frames = np.lib.stride_tricks.sliding_window_view(y, n_fft)[::hop_length]
+    spectrum = np.fft.rfft(frames * _hann_window(n_fft), axis=1)
+    return (spectrum.real ** 2 + spectrum.imag ** 2).astype(np.float32)
+
+
+def _spectral_kernel_numpy(power, freqs, mel_fb, dct_mat, top_db):
+    """Version NumPy vectorisée du noyau (sans Numba)
+
+    Returns:
+        tuple: (MFCC moyens, centroïde moyen, enveloppe d'attaque par trame)
+    """
+    magnitude = np.sqrt(power)
+    total = magnitude.sum(axis=1)
+    centroids = np.divide(magnitude @ freqs, total, out=np.zeros_like(total), where=total > 0)
+
+    log_mel = 10.0 * np.log10(np.maximum(power @ mel_fb.T, 1e-10))
+    log_mel = np.maximum(log_mel, log_mel.max() - top_db)
+
+    mfcc = log_mel @ dct_mat.T
+    onset = np.zeros(len(log_mel), dtype=np.float32)
+    onset[1:] = np.maximum(np.diff(log_mel, axis=0), 0.0).sum(axis=1)
+    return mfcc.mean(axis=0), float(centroids.mean()), onset
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _spectral_kernel_numba(power, freqs, mel_fb, dct_mat, top_db):
+        """Noyau fusionné : centroïde, énergies mel en dB, DCT et enveloppe d'attaque
+
+        Trames traitées en parallèle, sans matrice intermédiaire autre que les
+        énergies mel.
+        """
+        n_frames, n_bins = power.shape
+        n_mels = mel_fb.shape[0]
+        n_mfcc = dct_mat.shape[0]
+
+        centroids = np.zeros(n_frames)
+        log_mel = np.empty((n_frames, n_mels))
+        for t in prange(n_frames):
+            total = 0.0
+            weighted = 0.0
+            for f in range(n_bins):
+                magnitude = np.sqrt(power[t, f])
+                total += magnitude
+                weighted += magnitude * freqs[f]
+            if total > 0:
+                centroids[t] = weighted / total
+            for m in range(n_mels):
+                energy = 0.0
+                for f in range(n_bins):
+                    energy += mel_fb[m, f] * power[t, f]
+                log_mel[t, m] = 10.0 * np.log10(max(energy, 1e-10))
+
+        floor = log_mel.max() - top_db
+        mfcc = np.zeros((n_frames, n_mfcc))
+        onset = np.zeros(n_frames, dtype=np.float32)
+        for t in prange(n_frames):
+            for m in range(n_mels):
+                value = max(log_mel[t, m], floor)
+                for c in range(n_mfcc):
+                    mfcc[t, c] += dct_mat[c, m] * value
+                if t > 0:
+                    onset[t] += max(value - max(log_mel[t - 1, m], floor), 0.0)
+
+        mfcc_mean = np.zeros(n_mfcc)
+        for c in range(n_mfcc):
+            mfcc_mean[c] = mfcc[:, c].mean()
+        return mfcc_mean, centroids.mean(), onset
+
+    _spectral_kernel = _spectral_kernel_numba
+else:
+    _spectral_kernel = _spectral_kernel_numpy
+
+
+def _estimate_tempo(onset, sr, hop_length):
+    """Tempo (BPM) par autocorrélation de l'enveloppe d'attaque entre MIN_TEMPO et MAX_TEMPO
+
+    L'autocorrélation est pondérée par un prior log-normal (un octave d'écart
+    type) centré sur START_BPM.
+    """
+    onset = onset - onset.mean()
+    if not onset.any():
+        return 0.0
+
+    n = len(onset)
+    spectrum = np.fft.rfft(onset, 2 * n)
+    autocorr = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2)[:n]
+
+    frames_per_minute = 60.0 * sr / hop_length
+    min_lag = max(1, int(frames_per_minute / MAX_TEMPO))
+    max_lag = min(n - 1, int(frames_per_minute / MIN_TEMPO))
+    if max_lag <= min_lag:
+        return 0.0
+
+    lags = np.arange(min_lag, max_lag + 1)
+    prior = np.exp(-0.5 * np.log2(frames_per_minute / lags / START_BPM) ** 2)
+    lag = lags[int(np.argmax(autocorr[min_lag:max_lag + 1] * prior))]
+    return float(frames_per_minute / lag)
+
+
+def extract_spectral_features(y, sr, n_fft=N_FFT, hop_length=HOP_LENGTH,
+                              n_mels=N_MELS, n_mfcc=N_MFCC):
+    """Calcule MFCC moyens, centroïde spectral moyen et tempo d'un signal mono
+
+    Args:
+        y: Signal mono (float32)
+        sr: Fréquence d'échantillonnage
+
+    Returns:
+        tuple: (MFCC moyens (np.ndarray), centroïde moyen en Hz, tempo en BPM)
+    """
+    y = np.ascontiguousarray(y, dtype=np.float32)
+    power = _power_spectrogram(y, n_fft, hop_length)
+    mfcc_mean, centroid_mean, onset = _spectral_kernel(
+        power, _fft_frequencies(sr, n_fft), mel_filterbank(sr, n_fft, n_mels), dct_matrix(n_mfcc, n_mels), TOP_DB
+    )
+    return np.asarray(mfcc_mean), float(centroid_mean), _estimate_tempo(onset, sr, hop_length)
@@ -8,10 +8,21 @@ print("🔍 Debug: Début du module complete_music_gui.py")
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import threading
+import queue
+import hashlib
 import json
 import os
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+# orjson (optionnel) : lecture/écriture plus rapide des fichiers JSON de l'interface
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 print("🔍 Debug: Imports de base OK")
 
@@ -28,6 +39,51 @@ except ImportError as e:
 
 print("🔍 Debug: Configuration des imports terminée")
 
+# Scans gardés en mémoire (LRU), par (répertoire, mtime, filtre des corrompus)
+SCAN_CACHE_SIZE = 8
+# Scans conservés sur disque d'une session à l'autre (un fichier par répertoire)
+SCAN_CACHE_FILES = 32
+# Lignes réellement présentes dans la liste des fichiers (fenêtre glissante
+# sur la liste complète, recentrée pendant le défilement)
+FILES_TREE_WINDOW = 500
+# Événements des threads d'analyse : période de vidage (ms) et nombre max par passage
+EVENT_DRAIN_INTERVAL = 50
+EVENT_DRAIN_BATCH = 200
+# Console de logs : lignes conservées, élaguée dès qu'elle dépasse STATUS_LOG_TRIM_AT
+STATUS_LOG_MAX_LINES = 500
+STATUS_LOG_TRIM_AT = 600
+# Délai d'inactivité (ms) avant d'appliquer les seuils modifiés au curseur
+THRESHOLD_DEBOUNCE_MS = 150
+# Période (ms) d'insertion groupée des lignes de l'arbre des résultats
+RESULTS_FLUSH_INTERVAL = 100
+# Délai d'inactivité (ms) avant la sauvegarde automatique des paramètres
+SETTINGS_SAVE_DELAY_MS = 500
+
+# Icônes des statuts et méthodes d'analyse (listes et fenêtres de détail)
+_STATUS_ICONS = {
+    AnalysisStatus.SUCCESS: "✅",
+    AnalysisStatus.PARTIAL_SUCCESS: "⚠️",
+    AnalysisStatus.FAILED: "❌",
+    AnalysisStatus.MANUAL_REVIEW: "🔍",
+    AnalysisStatus.CACHED: "💾"
+}
+_METHOD_ICONS = {
+    AnalysisMethod.ACOUSTICID: "🎧",
+    AnalysisMethod.SPECTRAL: "📊",
+    AnalysisMethod.MUSICBRAINZ: "🎼",
+    AnalysisMethod.METADATA_EXTRACTION: "🏷️"
+}
+
+
+def _format_file_rows(files: List[Tuple[str, int]]) -> List[Tuple[str, str]]:
+    """Colonnes Nom et Taille de la liste des fichiers, pré-formatées
+    
+    Appelée dans le thread de scan pour que le thread Tk n'ait plus qu'à insérer.
+    """
+    return [(os.path.basename(file_path), f"{file_size / 1048576:.1f} MB")
+            for file_path, file_size in files]
+
+
 class CompleteMusicManagerGUI:
     """Interface utilisateur complète avec toutes les fonctionnalités"""
     
@@ -49,6 +105,7 @@ class CompleteMusicManagerGUI:
         self.acoustid_threshold = tk.DoubleVar(value=0.85)
         self.musicbrainz_threshold = tk.DoubleVar(value=0.70)
         self.spectral_threshold = tk.DoubleVar(value=0.70)
+        self._threshold_after_id = None  # Application différée des seuils
         
         # Options avancées
         self.skip_corrupted = tk.BooleanVar(value=False)  # Désactivé par défaut pour éviter les faux positifs
@@ -61,19 +118,46 @@ class CompleteMusicManagerGUI:
         self.enable_musicbrainz = tk.BooleanVar(value=True)
         self.enable_metadata = tk.BooleanVar(value=True)
         
-        # Variables pour les labels des seuils
-        self.acoustid_label = tk.StringVar()
-        self.musicbrainz_label = tk.StringVar()
-        self.spectral_label = tk.StringVar()
-        
         # État de sélection des fichiers
-        self.file_checkboxes = {}  # item_id -> BooleanVar
-        self.file_paths_map = {}   # item_id -> file_path
+        # La liste complète reste en mémoire ; la Treeview n'en affiche qu'une
+        # fenêtre de FILES_TREE_WINDOW lignes, d'item_id str(index)
+        self._all_files = []       # [(chemin, taille), ...]
+        self._file_rows = []       # [(nom, taille formatée), ...] en parallèle
+        self._file_index = {}      # chemin -> index
+        self._file_status = {}     # index -> texte de la colonne Statut
+        self.selected_items = set()  # index cochés
+        self._files_offset = 0     # index de la première ligne affichée
+        self._files_rendered = 0   # nombre de lignes affichées
+        self._files_refill_pending = False
         self.current_files = []
         self.current_results = []
+        self._results_by_filename = {}  # nom de fichier -> résultat (premier du nom)
+        self._pending_results = []  # Lignes en attente d'insertion dans results_tree
+        self._last_stats = None  # Dernières statistiques affichées
+        self._results_flush_job = None
+        
+        # Passerelle scan → interface : le thread de scan dépose les lots dans
+        # la file et prévient le thread Tk par un événement virtuel
+        self.scan_queue = queue.Queue()
+        self._scan_generation = 0  # Écarte les lots d'un scan précédent
+        self.root.bind('<<ScanChunk>>', self._on_scan_chunk)
+        self.root.bind('<<ScanDone>>', self._on_scan_done)
+        
+        # Passerelle analyse → interface : les callbacks de l'adaptateur (appelés
+        # depuis ses threads) déposent leurs événements ici ; le thread Tk les
+        # vide périodiquement par lots
+        self._event_q = queue.Queue()
+        
+        # Résultats des derniers scans : clé -> [(chemin, taille), ...]
+        self._scan_cache = OrderedDict()
+        self._scan_cache_lock = threading.Lock()
         
         # Configuration
         self.config_file = Path("config/ui_settings.json")
+        self._save_job = None  # Sauvegarde automatique programmée (id root.after)
+        self._last_settings_hash = None  # Empreinte du contenu actuel du fichier
+        # Derniers scans, conservés d'une session à l'autre (un fichier par répertoire)
+        self.scan_cache_dir = Path("config/scan_cache")
         
         # Charger les paramètres sauvegardés
         self.load_settings()
@@ -100,6 +184,8 @@ class CompleteMusicManagerGUI:
         # Configurer la fermeture propre
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
+        self.root.after(EVENT_DRAIN_INTERVAL, self._drain_events)
+        
     def setup_ui(self):
         """Configure l'interface utilisateur complète"""
         
@@ -117,20 +203,45 @@ class CompleteMusicManagerGUI:
         notebook.add(analysis_frame, text="🔍 Analyse")
         self.setup_analysis_tab(analysis_frame)
         
+        # Les onglets suivants ne sont construits qu'à leur première ouverture
+        # (ou quand leurs widgets deviennent nécessaires, cf. _ensure_tab)
+        
         # Onglet Résultats
         results_frame = ttk.Frame(notebook)
         notebook.add(results_frame, text="📊 Résultats")
-        self.setup_results_tab(results_frame)
         
         # Onglet Options Avancées
         advanced_frame = ttk.Frame(notebook)
         notebook.add(advanced_frame, text="🔧 Options Avancées")
-        self.setup_advanced_tab(advanced_frame)
         
         # Onglet Statistiques
         stats_frame = ttk.Frame(notebook)
         notebook.add(stats_frame, text="📈 Statistiques")
-        self.setup_stats_tab(stats_frame)
+        
+        self._tab_frames = {'results': results_frame, 'advanced': advanced_frame, 'stats': stats_frame}
+        self._tab_builders = {
+            'results': self.setup_results_tab,
+            'advanced': self.setup_advanced_tab,
+            'stats': self.setup_stats_tab
+        }
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+    
+    def _on_tab_changed(self, event):
+        """Construit l'onglet affiché s'il ne l'a pas encore été"""
+        selected = event.widget.select()
+        for key, frame in self._tab_frames.items():
+            if str(frame) == selected:
+                self._ensure_tab(key)
+                break
+    
+    def _ensure_tab(self, key: str):
+        """Construit l'onglet `key` ('results', 'advanced', 'stats') à la première demande"""
+        builder = self._tab_builders.pop(key, None)
+        if builder is None:
+            return
+        builder(self._tab_frames[key])
+        if key == 'stats':
+            self.update_statistics()
     
     def setup_config_tab(self, parent):
         """Onglet de configuration"""
@@ -163,22 +274,23 @@ class CompleteMusicManagerGUI:
         thresholds_group.pack(fill='x', padx=10, pady=10)
         
         # AcoustID
-        self.acoustid_label.set(f"AcoustID (recommandé: 0.85): {self.acoustid_threshold.get():.2f}")
-        ttk.Label(thresholds_group, textvariable=self.acoustid_label).pack(anchor='w')
+        # Label mis à jour directement (configure) plutôt que via une StringVar
+        self.acoustid_label_widget = ttk.Label(thresholds_group, text=f"AcoustID (recommandé: 0.85): {self.acoustid_threshold.get():.2f}")
+        self.acoustid_label_widget.pack(anchor='w')
         acoustid_scale = ttk.Scale(thresholds_group, from_=0.5, to=1.0, variable=self.acoustid_threshold,
                  orient='horizontal', command=self.on_acoustid_change)
         acoustid_scale.pack(fill='x', pady=2)
         
         # Spectral
-        self.spectral_label.set(f"Analyse Spectrale (recommandé: 0.70): {self.spectral_threshold.get():.2f}")
-        ttk.Label(thresholds_group, textvariable=self.spectral_label).pack(anchor='w')
+        self.spectral_label_widget = ttk.Label(thresholds_group, text=f"Analyse Spectrale (recommandé: 0.70): {self.spectral_threshold.get():.2f}")
+        self.spectral_label_widget.pack(anchor='w')
         spectral_scale = ttk.Scale(thresholds_group, from_=0.5, to=1.0, variable=self.spectral_threshold,
                  orient='horizontal', command=self.on_spectral_change)
         spectral_scale.pack(fill='x', pady=2)
         
         # MusicBrainz
-        self.musicbrainz_label.set(f"MusicBrainz (recommandé: 0.70): {self.musicbrainz_threshold.get():.2f}")
-        ttk.Label(thresholds_group, textvariable=self.musicbrainz_label).pack(anchor='w')
+        self.musicbrainz_label_widget = ttk.Label(thresholds_group, text=f"MusicBrainz (recommandé: 0.70): {self.musicbrainz_threshold.get():.2f}")
+        self.musicbrainz_label_widget.pack(anchor='w')
         musicbrainz_scale = ttk.Scale(thresholds_group, from_=0.5, to=1.0, variable=self.musicbrainz_threshold,
                  orient='horizontal', command=self.on_musicbrainz_change)
         musicbrainz_scale.pack(fill='x', pady=2)
@@ -200,11 +312,17 @@ class CompleteMusicManagerGUI:
         
         ttk.Button(controls_row1, text="🔍 Scanner Répertoire", 
                   command=self.scan_directory).pack(side='left', padx=5)
+        ttk.Button(controls_row1, text="🔄 Forcer le Rescan", 
+                  command=lambda: self.scan_directory(force=True)).pack(side='left', padx=5)
         ttk.Button(controls_row1, text="☑️ Tout Sélectionner", 
                   command=self.select_all_files).pack(side='left', padx=5)
         ttk.Button(controls_row1, text="☐ Tout Désélectionner", 
                   command=self.clear_all_selection).pack(side='left', padx=5)
         
+        # Compteur de sélection (tenu à jour sans parcourir la liste)
+        self.counts_var = tk.StringVar(value="0/0 sélectionnés")
+        ttk.Label(controls_row1, textvariable=self.counts_var).pack(side='right', padx=5)
+        
         # Ligne 2: Traitement
         controls_row2 = ttk.Frame(controls_frame)
         controls_row2.pack(fill='x', pady=2)
@@ -232,13 +350,16 @@ class CompleteMusicManagerGUI:
             self.files_tree.heading(col, text=col)
             self.files_tree.column(col, width=150)
         
-        # Scrollbars
-        v_scroll = ttk.Scrollbar(files_list_frame, orient='vertical', command=self.files_tree.yview)
+        # Scrollbars (la verticale couvre la liste complète, pas seulement la fenêtre affichée)
+        v_scroll = ttk.Scrollbar(files_list_frame, orient='vertical', command=self._on_files_scrollbar)
         h_scroll = ttk.Scrollbar(files_list_frame, orient='horizontal', command=self.files_tree.xview)
-        self.files_tree.configure(yscrollcommand=v_scroll.set, xscrollcommand=h_scroll.set)
+        self.files_tree.configure(yscrollcommand=self._on_files_yview, xscrollcommand=h_scroll.set)
+        self.files_v_scroll = v_scroll
         
-        # Bind pour les clicks sur les cases à cocher
+        # Bind pour les clicks sur les cases à cocher, et Espace pour basculer
+        # les lignes sélectionnées au clavier
         self.files_tree.bind('<Button-1>', self.on_file_click)
+        self.files_tree.bind('<space>', self.on_file_space)
         
         # Pack treeview et scrollbars
         self.files_tree.pack(side='left', fill='both', expand=True)
@@ -429,21 +550,33 @@ class CompleteMusicManagerGUI:
     
     def on_acoustid_change(self, value):
         """Callback pour le changement du seuil AcoustID"""
-        val = float(value)
-        self.acoustid_label.set(f"AcoustID (recommandé: 0.85): {val:.2f}")
-        self.adapter.configure_thresholds(acousticid_threshold=val)
+        self.acoustid_label_widget.configure(text=f"AcoustID (recommandé: 0.85): {float(value):.2f}")
+        self._schedule_threshold_update()
     
     def on_musicbrainz_change(self, value):
         """Callback pour le changement du seuil MusicBrainz"""
-        val = float(value)
-        self.musicbrainz_label.set(f"MusicBrainz (recommandé: 0.70): {val:.2f}")
-        self.adapter.configure_thresholds(musicbrainz_threshold=val)
+        self.musicbrainz_label_widget.configure(text=f"MusicBrainz (recommandé: 0.70): {float(value):.2f}")
+        self._schedule_threshold_update()
     
     def on_spectral_change(self, value):
         """Callback pour le changement du seuil Spectral"""
-        val = float(value)
-        self.spectral_label.set(f"Analyse Spectrale (recommandé: 0.70): {val:.2f}")
-        self.adapter.configure_thresholds(spectral_threshold=val)
+        self.spectral_label_widget.configure(text=f"Analyse Spectrale (recommandé: 0.70): {float(value):.2f}")
+        self._schedule_threshold_update()
+    
+    def _schedule_threshold_update(self):
+        """(Re)programme l'application des seuils après THRESHOLD_DEBOUNCE_MS d'inactivité"""
+        if self._threshold_after_id is not None:
+            self.root.after_cancel(self._threshold_after_id)
+        self._threshold_after_id = self.root.after(THRESHOLD_DEBOUNCE_MS, self._flush_thresholds)
+    
+    def _flush_thresholds(self):
+        """Applique les trois seuils en un seul appel à l'adaptateur"""
+        self._threshold_after_id = None
+        self.adapter.configure_thresholds(
+            acousticid_threshold=self.acoustid_threshold.get(),
+            spectral_threshold=self.spectral_threshold.get(),
+            musicbrainz_threshold=self.musicbrainz_threshold.get()
+        )
     
     def select_source_directory(self):
         """Sélectionne le répertoire source"""
@@ -451,131 +584,406 @@ class CompleteMusicManagerGUI:
         if directory:
             self.source_directory.set(directory)
     
-    def scan_directory(self):
-        """Scanne le répertoire pour trouver les fichiers audio"""
+    def _scan_cache_key(self, directory):
+        """Clé du cache de scan, ou None si le répertoire est illisible
+        
+        Le mtime du répertoire change quand une entrée y est ajoutée, renommée
+        ou supprimée ; une modification plus profonde demande un rescan forcé.
+        """
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+        return (os.path.abspath(directory), mtime_ns, self.adapter.skip_corrupted_files)
+    
+    def scan_directory(self, force: bool = False):
+        """Scanne le répertoire pour trouver les fichiers audio
+        
+        Args:
+            force: Ignorer le résultat en cache et reparcourir le répertoire
+        """
         directory = self.source_directory.get()
         if not directory:
             messagebox.showwarning("⚠️ Attention", "Veuillez d'abord sélectionner un répertoire")
             return
         
-        # Scanner dans un thread séparé
+        self._scan_generation += 1
+        generation = self._scan_generation
+        
+        # Répertoire inchangé depuis un scan de cette session : réutiliser sa
+        # liste (le cache disque des sessions précédentes est lu par le thread de scan)
+        cache_key = self._scan_cache_key(directory)
+        with self._scan_cache_lock:
+            if force:
+                self._scan_cache.pop(cache_key, None)
+            cached_files = self._scan_cache.get(cache_key)
+            if cached_files is not None:
+                self._scan_cache.move_to_end(cache_key)
+        if cached_files is not None:
+            self.populate_files_list(cached_files)
+            self.on_status_update("💾 Liste des fichiers reprise du scan précédent")
+            return
+        
+        self.clear_files_list()
+        
+        # Scanner dans un thread séparé (l'adaptateur parallélise par sous-dossier) ;
+        # chaque lot de fichiers est transmis au thread Tk au fil du scan, avec
+        # ses lignes déjà formatées
+        def on_batch(batch):
+            self.scan_queue.put((generation, (batch, _format_file_rows(batch))))
+            self.root.event_generate('<<ScanChunk>>', when='tail')
+        
         def scan_worker():
-            files = self.adapter.scan_directory(directory)
-            # Mettre à jour l'interface dans le thread principal
-            self.root.after(0, lambda: self.populate_files_list(files))
+            try:
+                files = None
+                if cache_key is not None and not force:
+                    files = self._load_persisted_scan(cache_key)
+                    if files is not None:
+                        on_batch(files)
+                        self.on_status_update("💾 Liste des fichiers reprise du scan précédent")
+                if files is None:
+                    files = self.adapter.scan_directory(directory, on_batch=on_batch)
+                    if cache_key is not None:
+                        self._persist_scan(cache_key, files)
+                if cache_key is not None:
+                    with self._scan_cache_lock:
+                        self._remember_scan(cache_key, files)
+            finally:
+                self.scan_queue.put((generation, None))  # Fin du scan
+                self.root.event_generate('<<ScanDone>>', when='tail')
         
         threading.Thread(target=scan_worker, daemon=True).start()
     
-    def populate_files_list(self, files: List[str]):
-        """Remplit la liste des fichiers avec cases à cocher"""
-        # Vider la liste actuelle
-        for item in self.files_tree.get_children():
-            self.files_tree.delete(item)
-        
-        # Vider les mappings
-        self.file_paths_map.clear()
-        self.file_checkboxes.clear()
-        
-        self.current_files = files
+    def _remember_scan(self, cache_key, files):
+        """Ajoute un scan au cache LRU en mémoire (appelé sous _scan_cache_lock)"""
+        self._scan_cache[cache_key] = files
+        self._scan_cache.move_to_end(cache_key)
+        while len(self._scan_cache) > SCAN_CACHE_SIZE:
+            self._scan_cache.popitem(last=False)
+    
+    def _scan_cache_path(self, directory) -> Path:
+        """Fichier de cache du scan d'un répertoire (nommé par un hash du chemin absolu)"""
+        digest = hashlib.blake2b(directory.encode('utf-8'), digest_size=16).hexdigest()
+        return self.scan_cache_dir / f"{digest}.json"
+    
+    def _load_persisted_scan(self, cache_key):
+        """Liste sauvegardée par une session précédente si le répertoire n'a pas changé
+        
+        Appelé depuis le thread de scan : seul le fichier de ce répertoire est lu.
+        """
+        directory, mtime_ns, skip_corrupted = cache_key
+        cache_path = self._scan_cache_path(directory)
+        try:
+            if ORJSON_AVAILABLE:
+                with open(cache_path, 'rb') as f:
+                    entry = orjson.loads(f.read())
+            else:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(entry, dict)
+                or entry.get('directory') != directory
+                or entry.get('mtime_ns') != mtime_ns
+                or entry.get('skip_corrupted') != skip_corrupted):
+            return None
+        try:
+            return [(path, int(size)) for path, size in entry['files']]
+        except (KeyError, TypeError, ValueError):
+            return None
+    
+    def _persist_scan(self, cache_key, files):
+        """Sauvegarde un scan dans le fichier de son répertoire (écriture atomique via fichier temporaire)
+        
+        Appelé depuis le thread de scan ; seuls les SCAN_CACHE_FILES fichiers les
+        plus récents sont conservés.
+        """
+        directory, mtime_ns, skip_corrupted = cache_key
+        data = {
+            'directory': directory,
+            'mtime_ns': mtime_ns,
+            'skip_corrupted': skip_corrupted,
+            'files': [[path, size] for path, size in files]
+        }
         
-        # Ajouter les nouveaux fichiers
-        for file_path in files:
-            file_path_obj = Path(file_path)
+        cache_path = self._scan_cache_path(directory)
+        tmp_path = cache_path.with_suffix(f'.{threading.get_ident()}.tmp')
+        try:
+            self.scan_cache_dir.mkdir(parents=True, exist_ok=True)
+            if ORJSON_AVAILABLE:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(data))
+            else:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+            self._prune_scan_cache()
+        except OSError as e:
+            print(f"❌ Erreur lors de la sauvegarde du cache de scan: {e}")
+    
+    def _prune_scan_cache(self):
+        """Supprime les fichiers de cache de scan au-delà des SCAN_CACHE_FILES plus récents"""
+        with os.scandir(self.scan_cache_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith('.json')]
+        if len(entries) <= SCAN_CACHE_FILES:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+        for entry in entries[SCAN_CACHE_FILES:]:
             try:
-                file_size = file_path_obj.stat().st_size
-                size_str = f"{file_size / 1024 / 1024:.1f} MB"
-            except:
-                size_str = "Inconnu"
-            
-            # Créer une variable pour la case à cocher
-            checkbox_var = tk.BooleanVar(value=True)  # Sélectionné par défaut
-            
-            item = self.files_tree.insert('', 'end', values=(
-                '☑️',  # Case cochée par défaut
-                file_path_obj.name,
-                size_str,
-                'En attente'
-            ))
-            
-            # Stocker les mappings
-            self.file_paths_map[item] = file_path
-            self.file_checkboxes[item] = checkbox_var
-            
-            # Ajouter à la sélection de l'adaptateur
-            self.adapter.set_file_selection(file_path, True)
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass  # Déjà supprimé par un autre scan
+    
+    def _drain_scan_queue(self):
+        """Ajoute à la liste les lots déjà reçus du scan en cours
         
-        # Afficher un résumé
-        if files:
-            self.on_status_update(f"📁 {len(files)} fichiers audio trouvés et sélectionnés")
+        Returns:
+            bool: True si la fin du scan a été reçue
+        """
+        done = False
+        while True:
+            try:
+                generation, batch = self.scan_queue.get_nowait()  # batch : (fichiers, lignes)
+            except queue.Empty:
+                return done
+            if generation != self._scan_generation:
+                continue
+            if batch is None:
+                done = True
+            else:
+                self._append_files(*batch)
+    
+    def _on_scan_chunk(self, event=None):
+        """<<ScanChunk>> : nouveaux fichiers trouvés par le scan"""
+        if self._drain_scan_queue():
+            self._report_files_found()
+    
+    def _on_scan_done(self, event=None):
+        """<<ScanDone>> : fin du scan (les lots restants sont ajoutés d'abord)"""
+        self._on_scan_chunk()
+    
+    def clear_files_list(self):
+        """Vide la liste des fichiers et les mappings associés"""
+        self.files_tree.delete(*self.files_tree.get_children())
+        
+        self._all_files = []
+        self._file_rows = []
+        self._file_index.clear()
+        self._file_status.clear()
+        self.selected_items.clear()
+        self._files_offset = 0
+        self._files_rendered = 0
+        self.current_files = []
+        self.files_v_scroll.set(0.0, 1.0)
+        self._update_counts_label()
+        self.adapter.clear_selection()
+    
+    def populate_files_list(self, files: List[Tuple[str, int]]):
+        """Remplit la liste des fichiers avec cases à cocher
+        
+        Args:
+            files: (chemin, taille en octets) tels que renvoyés par adapter.scan_directory
+        """
+        self.clear_files_list()
+        self._append_files(files)
+        self._report_files_found()
+    
+    def _append_files(self, files: List[Tuple[str, int]], rows: Optional[List[Tuple[str, str]]] = None):
+        """Ajoute des fichiers à la fin de la liste, sélectionnés par défaut
+        
+        Args:
+            files: (chemin, taille en octets)
+            rows: Colonnes déjà formatées par _format_file_rows (calculées ici sinon)
+        """
+        start = len(self._all_files)
+        self._all_files.extend(files)
+        self._file_rows.extend(rows if rows is not None else _format_file_rows(files))
+        self.current_files.extend(file_path for file_path, _ in files)
+        for index in range(start, len(self._all_files)):
+            self._file_index[self._all_files[index][0]] = index
+        self.selected_items.update(range(start, len(self._all_files)))  # Sélectionnés par défaut
+        
+        # Seules les lignes qui tombent dans la fenêtre affichée sont insérées
+        window_end = min(len(self._all_files), self._files_offset + FILES_TREE_WINDOW)
+        for index in range(self._files_offset + self._files_rendered, window_end):
+            self._insert_file_row(index)
+        self._files_rendered = window_end - self._files_offset
+        self._update_files_scrollbar()
+        self._update_counts_label()
+        
+        # Ajouter à la sélection de l'adaptateur en un seul appel
+        self.adapter.set_file_selections((file_path for file_path, _ in files), True)
+    
+    def _insert_file_row(self, index: int):
+        """Insère la ligne d'index `index` en fin de Treeview (colonnes pré-formatées)"""
+        name, size = self._file_rows[index]
+        self.files_tree.insert('', 'end', iid=str(index), values=(
+            '☑️' if index in self.selected_items else '☐',
+            name,
+            size,
+            self._file_status.get(index, 'En attente')
+        ))
+    
+    def _render_files_window(self, offset: int):
+        """Remplace les lignes affichées par la fenêtre commençant à `offset`"""
+        offset = max(0, min(offset, len(self._all_files) - FILES_TREE_WINDOW))
+        self.files_tree.delete(*self.files_tree.get_children())
+        self._files_offset = offset
+        window_end = min(len(self._all_files), offset + FILES_TREE_WINDOW)
+        for index in range(offset, window_end):
+            self._insert_file_row(index)
+        self._files_rendered = window_end - offset
+    
+    def _show_files_from(self, position: float):
+        """Fait défiler la liste pour que la ligne globale `position` soit en haut
+        
+        La fenêtre n'est recalculée que si la position sort des lignes affichées.
+        """
+        total = len(self._all_files)
+        if not total:
+            return
+        position = max(0.0, min(position, total - 1))
+        visible = self.files_tree.yview()
+        visible_rows = (visible[1] - visible[0]) * max(self._files_rendered, 1)
+        if (position < self._files_offset
+                or position + visible_rows > self._files_offset + self._files_rendered):
+            self._render_files_window(int(position - FILES_TREE_WINDOW / 2))
+        self.files_tree.yview_moveto((position - self._files_offset) / max(self._files_rendered, 1))
+    
+    def _on_files_scrollbar(self, action, *args):
+        """Commande de la scrollbar verticale, exprimée sur la liste complète"""
+        first, last = self.files_tree.yview()
+        visible_rows = (last - first) * max(self._files_rendered, 1)
+        top = self._files_offset + first * self._files_rendered
+        if action == 'moveto':
+            self._show_files_from(float(args[0]) * len(self._all_files))
+        elif action == 'scroll':
+            step = int(args[0]) * (max(int(visible_rows), 1) if args[1] == 'pages' else 1)
+            self._show_files_from(top + step)
+    
+    def _on_files_yview(self, first, last):
+        """yscrollcommand de la Treeview : met à jour la scrollbar globale
+        
+        Quand le défilement (molette, clavier) approche d'un bord de la fenêtre
+        affichée, la fenêtre est recentrée au prochain passage à vide.
+        """
+        first, last = float(first), float(last)
+        self._update_files_scrollbar(first, last)
+        near_top = first < 0.1 and self._files_offset > 0
+        near_bottom = last > 0.9 and self._files_offset + self._files_rendered < len(self._all_files)
+        if (near_top or near_bottom) and not self._files_refill_pending:
+            self._files_refill_pending = True
+            self.root.after_idle(self._refill_visible_window)
+    
+    def _refill_visible_window(self):
+        """Recentre la fenêtre affichée sur la position de défilement actuelle"""
+        self._files_refill_pending = False
+        first, _ = self.files_tree.yview()
+        top = self._files_offset + first * self._files_rendered
+        self._render_files_window(int(top - FILES_TREE_WINDOW / 2))
+        self.files_tree.yview_moveto((top - self._files_offset) / max(self._files_rendered, 1))
+    
+    def _update_files_scrollbar(self, first: float = None, last: float = None):
+        """Positionne la scrollbar verticale par rapport à la liste complète"""
+        total = len(self._all_files)
+        if not total:
+            self.files_v_scroll.set(0.0, 1.0)
+            return
+        if first is None:
+            first, last = self.files_tree.yview()
+        rendered = self._files_rendered
+        self.files_v_scroll.set(
+            (self._files_offset + first * rendered) / total,
+            (self._files_offset + last * rendered) / total
+        )
+    
+    def _report_files_found(self):
+        """Affiche le résumé du scan"""
+        if self.current_files:
+            self.on_status_update(f"📁 {len(self.current_files)} fichiers audio trouvés et sélectionnés")
         else:
             self.on_status_update("⚠️ Aucun fichier audio trouvé dans le répertoire")
     
     def on_file_click(self, event):
         """Gère les clics sur les cases à cocher des fichiers"""
-        # Déterminer où l'utilisateur a cliqué
-        item = self.files_tree.identify_row(event.y)
-        column = self.files_tree.identify_column(event.x)
+        # Seule la colonne de sélection nous intéresse : pas de recherche de
+        # ligne pour les autres clics
+        if self.files_tree.identify_column(event.x) != '#1':  # Première colonne (Sélection)
+            return
         
-        # Si clic sur la colonne de sélection
-        if item and column == '#1':  # Première colonne (Sélection)
+        item = self.files_tree.identify_row(event.y)
+        if item:
+            self.toggle_file_selection(item)
+    
+    def on_file_space(self, event):
+        """Bascule la case des lignes sélectionnées (touche Espace)"""
+        for item in self.files_tree.selection():
             self.toggle_file_selection(item)
+        return 'break'
     
     def toggle_file_selection(self, item):
         """Bascule la sélection d'un fichier"""
-        if item in self.file_checkboxes:
-            checkbox_var = self.file_checkboxes[item]
-            file_path = self.file_paths_map[item]
-            
-            # Basculer l'état
-            new_state = not checkbox_var.get()
-            checkbox_var.set(new_state)
-            
-            # Mettre à jour l'affichage
-            current_values = list(self.files_tree.item(item)['values'])
-            current_values[0] = '☑️' if new_state else '☐'
-            self.files_tree.item(item, values=current_values)
-            
-            # Mettre à jour la sélection dans l'adaptateur
-            self.adapter.set_file_selection(file_path, new_state)
+        index = int(item)
+        file_path = self._all_files[index][0]
+        
+        # Basculer l'état
+        new_state = index not in self.selected_items
+        if new_state:
+            self.selected_items.add(index)
+        else:
+            self.selected_items.discard(index)
+        
+        # Mettre à jour l'affichage
+        self.files_tree.set(item, 'Sélection', '☑️' if new_state else '☐')
+        self._update_counts_label()
+        
+        # Mettre à jour la sélection dans l'adaptateur
+        self.adapter.set_file_selection(file_path, new_state)
+    
+    def _update_counts_label(self):
+        """Affiche « sélectionnés/total » (comptes en O(1), un seul appel Tcl)"""
+        self.counts_var.set(f"{len(self.selected_items)}/{len(self._all_files)} sélectionnés")
+    
+    def _visible_file_indexes(self) -> range:
+        """Index des fichiers présents dans la Treeview"""
+        return range(self._files_offset, self._files_offset + self._files_rendered)
     
     def select_all_files(self):
         """Sélectionne tous les fichiers"""
-        for item in self.files_tree.get_children():
-            if item in self.file_checkboxes:
-                checkbox_var = self.file_checkboxes[item]
-                file_path = self.file_paths_map[item]
-                
-                checkbox_var.set(True)
-                
-                # Mettre à jour l'affichage
-                current_values = list(self.files_tree.item(item)['values'])
-                current_values[0] = '☑️'
-                self.files_tree.item(item, values=current_values)
-                
-                # Mettre à jour la sélection dans l'adaptateur
-                self.adapter.set_file_selection(file_path, True)
+        # Mettre à jour l'affichage : une cellule par ligne affichée qui change
+        # d'état, puis un seul rafraîchissement
+        for index in self._visible_file_indexes():
+            if index not in self.selected_items:
+                self.files_tree.set(str(index), 'Sélection', '☑️')
+        self.selected_items = set(range(len(self._all_files)))
+        self._update_counts_label()
+        self.files_tree.update_idletasks()
+        
+        # Mettre à jour la sélection dans l'adaptateur en un seul appel
+        self.adapter.set_file_selections(self.current_files, True)
         
         self.on_status_update("☑️ Tous les fichiers sélectionnés")
     
     def clear_all_selection(self):
         """Désélectionne tous les fichiers"""
-        for item in self.files_tree.get_children():
-            if item in self.file_checkboxes:
-                checkbox_var = self.file_checkboxes[item]
-                file_path = self.file_paths_map[item]
-                
-                checkbox_var.set(False)
-                
-                # Mettre à jour l'affichage
-                current_values = list(self.files_tree.item(item)['values'])
-                current_values[0] = '☐'
-                self.files_tree.item(item, values=current_values)
-                
-                # Mettre à jour la sélection dans l'adaptateur
-                self.adapter.set_file_selection(file_path, False)
+        # Mettre à jour l'affichage : une cellule par ligne affichée qui change
+        # d'état, puis un seul rafraîchissement
+        for index in self._visible_file_indexes():
+            if index in self.selected_items:
+                self.files_tree.set(str(index), 'Sélection', '☐')
+        self.selected_items.clear()
+        self._update_counts_label()
+        self.files_tree.update_idletasks()
+        
+        # Mettre à jour la sélection dans l'adaptateur en un seul appel
+        self.adapter.set_file_selections(self.current_files, False)
         
         self.on_status_update("☐ Tous les fichiers désélectionnés")
     
+    def get_selected_files(self) -> List[str]:
+        """Chemins des fichiers cochés, dans l'ordre de la liste"""
+        return [self.current_files[index] for index in sorted(self.selected_items)]
+    
     def start_analysis(self):
         """Démarre l'analyse des fichiers sélectionnés"""
         # Vérifications préliminaires
@@ -588,7 +996,7 @@ class CompleteMusicManagerGUI:
             return
         
         # Obtenir les fichiers sélectionnés
-        selected_files = self.adapter.get_selected_files()
+        selected_files = self.get_selected_files()
         
         if not selected_files:
             messagebox.showwarning("⚠️ Attention", "Aucun fichier sélectionné pour l'analyse")
@@ -598,9 +1006,11 @@ class CompleteMusicManagerGUI:
         self.progress_bar['maximum'] = len(selected_files)
         self.progress_bar['value'] = 0
         
-        # Vider les résultats précédents
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        # Vider les résultats précédents (si l'onglet a déjà été construit)
+        self._pending_results.clear()
+        if 'results' not in self._tab_builders:
+            for item in self.results_tree.get_children():
+                self.results_tree.delete(item)
         
         # Configuration des méthodes
         enable_methods = {
@@ -646,46 +1056,101 @@ class CompleteMusicManagerGUI:
         return selection_window.show()
     
     def on_progress_update(self, current: int, total: int, result):
-        """Callback de progression"""
-        # Mettre à jour la barre de progression
-        self.progress_bar['value'] = current
-        self.progress_var.set(f"Progression: {current}/{total} fichiers")
-        
-        # Mettre à jour le statut du fichier dans la liste
-        filename = Path(result.file_path).name
-        for item in self.files_tree.get_children():
-            if item in self.file_paths_map:
-                stored_path = self.file_paths_map[item]
-                if Path(stored_path).name == filename:
-                    status_icon = self.get_status_icon(result.status)
-                    current_values = list(self.files_tree.item(item)['values'])
-                    current_values[3] = f"{status_icon} {result.status.value}"
-                    self.files_tree.item(item, values=current_values)
-                    break
-        
-        # Ajouter aux résultats
-        self.add_result_to_tree(result)
+        """Callback de progression (thread d'analyse) : mis en file pour le thread Tk"""
+        self._event_q.put(('progress', (current, total, result)))
     
     def on_status_update(self, message: str, level: str = "INFO"):
-        """Callback de statut avec support des niveaux de log et filtrage"""
-        import time
-        
-        # Vérifier les filtres
-        if level == "SPECTRAL" and not self.show_spectral_logs.get():
-            return
-        if level == "API" and not self.show_api_logs.get():
-            return
-        if level in ["FINGERPRINT", "CACHE"] and not self.show_detailed_logs.get():
-            return
+        """Callback de statut (tout thread) : mis en file pour le thread Tk"""
+        self._event_q.put(('status', (time.strftime("%H:%M:%S"), message, level)))
+    
+    def _drain_events(self):
+        """Vide la file des événements d'analyse (thread Tk, toutes les EVENT_DRAIN_INTERVAL ms)
         
-        # Ajouter timestamp
-        timestamp = time.strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
+        Les lignes de statut d'un passage sont insérées en un seul appel et la
+        barre de progression ne prend que la dernière valeur reçue.
+        """
+        try:
+            status_chunks = []
+            hidden_levels = None  # Filtres lus une fois par passage, au premier statut
+            last_progress = None
+            analysed = []
+            final_results = None
+            for _ in range(EVENT_DRAIN_BATCH):
+                try:
+                    kind, payload = self._event_q.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == 'status':
+                    if hidden_levels is None:
+                        hidden_levels = self._hidden_log_levels()
+                    status_chunks.extend(self._format_status(*payload, hidden_levels))
+                elif kind == 'progress':
+                    last_progress = payload[:2]
+                    analysed.append(payload[2])
+                elif kind == 'results':
+                    # Dernier événement d'une analyse : traité après le reste du lot
+                    final_results = payload
+                    break
+            
+            if status_chunks:
+                self._append_status(*status_chunks)
+            if last_progress is not None:
+                current, total = last_progress
+                self.progress_bar['value'] = current
+                self.progress_var.set(f"Progression: {current}/{total} fichiers")
+            for result in analysed:
+                self._show_file_result(result)
+            if final_results is not None:
+                self._show_final_results(final_results)
+        finally:
+            self.root.after(EVENT_DRAIN_INTERVAL, self._drain_events)
+    
+    def _append_status(self, *chunks):
+        """Ajoute du texte à la console de logs (chunks : texte, tags, texte, tags...)
+        
+        Ne garde que les STATUS_LOG_MAX_LINES dernières lignes et ne défile
+        jusqu'en bas que si la vue y était déjà.
+        """
+        at_bottom = self.status_text.yview()[1] > 0.99
+        self.status_text.insert('end', *chunks)
+        
+        line_count = int(self.status_text.index('end-1c').split('.')[0])
+        if line_count > STATUS_LOG_TRIM_AT:
+            self.status_text.delete('1.0', f'{line_count - STATUS_LOG_MAX_LINES}.0')
+        
+        if at_bottom:
+            self.status_text.see('end')
+    
+    def _hidden_log_levels(self) -> set:
+        """Niveaux de log masqués par les cases de filtrage de la console"""
+        hidden = set()
+        if not self.show_spectral_logs.get():
+            hidden.add("SPECTRAL")
+        if not self.show_api_logs.get():
+            hidden.add("API")
+        if not self.show_detailed_logs.get():
+            hidden.update(("FINGERPRINT", "CACHE"))
+        return hidden
+    
+    def _format_status(self, timestamp: str, message: str, level: str, hidden_levels: set) -> Tuple[str, ...]:
+        """Ligne de log prête pour Text.insert ((texte, tag) ou () si filtrée)"""
+        if level in hidden_levels:
+            return ()
+        
+        return (f"[{timestamp}] {message}\n", level)
+    
+    def _show_file_result(self, result):
+        """Reporte le résultat d'un fichier dans la liste des fichiers et l'arbre des résultats"""
+        # Mettre à jour le statut du fichier dans la liste (et la ligne si elle est affichée)
+        index = self._file_index.get(result.file_path)
+        if index is not None:
+            status = f"{self.get_status_icon(result.status)} {result.status.value}"
+            self._file_status[index] = status
+            if self.files_tree.exists(str(index)):
+                self.files_tree.set(str(index), 'Statut', status)
         
-        # Insérer avec la couleur appropriée
-        self.status_text.insert('end', formatted_message, level)
-        self.status_text.see('end')
-        self.root.update_idletasks()
+        # Ajouter aux résultats
+        self.add_result_to_tree(result)
     
     def clear_logs(self):
         """Efface la console de logs"""
@@ -973,8 +1438,15 @@ Version: 2.0
             delattr(self, 'detailed_logs_window')
     
     def on_results_ready(self, results: List):
-        """Callback des résultats finaux"""
+        """Callback des résultats finaux (thread d'analyse) : mis en file pour le thread Tk"""
+        self._event_q.put(('results', results))
+    
+    def _show_final_results(self, results: List):
+        """Affiche le résumé de fin d'analyse"""
+        self._flush_results_tree()  # Toutes les lignes avant le résumé
         self.current_results = results
+        # Index pour le double-clic sur l'arbre (parcours inverse : le premier résultat d'un nom l'emporte)
+        self._results_by_filename = {Path(r.file_path).name: r for r in reversed(results)}
         
         # Afficher un résumé
         success_count = sum(1 for r in results if r.status == AnalysisStatus.SUCCESS)
@@ -983,8 +1455,7 @@ Version: 2.0
         summary = f"\n✅ Analyse terminée !\n"
         summary += f"📊 Succès: {success_count}/{total_count} ({success_count/total_count:.1%})\n"
         
-        self.status_text.insert('end', summary)
-        self.status_text.see('end')
+        self._append_status(summary)
         
         # Mettre à jour les statistiques
         self.update_statistics()
@@ -993,11 +1464,15 @@ Version: 2.0
             f"Analyse terminée !\nSuccès: {success_count}/{total_count}")
     
     def add_result_to_tree(self, result):
-        """Ajoute un résultat à l'arbre des résultats"""
+        """Ajoute un résultat à l'arbre des résultats
+        
+        La ligne est mise en attente et insérée avec les suivantes par
+        _flush_results_tree, au plus tard RESULTS_FLUSH_INTERVAL ms après.
+        """
         status_icon = self.get_status_icon(result.status)
         method_icon = self.get_method_icon(result.method_used)
         
-        self.results_tree.insert('', 'end', values=(
+        self._pending_results.append((
             Path(result.file_path).name,
             f"{status_icon} {result.status.value}",
             f"{method_icon} {result.method_used.value if result.method_used else 'Aucune'}",
@@ -1006,30 +1481,30 @@ Version: 2.0
             result.metadata.get('title', ''),
             result.metadata.get('album', '')
         ))
+        if self._results_flush_job is None:
+            self._results_flush_job = self.root.after(RESULTS_FLUSH_INTERVAL, self._flush_results_tree)
+    
+    def _flush_results_tree(self):
+        """Insère les lignes en attente dans l'arbre des résultats, puis un seul rafraîchissement"""
+        if self._results_flush_job is not None:
+            self.root.after_cancel(self._results_flush_job)
+            self._results_flush_job = None
+        if not self._pending_results:
+            return
+        
+        self._ensure_tab('results')
+        pending, self._pending_results = self._pending_results, []
+        for values in pending:
+            self.results_tree.insert('', 'end', values=values)
+        self.results_tree.update_idletasks()
     
     def get_status_icon(self, status) -> str:
         """Retourne l'icône du statut"""
-        icons = {
-            AnalysisStatus.SUCCESS: "✅",
-            AnalysisStatus.PARTIAL_SUCCESS: "⚠️",
-            AnalysisStatus.FAILED: "❌",
-            AnalysisStatus.MANUAL_REVIEW: "🔍",
-            AnalysisStatus.CACHED: "💾"
-        }
-        return icons.get(status, "❓")
+        return _STATUS_ICONS.get(status, "❓")
     
     def get_method_icon(self, method) -> str:
-        """Retourne l'icône de la méthode"""
-        if not method:
-            return "❓"
-        
-        icons = {
-            AnalysisMethod.ACOUSTICID: "🎧",
-            AnalysisMethod.SPECTRAL: "📊",
-            AnalysisMethod.MUSICBRAINZ: "🎼",
-            AnalysisMethod.METADATA_EXTRACTION: "🏷️"
-        }
-        return icons.get(method, "❓")
+        """Retourne l'icône de la méthode (❓ si aucune)"""
+        return _METHOD_ICONS.get(method, "❓")
     
     def show_result_details(self, event):
         """Affiche les détails d'un résultat"""
@@ -1042,7 +1517,7 @@ Version: 2.0
         
         # Trouver le résultat correspondant
         filename = values[0]
-        result = next((r for r in self.current_results if Path(r.file_path).name == filename), None)
+        result = self._results_by_filename.get(filename)
         
         if result:
             self.show_detailed_result_window(result)
@@ -1057,128 +1532,128 @@ Version: 2.0
         text_widget = tk.Text(detail_window, wrap='word', font=('Consolas', 10))
         text_widget.pack(fill='both', expand=True, padx=10, pady=10)
         
-        # Formater les détails
-        details = f"📁 Fichier: {result.file_path}\n\n"
-        details += f"📊 Statut: {result.status.value}\n"
-        details += f"🎯 Méthode gagnante: {result.method_used.value if result.method_used else 'Aucune'}\n"
-        details += f"📈 Confiance finale: {result.confidence:.2f}\n"
-        details += f"⏱️ Temps de traitement: {result.processing_time:.2f}s\n"
-        details += f"💾 Cache: {'Oui' if result.cache_hit else 'Non'}\n\n"
+        # Formater les détails (morceaux assemblés en une fois à la fin)
+        parts = [f"📁 Fichier: {result.file_path}\n\n"]
+        parts.append(f"📊 Statut: {result.status.value}\n")
+        parts.append(f"🎯 Méthode gagnante: {result.method_used.value if result.method_used else 'Aucune'}\n")
+        parts.append(f"📈 Confiance finale: {result.confidence:.2f}\n")
+        parts.append(f"⏱️ Temps de traitement: {result.processing_time:.2f}s\n")
+        parts.append(f"💾 Cache: {'Oui' if result.cache_hit else 'Non'}\n\n")
         
         # === RÉSULTATS DÉTAILLÉS PAR MÉTHODE ===
-        details += "🔬 RÉSULTATS DÉTAILLÉS PAR MÉTHODE\n"
-        details += "=" * 50 + "\n\n"
+        parts.append("🔬 RÉSULTATS DÉTAILLÉS PAR MÉTHODE\n")
+        parts.append("=" * 50 + "\n\n")
         
         # AcoustID
-        details += "🎧 ACOUSTID:\n"
+        parts.append("🎧 ACOUSTID:\n")
         if result.acoustid_result:
             if result.acoustid_result.get('success'):
                 conf = result.acoustid_result.get('confidence', 0)
                 meta = result.acoustid_result.get('metadata', {})
-                details += f"   ✅ Succès (confiance: {conf:.3f})\n"
+                parts.append(f"   ✅ Succès (confiance: {conf:.3f})\n")
                 if meta.get('artist'):
-                    details += f"   👤 Artiste: {meta.get('artist')}\n"
+                    parts.append(f"   👤 Artiste: {meta.get('artist')}\n")
                 if meta.get('title'):
-                    details += f"   🎵 Titre: {meta.get('title')}\n"
+                    parts.append(f"   🎵 Titre: {meta.get('title')}\n")
                 if meta.get('album'):
-                    details += f"   💿 Album: {meta.get('album')}\n"
+                    parts.append(f"   💿 Album: {meta.get('album')}\n")
                 if meta.get('year'):
-                    details += f"   📅 Année: {meta.get('year')}\n"
+                    parts.append(f"   📅 Année: {meta.get('year')}\n")
             else:
                 error = result.acoustid_result.get('error', 'Échec')
-                details += f"   ❌ Échec: {error}\n"
+                parts.append(f"   ❌ Échec: {error}\n")
         else:
-            details += "   ⚪ Non testé\n"
-        details += "\n"
+            parts.append("   ⚪ Non testé\n")
+        parts.append("\n")
         
         # Spectral
-        details += "📊 ANALYSE SPECTRALE:\n"
+        parts.append("📊 ANALYSE SPECTRALE:\n")
         if result.spectral_result:
             if result.spectral_result.get('success'):
                 conf = result.spectral_result.get('confidence', 0)
                 meta = result.spectral_result.get('metadata', {})
-                details += f"   ✅ Succès (confiance: {conf:.3f})\n"
+                parts.append(f"   ✅ Succès (confiance: {conf:.3f})\n")
                 if meta.get('artist'):
-                    details += f"   👤 Artiste: {meta.get('artist')}\n"
+                    parts.append(f"   👤 Artiste: {meta.get('artist')}\n")
                 if meta.get('title'):
-                    details += f"   🎵 Titre: {meta.get('title')}\n"
+                    parts.append(f"   🎵 Titre: {meta.get('title')}\n")
                 if meta.get('genre'):
-                    details += f"   🎭 Genre: {meta.get('genre')}\n"
+                    parts.append(f"   🎭 Genre: {meta.get('genre')}\n")
                 if meta.get('style'):
-                    details += f"   🎨 Style: {meta.get('style')}\n"
+                    parts.append(f"   🎨 Style: {meta.get('style')}\n")
             else:
                 error = result.spectral_result.get('error', 'Échec')
-                details += f"   ❌ Échec: {error}\n"
+                parts.append(f"   ❌ Échec: {error}\n")
         else:
-            details += "   ⚪ Non testé\n"
-        details += "\n"
+            parts.append("   ⚪ Non testé\n")
+        parts.append("\n")
         
         # MusicBrainz
-        details += "🌐 MUSICBRAINZ:\n"
+        parts.append("🌐 MUSICBRAINZ:\n")
         if result.musicbrainz_result:
             if result.musicbrainz_result.get('success'):
                 conf = result.musicbrainz_result.get('confidence', 0)
                 meta = result.musicbrainz_result.get('metadata', {})
-                details += f"   ✅ Succès (confiance: {conf:.3f})\n"
+                parts.append(f"   ✅ Succès (confiance: {conf:.3f})\n")
                 if meta.get('artist'):
-                    details += f"   👤 Artiste: {meta.get('artist')}\n"
+                    parts.append(f"   👤 Artiste: {meta.get('artist')}\n")
                 if meta.get('title'):
-                    details += f"   🎵 Titre: {meta.get('title')}\n"
+                    parts.append(f"   🎵 Titre: {meta.get('title')}\n")
                 if meta.get('album'):
-                    details += f"   💿 Album: {meta.get('album')}\n"
+                    parts.append(f"   💿 Album: {meta.get('album')}\n")
             else:
                 error = result.musicbrainz_result.get('error', 'Échec')
-                details += f"   ❌ Échec: {error}\n"
+                parts.append(f"   ❌ Échec: {error}\n")
         else:
-            details += "   ⚪ Non testé\n"
-        details += "\n"
+            parts.append("   ⚪ Non testé\n")
+        parts.append("\n")
         
         # Last.fm (si disponible)
         if hasattr(result, 'lastfm_result') and result.lastfm_result:
-            details += "🎵 LAST.FM:\n"
+            parts.append("🎵 LAST.FM:\n")
             if result.lastfm_result.get('success'):
                 conf = result.lastfm_result.get('confidence', 0)
                 meta = result.lastfm_result.get('metadata', {})
-                details += f"   ✅ Succès (confiance: {conf:.3f})\n"
+                parts.append(f"   ✅ Succès (confiance: {conf:.3f})\n")
                 if meta.get('artist'):
-                    details += f"   👤 Artiste: {meta.get('artist')}\n"
+                    parts.append(f"   👤 Artiste: {meta.get('artist')}\n")
                 if meta.get('title'):
-                    details += f"   🎵 Titre: {meta.get('title')}\n"
+                    parts.append(f"   🎵 Titre: {meta.get('title')}\n")
             else:
                 error = result.lastfm_result.get('error', 'Échec')
-                details += f"   ❌ Échec: {error}\n"
-            details += "\n"
+                parts.append(f"   ❌ Échec: {error}\n")
+            parts.append("\n")
         
         # === MÉTADONNÉES FINALES ===
         if result.metadata:
-            details += "🎵 MÉTADONNÉES FINALES:\n"
-            details += "=" * 30 + "\n"
+            parts.append("🎵 MÉTADONNÉES FINALES:\n")
+            parts.append("=" * 30 + "\n")
             for key, value in result.metadata.items():
                 if value:
-                    details += f"   {key}: {value}\n"
-            details += "\n"
+                    parts.append(f"   {key}: {value}\n")
+            parts.append("\n")
         
         # === PROPRIÉTÉS AUDIO ===
         if result.audio_properties:
-            details += "📀 PROPRIÉTÉS AUDIO:\n"
-            details += "=" * 25 + "\n"
+            parts.append("📀 PROPRIÉTÉS AUDIO:\n")
+            parts.append("=" * 25 + "\n")
             for key, value in result.audio_properties.items():
-                details += f"   {key}: {value}\n"
-            details += "\n"
+                parts.append(f"   {key}: {value}\n")
+            parts.append("\n")
         
         # === ERREURS ET SUGGESTIONS ===
         if result.errors:
-            details += "❌ ERREURS:\n"
+            parts.append("❌ ERREURS:\n")
             for error in result.errors:
-                details += f"   • {error}\n"
-            details += "\n"
+                parts.append(f"   • {error}\n")
+            parts.append("\n")
         
         if result.suggestions:
-            details += "💡 SUGGESTIONS:\n"
+            parts.append("💡 SUGGESTIONS:\n")
             for suggestion in result.suggestions:
-                details += f"   • {suggestion}\n"
+                parts.append(f"   • {suggestion}\n")
         
-        text_widget.insert('1.0', details)
+        text_widget.insert('1.0', ''.join(parts))
         text_widget.config(state='disabled')
     
     def export_results(self, format_type: str):
@@ -1201,35 +1676,60 @@ Version: 2.0
         )
         
         if file_path:
-            self.adapter.export_results(file_path, format_type)
+            # Export dans un thread : l'interface reste réactive, la fin (ou
+            # l'erreur) remonte par le callback de statut de l'adaptateur
+            threading.Thread(target=self.adapter.export_results,
+                             args=(file_path, format_type), daemon=True).start()
+    
+    @staticmethod
+    def _statistics_lines(stats: Dict[str, Any]) -> List[Tuple[Optional[str], str]]:
+        """Lignes de l'onglet Statistiques : (clé de la statistique ou None, texte)"""
+        return [
+            (None, "📊 STATISTIQUES DE SESSION\n"),
+            (None, "=" * 40 + "\n\n"),
+            ('total_processed', f"📁 Total traité: {stats['total_processed']}\n"),
+            ('success_rate', f"✅ Taux de succès: {stats['success_rate']:.1%}\n"),
+            ('cache_hit_rate', f"💾 Taux de cache: {stats['cache_hit_rate']:.1%}\n"),
+            ('average_processing_time', f"⏱️ Temps moyen: {stats['average_processing_time']:.2f}s\n"),
+            ('total_processing_time', f"🕒 Temps total: {stats['total_processing_time']:.1f}s\n\n"),
+            (None, "🎯 SUCCÈS PAR MÉTHODE\n"),
+            (None, "-" * 25 + "\n"),
+            ('acousticid_successes', f"🎧 AcoustID: {stats['acousticid_successes']}\n"),
+            ('spectral_successes', f"📊 Spectral: {stats['spectral_successes']}\n"),
+            ('musicbrainz_successes', f"🎼 MusicBrainz: {stats['musicbrainz_successes']}\n\n"),
+            ('manual_reviews', f"🔍 Révisions manuelles: {stats['manual_reviews']}\n"),
+            ('errors', f"❌ Erreurs: {stats['errors']}\n"),
+            ('corrupted_files_count', f"🗂️ Fichiers corrompus: {stats['corrupted_files_count']}\n"),
+            ('manual_selections_count', f"👆 Sélections manuelles: {stats['manual_selections_count']}\n")
+        ]
     
     def update_statistics(self):
-        """Met à jour l'affichage des statistiques"""
+        """Met à jour l'affichage des statistiques
+        
+        Rien n'est touché si les statistiques n'ont pas changé ; sinon seules
+        les lignes dont le texte change sont remplacées (repérées par un tag).
+        """
+        if 'stats' in self._tab_builders:
+            return  # Onglet pas encore construit : calculées à sa première ouverture
+        
         stats = self.adapter.get_statistics()
+        if stats == self._last_stats:
+            return
         
-        stats_text = "📊 STATISTIQUES DE SESSION\n"
-        stats_text += "=" * 40 + "\n\n"
-        
-        stats_text += f"📁 Total traité: {stats['total_processed']}\n"
-        stats_text += f"✅ Taux de succès: {stats['success_rate']:.1%}\n"
-        stats_text += f"💾 Taux de cache: {stats['cache_hit_rate']:.1%}\n"
-        stats_text += f"⏱️ Temps moyen: {stats['average_processing_time']:.2f}s\n"
-        stats_text += f"🕒 Temps total: {stats['total_processing_time']:.1f}s\n\n"
-        
-        stats_text += "🎯 SUCCÈS PAR MÉTHODE\n"
-        stats_text += "-" * 25 + "\n"
-        stats_text += f"🎧 AcoustID: {stats['acousticid_successes']}\n"
-        stats_text += f"📊 Spectral: {stats['spectral_successes']}\n" 
-        stats_text += f"🎼 MusicBrainz: {stats['musicbrainz_successes']}\n\n"
-        
-        stats_text += f"🔍 Révisions manuelles: {stats['manual_reviews']}\n"
-        stats_text += f"❌ Erreurs: {stats['errors']}\n"
-        stats_text += f"🗂️ Fichiers corrompus: {stats['corrupted_files_count']}\n"
-        stats_text += f"👆 Sélections manuelles: {stats['manual_selections_count']}\n"
-        
-        # Nettoyer et afficher
-        self.stats_text.delete('1.0', 'end')
-        self.stats_text.insert('1.0', stats_text)
+        lines = self._statistics_lines(stats)
+        if self._last_stats is None:
+            # Premier affichage : tout le texte, une ligne taguée par statistique
+            self.stats_text.delete('1.0', 'end')
+            for key, line in lines:
+                self.stats_text.insert('end', line, (f"stat_{key}",) if key else ())
+        else:
+            previous = dict(self._statistics_lines(self._last_stats))
+            for key, line in lines:
+                if key is not None and previous.get(key) != line:
+                    tag = f"stat_{key}"
+                    start, end = self.stats_text.tag_ranges(tag)
+                    self.stats_text.replace(start, end, line, (tag,))
+        self._last_stats = stats
 
     # === GESTION DES PARAMÈTRES ===
     
@@ -1253,8 +1753,12 @@ Version: 2.0
         """Charge les paramètres sauvegardés depuis le fichier JSON"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
+                if ORJSON_AVAILABLE:
+                    with open(self.config_file, 'rb') as f:
+                        settings = orjson.loads(f.read())
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        settings = json.load(f)
                 
                 # Charger les paramètres avec des valeurs par défaut
                 self.source_directory.set(settings.get('source_directory', ''))
@@ -1276,6 +1780,9 @@ Version: 2.0
                 self.enable_musicbrainz.set(settings.get('enable_musicbrainz', True))
                 self.enable_metadata.set(settings.get('enable_metadata', True))
                 
+                # Le fichier correspond à ces valeurs : inutile de le réécrire à l'identique
+                self._last_settings_hash = self._settings_hash(settings)
+                
                 print(f"💾 Paramètres chargés depuis {self.config_file}")
                 
                 # Mettre à jour les labels après le chargement
@@ -1286,19 +1793,25 @@ Version: 2.0
     
     def update_threshold_labels(self):
         """Met à jour les labels des seuils avec les valeurs actuelles"""
-        if hasattr(self, 'acoustid_label'):
-            self.acoustid_label.set(f"AcoustID (recommandé: 0.85): {self.acoustid_threshold.get():.2f}")
-        if hasattr(self, 'musicbrainz_label'):
-            self.musicbrainz_label.set(f"MusicBrainz (recommandé: 0.70): {self.musicbrainz_threshold.get():.2f}")
-        if hasattr(self, 'spectral_label'):
-            self.spectral_label.set(f"Analyse Spectrale (recommandé: 0.70): {self.spectral_threshold.get():.2f}")
+        if hasattr(self, 'acoustid_label_widget'):
+            self.acoustid_label_widget.configure(text=f"AcoustID (recommandé: 0.85): {self.acoustid_threshold.get():.2f}")
+        if hasattr(self, 'musicbrainz_label_widget'):
+            self.musicbrainz_label_widget.configure(text=f"MusicBrainz (recommandé: 0.70): {self.musicbrainz_threshold.get():.2f}")
+        if hasattr(self, 'spectral_label_widget'):
+            self.spectral_label_widget.configure(text=f"Analyse Spectrale (recommandé: 0.70): {self.spectral_threshold.get():.2f}")
+    
+    @staticmethod
+    def _settings_hash(settings: Dict[str, Any]) -> int:
+        """Empreinte d'un jeu de paramètres (valeurs simples : str, float, bool)"""
+        return hash(tuple(sorted(settings.items())))
     
     def save_settings(self):
-        """Sauvegarde les paramètres actuels dans le fichier JSON"""
+        """Sauvegarde les paramètres actuels dans le fichier JSON
+        
+        L'écriture est sautée si les paramètres n'ont pas changé depuis la
+        dernière lecture ou écriture du fichier.
+        """
         try:
-            # Créer le répertoire config s'il n'existe pas
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            
             settings = {
                 'source_directory': self.source_directory.get(),
                 'api_key': self.api_key.get(),
@@ -1314,8 +1827,20 @@ Version: 2.0
                 'enable_metadata': self.enable_metadata.get()
             }
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            settings_hash = self._settings_hash(settings)
+            if settings_hash == self._last_settings_hash:
+                return
+            
+            # Créer le répertoire config s'il n'existe pas
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            if ORJSON_AVAILABLE:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._last_settings_hash = settings_hash
             
             print(f"💾 Paramètres sauvegardés dans {self.config_file}")
             
@@ -1323,7 +1848,18 @@ Version: 2.0
             print(f"❌ Erreur lors de la sauvegarde: {e}")
     
     def on_setting_changed(self, *args):
-        """Appelé automatiquement quand un paramètre change pour sauvegarder"""
+        """Appelé automatiquement quand un paramètre change pour sauvegarder
+        
+        Les changements rapprochés (frappe, glissement d'un curseur) sont
+        regroupés en une seule écriture, SETTINGS_SAVE_DELAY_MS après le dernier.
+        """
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+        self._save_job = self.root.after(SETTINGS_SAVE_DELAY_MS, self._do_save)
+    
+    def _do_save(self):
+        """Sauvegarde programmée par on_setting_changed"""
+        self._save_job = None
         self.save_settings()
     
     def on_closing(self):
@@ -1332,8 +1868,15 @@ Version: 2.0
         if hasattr(self.adapter, 'is_processing') and self.adapter.is_processing:
             self.adapter.stop_processing()
         
-        # Sauvegarder une dernière fois les paramètres
+        # Sauvegarder une dernière fois les paramètres (remplace une sauvegarde en attente)
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
         self.save_settings()
+        
+        # Transmettre les derniers logs et arrêter le thread d'écoute de l'adaptateur
+        self.adapter.close()
+        
         # Fermer l'application
         self.root.destroy()
     
@@ -1413,6 +1956,16 @@ class ManualSelectionDialog:
         scrollbar = ttk.Scrollbar(suggestions_container, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
+        # Variable pour les radio buttons (utilisée par chaque suggestion)
+        self.selection_var = tk.StringVar(value="suggestion_0" if self.candidates else "manual")
+        
+        # Ajouter chaque suggestion : textes extraits d'abord, puis widgets créés
+        # d'un trait avant que le cadre soit placé dans le canvas (une seule mise en page)
+        self.suggestion_vars = []  # Pour les radio buttons
+        infos = [self._candidate_display_info(candidate) for candidate in self.candidates]
+        for idx, (candidate, info) in enumerate(zip(self.candidates, infos)):
+            self._create_suggestion_widget(scrollable_frame, idx, candidate, info)
+        
         scrollable_frame.bind(
             "<Configure>",
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
@@ -1421,11 +1974,6 @@ class ManualSelectionDialog:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
-        # Ajouter chaque suggestion
-        self.suggestion_vars = []  # Pour les radio buttons
-        for idx, candidate in enumerate(self.candidates):
-            self._create_suggestion_widget(scrollable_frame, idx, candidate)
-        
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
@@ -1433,9 +1981,6 @@ class ManualSelectionDialog:
         options_frame = ttk.LabelFrame(main_frame, text="⚙️ Options Supplémentaires", padding=10)
         options_frame.pack(fill='x', pady=(0,10))
         
-        # Variable pour les radio buttons
-        self.selection_var = tk.StringVar(value="suggestion_0" if self.candidates else "manual")
-        
         # Option de saisie manuelle
         manual_frame = ttk.Frame(options_frame)
         manual_frame.pack(fill='x', pady=5)
@@ -1474,8 +2019,49 @@ class ManualSelectionDialog:
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
         canvas.bind("<MouseWheel>", _on_mousewheel)
     
-    def _create_suggestion_widget(self, parent, idx, candidate):
-        """Crée un widget pour une suggestion MusicBrainz"""
+    @staticmethod
+    def _candidate_display_info(candidate: Dict[str, Any]) -> Tuple[str, str, str, str, str]:
+        """Textes affichés pour une suggestion : (artiste, titre, album, année, ID MusicBrainz)"""
+        # Extraire les informations du candidat
+        recording = candidate.get('recording', candidate)
+        
+        # Artiste
+        artist = 'Artiste Inconnu'
+        if 'artist-credit' in recording:
+            artists = []
+            for credit in recording['artist-credit']:
+                if isinstance(credit, dict) and 'artist' in credit:
+                    artists.append(credit['artist'].get('name', ''))
+            if artists:
+                artist = ', '.join(artists)
+        elif 'artist' in recording:
+            artist = recording['artist']
+        
+        # Titre
+        title = recording.get('title', 'Titre inconnu')
+        
+        # Album et année
+        album = 'Album inconnu'
+        year = ''
+        if 'releases' in recording and recording['releases']:
+            release = recording['releases'][0]
+            album = release.get('title', 'Album inconnu')
+            if 'date' in release:
+                year = release['date'][:4] if len(release['date']) >= 4 else release['date']
+        elif 'release-list' in recording and recording['release-list']:
+            release = recording['release-list'][0]
+            album = release.get('title', 'Album inconnu')
+            if 'date' in release:
+                year = release['date'][:4] if len(release['date']) >= 4 else release['date']
+        
+        return artist, title, album, year, recording.get('id', '')
+    
+    def _create_suggestion_widget(self, parent, idx, candidate, info):
+        """Crée un widget pour une suggestion MusicBrainz
+        
+        Args:
+            info: Textes pré-extraits par _candidate_display_info
+        """
         
         # Frame principal pour cette suggestion
         suggestion_frame = ttk.Frame(parent, relief='solid', borderwidth=1)
@@ -1510,37 +2096,7 @@ class ManualSelectionDialog:
         info_frame = ttk.Frame(suggestion_frame)
         info_frame.pack(fill='x', padx=20, pady=(0,10))
         
-        # Extraire les informations du candidat
-        recording = candidate.get('recording', candidate)
-        
-        # Artiste
-        artist = 'Artiste Inconnu'
-        if 'artist-credit' in recording:
-            artists = []
-            for credit in recording['artist-credit']:
-                if isinstance(credit, dict) and 'artist' in credit:
-                    artists.append(credit['artist'].get('name', ''))
-            if artists:
-                artist = ', '.join(artists)
-        elif 'artist' in recording:
-            artist = recording['artist']
-        
-        # Titre
-        title = recording.get('title', 'Titre inconnu')
-        
-        # Album et année
-        album = 'Album inconnu'
-        year = ''
-        if 'releases' in recording and recording['releases']:
-            release = recording['releases'][0]
-            album = release.get('title', 'Album inconnu')
-            if 'date' in release:
-                year = release['date'][:4] if len(release['date']) >= 4 else release['date']
-        elif 'release-list' in recording and recording['release-list']:
-            release = recording['release-list'][0]
-            album = release.get('title', 'Album inconnu')
-            if 'date' in release:
-                year = release['date'][:4] if len(release['date']) >= 4 else release['date']
+        artist, title, album, year, mb_id = info
         
         # Affichage des informations
         ttk.Label(info_frame, text=f"🎤 Artiste: {artist}", font=('Arial', 10, 'bold')).pack(anchor='w')
@@ -1551,7 +2107,6 @@ class ManualSelectionDialog:
             ttk.Label(info_frame, text=f"📅 Année: {year}", font=('Arial', 9), foreground='#666666').pack(anchor='w')
         
         # ID MusicBrainz (pour debug)
-        mb_id = recording.get('id', '')
         if mb_id:
             ttk.Label(info_frame, text=f"🆔 ID: {mb_id}", font=('Arial', 8), foreground='#999999').pack(anchor='w')
         
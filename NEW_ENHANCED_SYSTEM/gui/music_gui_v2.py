@@ -11,6 +11,9 @@ import os
 from pathlib import Path
 from typing import List
 
+# Extensions audio reconnues par le scan (sans le point)
+AUDIO_EXT = frozenset(('mp3', 'flac', 'ogg', 'm4a', 'wav', 'wma'))
+
 
 class MusicManagerGUI:
     """Interface utilisateur avec analyse de fichiers"""
@@ -308,15 +311,16 @@ class MusicManagerGUI:
         def scan_worker():
             try:
                 self.add_status("🔍 Scan du répertoire en cours...")
-                directory = Path(self.source_directory.get())
-                
-                # Extensions audio supportées
-                audio_extensions = {'.mp3', '.flac', '.ogg', '.m4a', '.wav', '.wma'}
+                directory = self.source_directory.get()
                 
+                # Un seul parcours de l'arborescence ; l'extension est lue dans
+                # le nom (pas de Path par fichier, insensible à la casse)
                 files = []
-                for ext in audio_extensions:
-                    files.extend(directory.rglob(f"*{ext}"))
-                    files.extend(directory.rglob(f"*{ext.upper()}"))
+                for root, _, filenames in os.walk(directory):
+                    for name in filenames:
+                        dot = name.rfind('.')
+                        if dot >= 0 and name[dot + 1:].lower() in AUDIO_EXT:
+                            files.append(Path(root, name))
                 
                 # Mettre à jour l'interface dans le thread principal
                 self.root.after(0, lambda: self.populate_files_list(files))
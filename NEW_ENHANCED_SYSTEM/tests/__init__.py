@@ -0,0 +1 @@
+# Tests pour NEW_ENHANCED_SYSTEM
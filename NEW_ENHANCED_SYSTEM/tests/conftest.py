@@ -0,0 +1,9 @@
+"""Configuration pytest : rend les paquets de NEW_ENHANCED_SYSTEM importables"""
+
+import sys
+from pathlib import Path
+
+# Racine de NEW_ENHANCED_SYSTEM (fingerprint, core, errors, utils...)
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la génération de fingerprints en lot d'AcousticMatcher
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from cache.cache_manager import CacheManager
+from cache.sqlite_handler import SQLiteCacheHandler
+from fingerprint.acoustic_matcher import AcousticMatcher, sliding_bit_error_rates
+
+# fpcalc factice : même format de sortie que le vrai, ligne FILE= seulement
+# lorsque plusieurs fichiers sont passés en argument
+FAKE_FPCALC = f"""#!{sys.executable}
+import os
+import sys
+
+files = sys.argv[3:]  # après "-length N"
+# Erreurs de décodage plus volumineuses que le tampon d'un tube
+sys.stderr.write("ERROR: " * int(os.environ.get("FAKE_FPCALC_STDERR", "0")))
+for path in files:
+    if len(files) > 1:
+        print(f"FILE={{path}}")
+    print("DURATION=42")
+    print(f"FINGERPRINT=AQAA{{os.path.basename(path).split('.')[0]}}")
+"""
+
+
+@unittest.skipIf(os.name == 'nt', "fpcalc factice exécuté via un shebang")
+class TestGenerateFingerprintsBatch(unittest.TestCase):
+
+    def setUp(self):
+        """Crée le fpcalc factice et un matcher sans cache persistant"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        fpcalc = Path(self.tmpdir.name) / "fpcalc"
+        fpcalc.write_text(FAKE_FPCALC)
+        fpcalc.chmod(fpcalc.stat().st_mode | stat.S_IEXEC)
+
+        cache = mock.Mock()
+        cache.get_file_cache.return_value = None
+        patcher = mock.patch('fingerprint.acoustic_matcher.CacheManager')
+        patcher.start().get_instance.return_value = cache
+        self.addCleanup(patcher.stop)
+
+        self.cache = cache
+        self.matcher = AcousticMatcher(fpcalc_path=str(fpcalc))
+
+    def _audio_files(self, *names):
+        return [str(Path(self.tmpdir.name) / name) for name in names]
+
+    def test_single_file_chunk(self):
+        """Un lot d'un seul fichier (sans ligne FILE=) est attribué à ce fichier"""
+        (path,) = self._audio_files("abcd.mp3")
+
+        results = self.matcher.generate_fingerprints_batch([path])
+
+        self.assertEqual(results, {path: {'duration': 42.0, 'fingerprint': 'AQAAabcd'}})
+        self.cache.set_file_cache.assert_called_once()
+
+    def test_multiple_files_chunk(self):
+        """Chaque bloc FILE= est attribué au fichier correspondant"""
+        paths = self._audio_files("abcd.mp3", "efgh.flac", "ijkl.ogg")
+
+        results = self.matcher.generate_fingerprints_batch(paths, chunk_size=2)
+
+        self.assertEqual(list(results), paths)
+        for path, name in zip(paths, ("abcd", "efgh", "ijkl")):
+            self.assertEqual(results[path], {'duration': 42.0, 'fingerprint': f'AQAA{name}'})
+        self.assertEqual(self.cache.set_file_cache.call_count, 3)
+
+    def test_single_file_with_large_stderr(self):
+        """Un stderr abondant ne bloque pas la lecture de stdout"""
+        (path,) = self._audio_files("abcd.mp3")
+
+        with mock.patch.dict(os.environ, {"FAKE_FPCALC_STDERR": "100000"}):
+            data = self.matcher.generate_fingerprint(path)
+
+        self.assertEqual(data, {'duration': 42.0, 'fingerprint': 'AQAAabcd'})
+
+    def test_clean_fingerprint_keeps_urlsafe_alphabet(self):
+        """Le base64 URL de fpcalc ('-', '_') n'est pas altéré par le nettoyage"""
+        self.assertEqual(self.matcher.clean_fingerprint("AQ-_ab\n"), "AQ-_ab==")
+
+
+
+class TestFingerprintCacheKey(unittest.TestCase):
+    """Les empreintes en cache dépendent de la durée analysée par fpcalc"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        cache = CacheManager.__new__(CacheManager)
+        cache.enabled = True
+        cache.handler = SQLiteCacheHandler(str(Path(self.tmpdir.name) / "cache_db.db"))
+        self.cache = cache
+
+        patcher = mock.patch('fingerprint.acoustic_matcher.CacheManager')
+        patcher.start().get_instance.return_value = cache
+        self.addCleanup(patcher.stop)
+
+        self.audio = Path(self.tmpdir.name) / "abcd.mp3"
+        self.audio.write_bytes(b"ID3")
+        self.matcher = AcousticMatcher(fpcalc_path=os.devnull, fpcalc_length=60)
+        self.matcher._cache_fingerprint(str(self.audio), {'duration': 42.0, 'fingerprint': 'AQAA'})
+
+    def test_same_length_hits_cache(self):
+        self.assertEqual(self.matcher._get_cached_fingerprint(str(self.audio)),
+                         {'duration': 42.0, 'fingerprint': 'AQAA'})
+
+    def test_other_length_misses_cache(self):
+        """Un changement de FINGERPRINT.analysis_length invalide les empreintes en cache"""
+        self.matcher.fpcalc_length = 120
+        self.assertIsNone(self.matcher._get_cached_fingerprint(str(self.audio)))
+
+    def test_separate_from_generic_file_cache(self):
+        """Les entrées du matcher ne sont pas servies par CacheManager.caching (préfixe fp_)"""
+        self.assertIsNone(self.cache.get_file_cache(str(self.audio)))
+
+
+class TestReferenceIndex(unittest.TestCase):
+    """Recherche par alignement glissant sur les empreintes brutes"""
+
+    def setUp(self):
+        patcher = mock.patch('fingerprint.acoustic_matcher.CacheManager')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.matcher = AcousticMatcher(fpcalc_path=os.devnull)
+        self.rng = np.random.default_rng(0)
+
+    def _random_fingerprint(self, length):
+        return self.rng.integers(0, 1 << 32, size=length, dtype=np.uint32)
+
+    def test_finds_shifted_noisy_copy(self):
+        """Une copie décalée et bruitée est retrouvée avec son décalage"""
+        references = {f"ref{i}": self._random_fingerprint(200 + 10 * i) for i in range(5)}
+        self.matcher.build_reference_index(references)
+
+        # Requête : ref3 à partir de la sous-empreinte 7, 2 bits faux sur 32
+        noise = np.uint32(0b101) << self.rng.integers(0, 29, size=150).astype(np.uint32)
+        query = references["ref3"][7:157] ^ noise
+
+        match_id, similarity, shift = self.matcher.find_best_match(query)
+
+        self.assertEqual(match_id, "ref3")
+        self.assertEqual(shift, 7)
+        self.assertAlmostEqual(similarity, 1 - 2 / 32)
+
+    def test_bit_error_rates_match_direct_computation(self):
+        """Le BER vectorisé égale le calcul direct pour chaque référence"""
+        references = [self._random_fingerprint(n) for n in (80, 120)]
+        lengths = np.array([80, 120])
+        matrix = np.zeros((2, 120), dtype=np.uint32)
+        for row, fp in zip(matrix, references):
+            row[:len(fp)] = fp
+        query = self._random_fingerprint(100)
+
+        ber, shifts = sliding_bit_error_rates(query, matrix, lengths, max_shift=3)
+
+        for i, ref in enumerate(references):
+            expected = np.inf
+            for shift in range(-3, 4):
+                q = query[max(0, -shift):]
+                r = ref[max(0, shift):]
+                n = min(len(q), len(r))
+                bits = np.unpackbits((q[:n] ^ r[:n]).view(np.uint8)).sum()
+                expected = min(expected, bits / (32.0 * n))
+            self.assertAlmostEqual(ber[i], expected)
+
+    def test_no_reference(self):
+        """Sans index, aucune correspondance"""
+        self.assertIsNone(self.matcher.find_best_match(self._random_fingerprint(64)))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le cache d'empreintes AcoustID (stockage BLOB)
+"""
+
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from fingerprint.cache import AcoustIDCache, SCHEMA_VERSION, pack_fingerprint, unpack_fingerprint
+
+# Empreinte Chromaprint : base64 URL sans padding (bits de fin nuls)
+FINGERPRINT = 'AQAAabcd-w'
+
+
+class TestAcoustIDCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.db_path = str(Path(self.tmpdir.name) / 'acoustid_cache.db')
+        self.audio = Path(self.tmpdir.name) / 'piste.mp3'
+        self.audio.write_bytes(b'ID3')
+
+    def test_pack_round_trip(self):
+        """Les octets bruts redonnent l'empreinte base64 URL sans padding"""
+        self.assertEqual(unpack_fingerprint(pack_fingerprint(FINGERPRINT)), FINGERPRINT.encode('ascii'))
+
+    def test_set_then_get(self):
+        """Durée, empreinte et track_id sont relus pour un fichier inchangé"""
+        cache = AcoustIDCache(self.db_path)
+        cache.set(str(self.audio), 180.5, FINGERPRINT, 'track-1')
+
+        self.assertEqual(cache.get(str(self.audio)), (180.5, FINGERPRINT.encode('ascii'), 'track-1'))
+
+    def test_modified_file_misses(self):
+        """Un fichier modifié (taille, mtime) n'est plus servi par le cache"""
+        cache = AcoustIDCache(self.db_path)
+        cache.set(str(self.audio), 180.5, FINGERPRINT)
+        self.audio.write_bytes(b'ID3 + tags')
+
+        self.assertIsNone(cache.get(str(self.audio)))
+
+    def test_migrates_base64_rows_to_blobs(self):
+        """Les empreintes base64 d'une ancienne base sont converties, les illisibles supprimées"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+            CREATE TABLE fingerprints (
+                file_hash TEXT PRIMARY KEY,
+                audio_length REAL,
+                fingerprint TEXT,
+                timestamp REAL,
+                track_id TEXT
+            )''')
+            conn.execute('INSERT INTO fingerprints VALUES (?, ?, ?, ?, ?)', ('ok', 1.0, FINGERPRINT, 0, None))
+            conn.execute('INSERT INTO fingerprints VALUES (?, ?, ?, ?, ?)', ('bad', 1.0, 'pas du base64 !', 0, None))
+        conn.close()
+
+        AcoustIDCache(self.db_path)
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = dict(conn.execute('SELECT file_hash, fingerprint FROM fingerprints'))
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+        conn.close()
+        self.assertEqual(rows, {'ok': pack_fingerprint(FINGERPRINT)})
+        self.assertEqual(version, SCHEMA_VERSION)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
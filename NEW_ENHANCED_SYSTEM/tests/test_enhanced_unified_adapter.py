@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour EnhancedUnifiedProcessorAdapter (logs, scan de répertoires)
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest import mock
+
+try:
+    from core import enhanced_unified_adapter
+    from core.enhanced_unified_adapter import EnhancedUnifiedProcessorAdapter
+    ADAPTER_AVAILABLE = True
+except ImportError:
+    ADAPTER_AVAILABLE = False
+
+
+def make_adapter():
+    """Adaptateur sans processeur, cache ni sauvegarde réels"""
+    adapter = EnhancedUnifiedProcessorAdapter.__new__(EnhancedUnifiedProcessorAdapter)
+    adapter.logger = None
+    adapter.status_callback = None
+    adapter.skip_corrupted_files = False
+    adapter.processor = mock.Mock()
+    adapter.processor.logger = logging.getLogger(f"{__name__}.processor")
+    adapter.processor.logger.propagate = False
+    adapter.detailed_stats = {'corrupted_files': []}
+    return adapter
+
+
+@unittest.skipUnless(ADAPTER_AVAILABLE, "dépendances de l'adaptateur (pyacoustid...) absentes")
+class TestProcessorLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.adapter = make_adapter()
+        self.messages = []
+        self.adapter.status_callback = lambda message, level: self.messages.append((message, level))
+        self.adapter._setup_processor_logging()
+        self.addCleanup(self.adapter.close)
+
+    def test_close_flushes_queued_records(self):
+        """Les records encore en file à la fermeture parviennent à l'interface"""
+        for i in range(100):
+            self.adapter.processor.logger.info("✅ fichier %d", i)
+
+        self.adapter.close()
+
+        self.assertEqual(len(self.messages), 100)
+        self.assertEqual(self.messages[-1], ("✅ fichier 99", "SUCCESS"))
+
+    def test_close_is_idempotent_and_detaches_handler(self):
+        self.adapter.close()
+        self.adapter.close()
+
+        self.adapter.processor.logger.info("après fermeture")
+        self.assertEqual(self.messages, [])
+        self.assertEqual(self.adapter.processor.logger.handlers, [])
+
+
+
+@unittest.skipUnless(ADAPTER_AVAILABLE, "dépendances de l'adaptateur (pyacoustid...) absentes")
+class TestScanDirectory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.root = Path(self.tmpdir.name)
+
+        # racine + un sous-dossier par lettre, fichiers non audio ignorés
+        self.expected = {}
+        for rel, size in [('a.mp3', 10), ('notes.txt', 5), ('sub1/b.flac', 20),
+                          ('sub1/deep/c.OGG', 30), ('sub2/d.wav', 40), ('sub2/cover.jpg', 7)]:
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b'x' * size)
+            if not rel.endswith(('.txt', '.jpg')):
+                self.expected[str(path)] = size
+
+        self.adapter = make_adapter()
+
+    def _scan(self):
+        batches = []
+        files = self.adapter.scan_directory(str(self.root), on_batch=batches.append)
+        return files, batches
+
+    def test_small_tree_scanned_with_threads(self):
+        """Peu de sous-dossiers : aucun processus n'est démarré"""
+        with mock.patch.object(enhanced_unified_adapter, 'ProcessPoolExecutor') as pool:
+            files, batches = self._scan()
+
+        pool.assert_not_called()
+        self.assertEqual(dict(files), self.expected)
+        self.assertEqual(files[0], (str(self.root / 'a.mp3'), 10))  # racine d'abord
+        self.assertEqual(sorted(f for batch in batches for f in batch), sorted(files))
+
+    def test_large_tree_scanned_with_processes(self):
+        with mock.patch.multiple(enhanced_unified_adapter, SCAN_PROCESS_MIN_SUBDIRS=1, SCAN_PROCESSES=2):
+            files, _ = self._scan()
+
+        self.assertEqual(dict(files), self.expected)
+
+    def test_broken_process_pool_falls_back_to_threads(self):
+        """Processus indisponibles : le parcours se fait dans les threads"""
+        broken = mock.Mock(side_effect=BrokenProcessPool("spawn impossible"))
+        with mock.patch.multiple(enhanced_unified_adapter, SCAN_PROCESS_MIN_SUBDIRS=1, SCAN_PROCESSES=2,
+                                 ProcessPoolExecutor=broken):
+            files, _ = self._scan()
+
+        broken.assert_called_once()
+        self.assertEqual(dict(files), self.expected)
+
+    def test_corrupted_files_are_skipped(self):
+        self.adapter.skip_corrupted_files = True
+        self.adapter._is_file_corrupted = lambda path, size: path.endswith('.flac')
+
+        files, _ = self._scan()
+
+        self.assertNotIn(str(self.root / 'sub1' / 'b.flac'), dict(files))
+        self.assertEqual(self.adapter.detailed_stats['corrupted_files'], [str(self.root / 'sub1' / 'b.flac')])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
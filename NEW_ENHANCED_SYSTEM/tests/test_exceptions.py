@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la hiérarchie d'exceptions de MusicFolderManager
+"""
+
+import pickle
+import unittest
+
+from errors.exceptions import (
+    AudioProcessingError,
+    ConfigurationError,
+    FileAccessError,
+    MetadataError,
+    MusicFolderManagerError,
+    NetworkError,
+    OrganizationError,
+)
+
+
+class TestExceptionPickling(unittest.TestCase):
+    """Les exceptions remontées par un ProcessPoolExecutor sont picklées"""
+
+    def _round_trip(self, error):
+        return pickle.loads(pickle.dumps(error))
+
+    def test_audio_processing_error_round_trip(self):
+        """Code, message, détails et champs propres à la sous-classe survivent au pickle"""
+        error = AudioProcessingError('x', file_path='/a', fpcalc_status=2, error_code='AUDIO_002',
+                                     details={'attempt': 3})
+
+        restored = self._round_trip(error)
+
+        self.assertIs(type(restored), AudioProcessingError)
+        self.assertEqual(restored.message, 'x')
+        self.assertEqual(restored.error_code, 'AUDIO_002')
+        self.assertEqual(restored.file_path, '/a')
+        self.assertEqual(restored.fpcalc_status, 2)
+        self.assertEqual(restored.details, {'attempt': 3, 'file_path': '/a', 'fpcalc_status': 2})
+        self.assertEqual(str(restored), str(error))
+        self.assertEqual(restored.get_user_message(), error.get_user_message())
+
+    def test_every_subclass_keeps_its_fields(self):
+        """Chaque sous-classe conserve ses champs de détail"""
+        errors = [
+            MusicFolderManagerError('base', error_code='GEN_001'),
+            ConfigurationError('conf', config_section='APIS', config_key='key'),
+            FileAccessError('fichier', file_path='/b', permission_issue=True),
+            MetadataError('meta', metadata_source='acoustid', confidence=0.4),
+            NetworkError('réseau', api_endpoint='/v2/lookup', status_code=429),
+            OrganizationError('orga', source_path='/src', destination_path='/dst'),
+        ]
+        for error in errors:
+            with self.subTest(type(error).__name__):
+                restored = self._round_trip(error)
+                self.assertEqual(restored.get_technical_details(), error.get_technical_details())
+
+
+class TestExceptionDetails(unittest.TestCase):
+
+    def test_details_include_subclass_fields(self):
+        """`details` fusionne les détails fournis et les champs de la sous-classe"""
+        error = NetworkError('timeout', api_endpoint='/v2/lookup', status_code=503,
+                             details={'retry': True})
+        self.assertEqual(error.details, {'retry': True, 'api_endpoint': '/v2/lookup', 'status_code': 503})
+
+    def test_default_error_code(self):
+        """Sans code explicite, l'erreur est GENERAL_ERROR"""
+        self.assertEqual(MusicFolderManagerError('x').error_code, 'GENERAL_ERROR')
+        self.assertEqual(str(MusicFolderManagerError('x')), '[GENERAL_ERROR] x')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le parcours des fichiers audio (utils.file_utils)
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from utils.file_utils import iter_audio_files, list_audio_files
+
+
+class TestIterAudioFiles(unittest.TestCase):
+
+    def setUp(self):
+        """Arborescence : deux fichiers audio à la racine, un dans un sous-dossier"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.root = Path(self.tmpdir.name)
+
+        (self.root / "album").mkdir()
+        self.files = {
+            self.root / "a.mp3": b"x" * 3,
+            self.root / "B.FLAC": b"x" * 5,
+            self.root / "album" / "c.ogg": b"x" * 7,
+            self.root / "notes.txt": b"texte",
+            self.root / ".mp3": b"cache",
+            self.root / "sans_extension": b"",
+        }
+        for path, content in self.files.items():
+            path.write_bytes(content)
+
+    def _found(self, **kwargs):
+        return sorted(list_audio_files(str(self.root), **kwargs))
+
+    def test_recursive_listing_with_sizes(self):
+        """Extensions insensibles à la casse, taille lue par stat"""
+        self.assertEqual(self._found(), sorted([
+            (str(self.root / "B.FLAC"), 5),
+            (str(self.root / "a.mp3"), 3),
+            (str(self.root / "album" / "c.ogg"), 7),
+        ]))
+
+    def test_non_recursive_listing(self):
+        """recursive=False ignore les sous-dossiers"""
+        self.assertEqual([path for path, _ in self._found(recursive=False)],
+                         sorted([str(self.root / "B.FLAC"), str(self.root / "a.mp3")]))
+
+    def test_hidden_name_is_not_an_extension(self):
+        """'.mp3' est un fichier caché sans extension, comme pour os.path.splitext"""
+        self.assertNotIn(str(self.root / ".mp3"), [path for path, _ in self._found()])
+
+    @unittest.skipIf(os.name == 'nt', "liens symboliques de dossiers")
+    def test_directory_symlinks_are_not_followed(self):
+        """Comme os.walk, un lien vers un dossier n'est pas parcouru (pas de boucle)"""
+        (self.root / "album" / "boucle").symlink_to(self.root, target_is_directory=True)
+        self.assertEqual(len(self._found()), 3)
+
+    def test_missing_root(self):
+        """Un dossier absent ou illisible ne produit rien"""
+        self.assertEqual(list(iter_audio_files(str(self.root / "absent"))), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
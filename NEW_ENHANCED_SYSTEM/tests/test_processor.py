@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour AudioFingerprinter (résolution en lot, cache AcoustID)
+"""
+
+import logging
+import sqlite3
+import unittest
+from unittest import mock
+
+try:
+    from fingerprint.processor import AudioFingerprinter, BatchResults
+    PROCESSOR_AVAILABLE = True
+except ImportError:
+    PROCESSOR_AVAILABLE = False
+
+MBID = '0b3a5c59-39c6-4dd4-9f5f-7a6d1c2f0e11'
+
+
+def make_fingerprinter():
+    """AudioFingerprinter sans configuration ni caches réels"""
+    fp = AudioFingerprinter.__new__(AudioFingerprinter)
+    fp.logger = logging.getLogger(__name__)
+    fp.max_retries = 1
+    fp.acoustid_cache = mock.Mock()
+    fp._prefetched_fingerprints = {}
+    return fp
+
+
+@unittest.skipUnless(PROCESSOR_AVAILABLE, "dépendances du processeur (pyacoustid...) absentes")
+class TestResolveMetadataBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.fp = make_fingerprinter()
+        self.fp._extract_existing_metadata = lambda path: (
+            {'musicbrainz_trackid': MBID} if path.startswith('tagged') else None
+        )
+        self.fp._cached_fingerprint = lambda path: path == 'cached.mp3'
+        self.fp._generate_fingerprints_batch = mock.Mock(
+            side_effect=lambda chunk: {path: (180.0, 'AQAA') for path in chunk}
+        )
+        self.fp._resolve_metadata_core = mock.Mock(
+            side_effect=lambda path, existing=None: {'status': 'success', 'track_id': path, 'confidence': 0.9}
+        )
+
+    def test_tagged_and_cached_files_skip_fpcalc(self):
+        """Seuls les fichiers sans MBID ni empreinte en cache passent par fpcalc"""
+        paths = ['tagged.flac', 'a.mp3', 'cached.mp3', 'b.mp3']
+
+        results = self.fp.resolve_metadata_batch(paths)
+
+        fingerprinted = [path for call in self.fp._generate_fingerprints_batch.call_args_list
+                         for path in call.args[0]]
+        self.assertEqual(sorted(fingerprinted), ['a.mp3', 'b.mp3'])
+        self.assertIsInstance(results, BatchResults)
+        self.assertEqual(list(results), paths)
+        self.assertEqual(self.fp._prefetched_fingerprints, {})
+
+    def test_tags_are_read_once(self):
+        """Les tags lus par le lot sont transmis au workflow de chaque fichier"""
+        self.fp.resolve_metadata_batch(['tagged.flac'])
+
+        self.fp._resolve_metadata_core.assert_called_once_with(
+            'tagged.flac', {'musicbrainz_trackid': MBID}
+        )
+
+
+
+@unittest.skipUnless(PROCESSOR_AVAILABLE, "dépendances du processeur (pyacoustid...) absentes")
+class TestSpectralReferences(unittest.TestCase):
+
+    def setUp(self):
+        self.fp = make_fingerprinter()
+        self.fp.acoustic_matcher = mock.Mock()
+        self.fp.spectral_matcher = mock.Mock()
+
+    def test_load_builds_raw_fingerprint_index(self):
+        """Les empreintes brutes des références sont indexées par identifiant"""
+        self.fp.acoustic_matcher.generate_raw_fingerprint.side_effect = (
+            lambda path: None if path == 'broken.flac' else [1, 2, 3]
+        )
+
+        self.fp.load_spectral_references({'a.flac': 'id-a', 'broken.flac': 'id-b'})
+
+        self.fp.acoustic_matcher.build_reference_index.assert_called_once_with({'id-a': [1, 2, 3]})
+
+    def test_fallback_uses_raw_match(self):
+        """Une empreinte brute alignée sur une référence court-circuite l'analyse spectrale"""
+        self.fp.spectral_reference_db = {'a.flac': 'id-a'}
+        self.fp.acoustic_matcher.find_best_match.return_value = ('id-a', 0.93, 4)
+
+        result = self.fp._spectral_fallback('inconnu.mp3')
+
+        self.assertEqual(result['track_id'], 'id-a')
+        self.assertEqual(result['similarity'], 0.93)
+        self.fp.spectral_matcher.is_match.assert_not_called()
+
+
+
+@unittest.skipUnless(PROCESSOR_AVAILABLE, "dépendances du processeur (pyacoustid...) absentes")
+class TestAcoustIDCacheErrors(unittest.TestCase):
+    """Un cache d'empreintes en échec ne masque ni le résultat ni l'erreur de l'API"""
+
+    def setUp(self):
+        self.fp = make_fingerprinter()
+        self.fp._generate_fingerprint = mock.Mock(return_value=(180.0, 'AQAA'))
+        self.fp.acoustid_cache.set.side_effect = sqlite3.OperationalError('database is locked')
+
+    def test_lookup_result_survives_cache_error(self):
+        self.fp._query_acoustid_api = mock.Mock(return_value={'track_id': 't1', 'confidence': 0.9})
+
+        result = self.fp._generate_and_query('a.mp3')
+
+        self.assertEqual(result, {'track_id': 't1', 'confidence': 0.9})
+        self.fp.acoustid_cache.set.assert_called_once_with('a.mp3', 180.0, 'AQAA', 't1')
+
+    def test_api_error_survives_cache_error(self):
+        self.fp._query_acoustid_api = mock.Mock(side_effect=RuntimeError('Erreur API AcoustID'))
+
+        with self.assertRaisesRegex(RuntimeError, 'Erreur API AcoustID'):
+            self.fp._generate_and_query('a.mp3')
+        self.fp.acoustid_cache.set.assert_called_once_with('a.mp3', 180.0, 'AQAA', None)
+
+    def test_cache_read_error_falls_back_to_fpcalc(self):
+        self.fp.acoustid_cache.get.side_effect = sqlite3.OperationalError('database is locked')
+        self.fp._generate_and_query = mock.Mock(return_value=None)
+
+        self.fp._get_acoustid_data('a.mp3')
+
+        self.fp._generate_and_query.assert_called_once_with('a.mp3')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
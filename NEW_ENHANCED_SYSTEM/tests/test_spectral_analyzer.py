@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'index des références de SpectralMatcher
+"""
+
+import unittest
+
+from core.spectral_analyzer import SpectralMatcher
+
+# Caractéristiques factices par chemin (évite ffmpeg/mutagen)
+FEATURES = {
+    'ref_calme.wav': {'energy': 1.0, 'spectral_centroid': 800.0, 'duration': 100.0},
+    'ref_forte.wav': {'energy': 5.0, 'spectral_centroid': 4000.0, 'duration': 300.0},
+    'inconnu.wav': {'energy': 5.0, 'spectral_centroid': 4000.0, 'duration': 300.0},
+}
+
+
+class TestSpectralIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.matcher = SpectralMatcher(threshold=0.5)
+        self.matcher._extract_features = FEATURES.get
+
+    def test_match_after_build_index(self):
+        reference_db = {'ref_calme.wav': 'calme', 'ref_forte.wav': 'forte'}
+        self.matcher.build_index(reference_db)
+
+        self.assertEqual(self.matcher.is_match(reference_db, 'inconnu.wav'), ('forte', 1.0))
+
+    def test_in_place_replacement_needs_rebuild(self):
+        """Une référence remplacée sur place est prise en compte au build_index suivant"""
+        reference_db = {'ref_calme.wav': 'ref'}
+        self.matcher.build_index(reference_db)
+        self.assertEqual(self.matcher.is_match(reference_db, 'inconnu.wav'), (None, 0))
+
+        del reference_db['ref_calme.wav']
+        reference_db['ref_forte.wav'] = 'ref'
+        self.matcher.build_index(reference_db)
+
+        self.assertEqual(self.matcher.is_match(reference_db, 'inconnu.wav'), ('ref', 1.0))
+
+    def test_index_built_on_first_use(self):
+        """Sans build_index préalable, l'index est construit au premier appel"""
+        reference_db = {'ref_forte.wav': 'forte'}
+        self.assertEqual(self.matcher.is_match(reference_db, 'inconnu.wav'), ('forte', 1.0))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'extraction rapide des caractéristiques spectrales
+"""
+
+import unittest
+
+import numpy as np
+
+from fingerprint import spectral_features
+from fingerprint.spectral_features import (
+    HOP_LENGTH,
+    N_FFT,
+    TOP_DB,
+    dct_matrix,
+    extract_spectral_features,
+    mel_filterbank,
+)
+
+try:
+    import librosa
+    LIBROSA_AVAILABLE = True
+except ImportError:
+    LIBROSA_AVAILABLE = False
+
+try:
+    import scipy.fft
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+SR = 22050
+
+
+class TestCachedMatrices(unittest.TestCase):
+    """Bancs de filtres mel et matrices DCT mis en cache par forme d'analyse"""
+
+    def test_matrices_are_cached_and_read_only(self):
+        fb = mel_filterbank(SR, N_FFT, 128)
+        self.assertIs(mel_filterbank(SR, N_FFT, 128), fb)
+        self.assertIsNot(mel_filterbank(44100, N_FFT, 128), fb)
+        self.assertFalse(fb.flags.writeable)
+        self.assertIs(dct_matrix(13, 128), dct_matrix(13, 128))
+        self.assertFalse(dct_matrix(13, 128).flags.writeable)
+
+    def test_dct_matrix_is_orthonormal(self):
+        """DCT-II orthonormée : D·Dᵀ = I"""
+        dct = dct_matrix(128, 128).astype(np.float64)
+        np.testing.assert_allclose(dct @ dct.T, np.eye(128), atol=1e-5)
+
+    def test_mel_filterbank_shape_and_peaks(self):
+        """Filtres positifs, non vides, de centres croissants"""
+        fb = mel_filterbank(SR, N_FFT, 40)
+        self.assertEqual(fb.shape, (40, N_FFT // 2 + 1))
+        self.assertTrue((fb >= 0).all())
+        self.assertTrue((fb.sum(axis=1) > 0).all())
+        self.assertTrue((np.diff(fb.argmax(axis=1)) >= 0).all())
+
+    @unittest.skipUnless(SCIPY_AVAILABLE, "scipy non installé")
+    def test_dct_matches_scipy(self):
+        reference = scipy.fft.dct(np.eye(128), type=2, norm='ortho', axis=0)[:13]
+        np.testing.assert_allclose(dct_matrix(13, 128), reference, atol=1e-6)
+
+    @unittest.skipUnless(LIBROSA_AVAILABLE, "librosa non installé")
+    def test_mel_filterbank_matches_librosa(self):
+        reference = librosa.filters.mel(sr=SR, n_fft=N_FFT, n_mels=128)
+        np.testing.assert_allclose(mel_filterbank(SR, N_FFT, 128), reference, rtol=1e-4, atol=1e-7)
+
+
+class TestExtractSpectralFeatures(unittest.TestCase):
+    """Valeurs de référence sur signaux synthétiques"""
+
+    def test_centroid_of_pure_tone(self):
+        """Le centroïde d'une sinusoïde pure est sa fréquence"""
+        t = np.arange(5 * SR) / SR
+        _, centroid, _ = extract_spectral_features(np.sin(2 * np.pi * 1000.0 * t), SR)
+        self.assertAlmostEqual(centroid, 1000.0, delta=25.0)
+
+    def test_tempo_of_click_track(self):
+        """Un clic toutes les 20 trames donne 60 * SR / (20 * HOP_LENGTH) BPM"""
+        period = 20 * HOP_LENGTH
+        y = np.zeros(30 * SR, dtype=np.float32)
+        rng = np.random.default_rng(0)
+        for start in range(0, len(y) - 256, period):
+            y[start:start + 256] = rng.standard_normal(256)
+
+        _, _, tempo = extract_spectral_features(y, SR)
+
+        self.assertAlmostEqual(tempo, 60.0 * SR / period, places=3)
+
+    def test_silence(self):
+        """Signal nul : centroïde et tempo nuls, pas d'erreur"""
+        mfcc, centroid, tempo = extract_spectral_features(np.zeros(SR, dtype=np.float32), SR)
+        self.assertEqual(mfcc.shape, (13,))
+        self.assertEqual((centroid, tempo), (0.0, 0.0))
+
+    def test_mfcc_match_direct_computation(self):
+        """MFCC moyens = DCT du log-mel (plancher TOP_DB) moyennée sur les trames"""
+        y = np.random.default_rng(1).standard_normal(3 * SR).astype(np.float32)
+        mfcc, _, _ = extract_spectral_features(y, SR)
+
+        power = spectral_features._power_spectrogram(y, N_FFT, HOP_LENGTH).astype(np.float64)
+        log_mel = 10.0 * np.log10(np.maximum(power @ mel_filterbank(SR, N_FFT, 128).T, 1e-10))
+        log_mel = np.maximum(log_mel, log_mel.max() - TOP_DB)
+        expected = (log_mel @ dct_matrix(13, 128).T).mean(axis=0)
+
+        self.assertEqual(mfcc.shape, (13,))
+        np.testing.assert_allclose(mfcc, expected, rtol=1e-3, atol=1e-2)
+
+    @unittest.skipUnless(LIBROSA_AVAILABLE, "librosa non installé")
+    def test_centroid_matches_librosa(self):
+        y = np.random.default_rng(2).standard_normal(3 * SR).astype(np.float32)
+        _, centroid, _ = extract_spectral_features(y, SR)
+        reference = librosa.feature.spectral_centroid(y=y, sr=SR, center=False).mean()
+        self.assertAlmostEqual(centroid, reference, delta=1e-3 * reference)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
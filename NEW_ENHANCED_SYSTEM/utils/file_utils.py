@@ -6,21 +6,56 @@ def get_file_fingerprint(file_path):
     with open(file_path, "rb") as f:
         return hashlib.md5(f.read()).hexdigest()
 
+# Extensions audio supportées (liste étendue)
+AUDIO_EXTENSIONS = frozenset({
+    # Formats compressés
+    '.mp3', '.aac', '.m4a', '.ogg', '.oga', '.opus', '.wma',
+    # Formats non compressés
+    '.wav', '.flac', '.aiff', '.aif', '.au', '.snd',
+    # Formats mobiles et streaming
+    '.3gp', '.3g2', '.amr', '.awb',
+    # Formats spécialisés
+    '.dsd', '.dsf', '.dff', '.ape', '.wv', '.tta', '.mka',
+    # Formats rares mais supportés par certains outils
+    '.ra', '.rm', '.ac3', '.dts', '.mpc', '.mp+', '.mpp'
+})
+
 def is_audio_file(file_path):
     """Vérifie si un fichier est un fichier audio supporté"""
-    # Extensions audio supportées (liste étendue)
-    extensions = [
-        # Formats compressés
-        '.mp3', '.aac', '.m4a', '.ogg', '.oga', '.opus', '.wma',
-        # Formats non compressés
-        '.wav', '.flac', '.aiff', '.aif', '.au', '.snd',
-        # Formats mobiles et streaming
-        '.3gp', '.3g2', '.amr', '.awb',
-        # Formats spécialisés
-        '.dsd', '.dsf', '.dff', '.ape', '.wv', '.tta', '.mka',
-        # Formats rares mais supportés par certains outils
-        '.ra', '.rm', '.ac3', '.dts', '.mpc', '.mp+', '.mpp'
-    ]
-    
     file_ext = os.path.splitext(file_path)[1].lower()
-    return file_ext in extensions
+    return file_ext in AUDIO_EXTENSIONS
+
+def iter_audio_files(root, recursive=True):
+    """Parcourt `root` et produit (chemin, taille) pour chaque fichier audio
+    
+    Avec recursive=False, seuls les fichiers directement dans `root` sont lus.
+    os.scandir donne le type de chaque entrée sans stat supplémentaire ; la
+    taille vient d'un seul stat par fichier audio. Comme os.walk, les liens
+    vers des dossiers ne sont pas suivis ; les dossiers illisibles sont ignorés.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            # Extension lue directement dans le nom, sans splitext
+                            name = entry.name
+                            dot = name.rfind('.')
+                            if dot > 0 and name[dot:].lower() in AUDIO_EXTENSIONS:
+                                yield entry.path, entry.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+def list_audio_files(root, recursive=True):
+    """Liste (chemin, taille) des fichiers audio de `root` (voir iter_audio_files)
+    
+    Fonction de module, donc sérialisable : sert de tâche aux processus de scan.
+    """
+    return list(iter_audio_files(root, recursive))
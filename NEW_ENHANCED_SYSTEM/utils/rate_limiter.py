@@ -0,0 +1,21 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """Limiteur global partagé par tous les threads : un appel toutes les `interval` secondes"""
+    
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+    
+    def wait(self):
+        """Bloque jusqu'à ce que le prochain appel soit autorisé"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_allowed - now
+            if delay > 0:
+                time.sleep(delay)
+                now += delay
+            self._next_allowed = now + self.interval